@@ -0,0 +1,159 @@
+# Content-addressed embedding cache
+# The same module is kept in LangChain_RAG_Chatbot and LangChain_RAG_Memory_Chatbot; change both copies together.
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# Keys looked up per SQLite query (below the default limit of bound parameters)
+LOOKUP_BATCH_SIZE = 500
+# Vectors not used for this long expire
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+# Once the stored vectors exceed this size, the least recently used ones are evicted
+CACHE_MAX_BYTES = 512 * 1024**2
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes a chunk before hashing (Unicode NFC, collapsed whitespace), so the same text
+    extracted with different spacing maps to the same cache entry.
+    """
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(text: str, model_name: str) -> str:
+    """
+    Returns the cache key of a chunk: SHA-256 of the model name and the normalized text.
+    """
+    return hashlib.sha256(f"{model_name}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite store of embedding vectors (float32 blobs) keyed by cache_key.
+    The connection is shared between threads and guarded by a lock.
+    Vectors not used for ttl_seconds expire; once the stored vectors exceed max_bytes,
+    the least recently used ones are evicted.
+    """
+    def __init__(self, db_path: str, ttl_seconds: int = CACHE_TTL_SECONDS, max_bytes: int = CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")]
+        if columns and "last_used" not in columns:
+            # Cache written before entries were timestamped: start over
+            self._conn.execute("DROP TABLE embeddings")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )""")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Returns the cached vectors of the given keys (missing or expired keys are left out)
+        and marks them as used.
+        """
+        found = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + LOOKUP_BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))}) AND last_used >= ?",
+                    [*batch, now - self.ttl_seconds])
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+            self._conn.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, key) for key in found])
+            self._conn.commit()
+        return found
+
+    def put_many(self, items: dict):
+        """
+        Stores vectors by key as float32, then evicts entries beyond the size budget.
+        """
+        now = time.time()
+        blobs = {key: np.asarray(vector, dtype=np.float32).tobytes() for key, vector in items.items()}
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector, size, last_used) VALUES (?, ?, ?, ?)",
+                                   [(key, blob, len(blob), now) for key, blob in blobs.items()])
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        self._conn.execute("DELETE FROM embeddings WHERE last_used < ?", (time.time() - self.ttl_seconds,))
+        excess = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM embeddings ORDER BY last_used"):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings that only compute the vectors of chunks missing from the cache.
+    Re-uploading the same or an overlapping document reuses the stored vectors.
+    Queries are not cached.
+    """
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model_name: str):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def embed_documents(self, texts: list) -> list:
+        keys = [cache_key(text, self.model_name) for text in texts]
+        vectors = self.cache.get_many(list(set(keys)))
+
+        # Embed every missing chunk once, even if it appears several times in texts
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+        if missing:
+            computed = dict(zip(missing, self.embeddings.embed_documents(list(missing.values()))))
+            self.cache.put_many(computed)
+            vectors.update(computed)
+
+        with self._lock:
+            self._hits += len(texts) - len(missing)
+            self._misses += len(missing)
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> list:
+        return self.embeddings.embed_query(text)
+
+    def stats(self) -> dict:
+        """
+        Returns the cache hits and misses of the embedded chunks and the number of cached vectors.
+        """
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        return {"hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                "cached_vectors": len(self.cache)}
@@ -1,6 +1,8 @@
 # Importing the required libraries
 
 import os
+import json
+import hashlib
 from dotenv import load_dotenv
 
 from langchain_huggingface import HuggingFaceEmbeddings
@@ -21,6 +23,8 @@ from langchain import globals
 
 from pydantic import BaseModel
 
+from embedding_cache import CachedEmbeddings, EmbeddingCache
+
 globals.set_verbose(True)  # To turn on verbosity
 
 # Load the environment variables
@@ -35,21 +39,111 @@ groq_api_key=os.getenv("GROQ_API_KEY")
 os.environ['HF_TOKEN']=os.getenv("HF_TOKEN")
 os.environ["USER_AGENT"] = "MyLangChainApp/1.0"
 
-## Document Loader
-loader=PyPDFLoader('attention.pdf')
-docs=loader.load()
-
-
-## Text Splitter
-text_splitter=RecursiveCharacterTextSplitter(chunk_size=500,chunk_overlap=50)
-final_documents=text_splitter.split_documents(docs)
+## Persistent Vector Index
+# Chunks are embedded once and stored on disk. A manifest records the hash and chunk ids of every
+# source PDF, so a restart only opens the index, and only new or changed PDFs are re-embedded.
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.getenv("RAG_SOURCE_DIR", BASE_DIR)  # folder with the PDFs to index
+INDEX_DIR = os.getenv("RAG_INDEX_DIR", os.path.join(BASE_DIR, "chroma_index"))
+MANIFEST_PATH = os.path.join(INDEX_DIR, "manifest.json")
+# Vectors by chunk content, so edited PDFs or a rebuilt index only embed unseen chunks
+EMBEDDING_CACHE_PATH = os.getenv("RAG_EMBEDDING_CACHE", os.path.join(BASE_DIR, "embedding_cache.sqlite"))
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 50
+
+
+def file_sha256(file_path, block_size=1024 * 1024):
+    """
+    Returns the SHA-256 of a file, read in blocks.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(settings):
+    """
+    Returns the manifest of the index: {"settings": ..., "files": {file name: {"sha256", "chunk_ids"}}}.
+    An index built with other embedding or splitter settings is treated as empty.
+    """
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("settings") == settings:
+            return manifest
+    return {"settings": settings, "files": {}}
+
+
+def save_manifest(manifest):
+    """
+    Writes the manifest atomically (temporary file, then rename).
+    """
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def sync_vector_index(vectorstore, source_dir):
+    """
+    Brings the persistent index in line with the PDFs of source_dir:
+    new or changed PDFs are split and embedded, chunks of changed or removed PDFs are deleted.
+    Unchanged PDFs are not read at all.
+    """
+    settings = {"embedding_model": EMBEDDING_MODEL, "chunk_size": CHUNK_SIZE, "chunk_overlap": CHUNK_OVERLAP}
+    manifest = load_manifest(settings)
+    if not manifest["files"]:
+        # New index, or settings changed: drop whatever the collection holds
+        existing_ids = vectorstore.get(include=[])["ids"]
+        if existing_ids:
+            vectorstore.delete(ids=existing_ids)
+
+    text_splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    pdf_files = sorted(name for name in os.listdir(source_dir) if name.lower().endswith(".pdf"))
+
+    for name in pdf_files:
+        file_hash = file_sha256(os.path.join(source_dir, name))
+        entry = manifest["files"].get(name)
+        if entry is not None and entry["sha256"] == file_hash:
+            continue
+
+        if entry is not None and entry["chunk_ids"]:
+            vectorstore.delete(ids=entry["chunk_ids"])
+
+        docs = PyPDFLoader(os.path.join(source_dir, name)).load()
+        chunks = text_splitter.split_documents(docs)
+        # Ids are unique per file name and content, so renamed or duplicated PDFs never share chunk ids
+        id_prefix = hashlib.sha256(f"{name}\0{file_hash}".encode("utf-8")).hexdigest()[:16]
+        chunk_ids = [f"{id_prefix}-{i}" for i in range(len(chunks))]
+        if chunks:
+            vectorstore.add_documents(chunks, ids=chunk_ids)
+        manifest["files"][name] = {"sha256": file_hash, "chunk_ids": chunk_ids}
+        save_manifest(manifest)
+        print(f"Indexed {name}: {len(chunks)} chunks")
+
+    for name in [name for name in manifest["files"] if name not in pdf_files]:
+        if manifest["files"][name]["chunk_ids"]:
+            vectorstore.delete(ids=manifest["files"][name]["chunk_ids"])
+        del manifest["files"][name]
+        print(f"Removed {name} from the index")
+
+    save_manifest(manifest)
 
 
 ## Embeddings
-embeddings=HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+embeddings=CachedEmbeddings(HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL),
+                            EmbeddingCache(EMBEDDING_CACHE_PATH),
+                            EMBEDDING_MODEL)
 
 ## Vector Store
-vectorstore=Chroma.from_documents(documents=final_documents,embedding=embeddings)
+os.makedirs(INDEX_DIR, exist_ok=True)
+vectorstore=Chroma(collection_name="rag_documents",
+                   embedding_function=embeddings,
+                   persist_directory=INDEX_DIR)
+sync_vector_index(vectorstore, SOURCE_DIR)
 retriever=vectorstore.as_retriever()
 
 ## LLM Model Setup
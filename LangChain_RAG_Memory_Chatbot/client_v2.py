@@ -1,15 +1,35 @@
+import time
+from uuid import uuid4
+
 import requests
 import streamlit as st
 
 
-def get_groq_response(input_text):
-    json_body={"input": input_text}
+def get_groq_response(input_text, collection_id, session_id):
+    json_body={"input": input_text, "collection_id": collection_id, "session_id": session_id}
     headers = {'Content-Type': 'application/json'}  # Add Content-Type header
     response=requests.post("http://localhost:8000/invoke", json=json_body, headers=headers)
     # print(response.json())
 
     return response.json()
 
+
+def wait_for_job(job_id, poll_seconds=1.0):
+    """
+    Polls the status of an ingestion job and shows its progress until it finishes
+    (completed, superseded by a later upload of the same file, or failed).
+    """
+    progress = st.empty()
+    while True:
+        response = requests.get(f"http://localhost:8000/jobs/{job_id}")
+        response.raise_for_status()
+        job = response.json()
+        if job["status"] in ("completed", "superseded", "failed"):
+            progress.empty()
+            return job
+        progress.info(f"Processing document ({job['status']}): {job['pages']} pages, {job['chunks']} chunks indexed...")
+        time.sleep(poll_seconds)
+
 ## Streamlit app
 st.title("Q&A Chatbot")
 st.write("This chatbot uses the LangChain RAG model to answer questions related to the document users upload.")
@@ -19,6 +39,11 @@ if "file_processed" not in st.session_state:
     st.session_state.file_processed = False
 if "question" not in st.session_state:
     st.session_state.question = ""
+# Documents uploaded in this browser session form one collection, queried in this chat session
+if "collection_id" not in st.session_state:
+    st.session_state.collection_id = None
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid4().hex
 
 # Upload a document
 uploaded_file = st.file_uploader("Upload a document", type="pdf")
@@ -27,17 +52,27 @@ if uploaded_file is not None:
     if st.button("Process Document"):
         st.info("Processing document...")
         url = "http://localhost:8000/process_pdf/"
-        files = {"file": uploaded_file.getvalue()}
+        files = {"file": (uploaded_file.name, uploaded_file.getvalue(), "application/pdf")}
 
         try:
-            response = requests.post(url, files=files)
+            data = {"collection_id": st.session_state.collection_id} if st.session_state.collection_id else {}
+            response = requests.post(url, files=files, data=data)
             response.raise_for_status()
             result = response.json()
-            st.success(result["message"])
-            # Indicate file has been processed
-            st.session_state.file_processed = True  
-            # clear the question, after a new file has been processed.
-            st.session_state.question = "" 
+            st.session_state.collection_id = result["collection_id"]
+            # The server processes the document in the background; wait for its job to finish
+            job = wait_for_job(result["job_id"])
+            if job["status"] == "completed":
+                st.success("PDF processed successfully!")
+                # Indicate file has been processed
+                st.session_state.file_processed = True  
+                # clear the question, after a new file has been processed.
+                st.session_state.question = "" 
+            elif job["status"] == "superseded":
+                st.warning("A later upload of this document replaced it.")
+            else:
+                st.error(f"Error processing document: {job['error']}")
+                st.session_state.file_processed = False
 
         except requests.exceptions.RequestException as e:
             st.error(f"Error processing document: {e}")
@@ -55,7 +90,8 @@ if input_text and st.button("Get Response"):
     else:
         st.session_state.question = input_text #update the question in session state.
         with st.spinner("Generating answer..."):
-            answer_data = get_groq_response(st.session_state.question )
+            answer_data = get_groq_response(st.session_state.question, st.session_state.collection_id,
+                                            st.session_state.session_id)
 
         st.subheader("Answer:")
         st.write(answer_data["answer"])
@@ -0,0 +1,160 @@
+# Embedding service and PDF ingestion pipeline
+
+import functools
+import queue
+import threading
+import time
+from uuid import uuid4
+
+from langchain_core.embeddings import Embeddings
+from langchain_community.document_loaders import PyPDFLoader
+from sentence_transformers import SentenceTransformer
+
+
+class EmbeddingService(Embeddings):
+    """
+    Sentence-transformer embeddings loaded once per process and shared by every request.
+
+    Texts are sorted by token length and encoded in batches of similar length, which keeps the
+    padding in each batch small. The model uses every CPU core through torch's intra-op threads.
+    The service counts the chunks it embeds and the time spent, to report the throughput (chunks/sec).
+    """
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name)
+        self._lock = threading.Lock()
+        self._chunks = 0
+        self._seconds = 0.0
+
+    def _token_lengths(self, texts: list) -> list:
+        return [len(ids) for ids in self.model.tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+    def _encode(self, texts: list) -> list:
+        """
+        Encodes texts in length-sorted batches and returns the vectors in the original order.
+        """
+        order = sorted(range(len(texts)), key=self._token_lengths(texts).__getitem__)
+        vectors = [None] * len(texts)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            encoded = self.model.encode([texts[i] for i in batch], batch_size=len(batch), convert_to_numpy=True)
+            for i, vector in zip(batch, encoded):
+                vectors[i] = vector.tolist()
+        return vectors
+
+    def embed_documents(self, texts: list) -> list:
+        if not texts:
+            return []
+        start = time.perf_counter()
+        vectors = self._encode(list(texts))
+        with self._lock:
+            self._chunks += len(texts)
+            self._seconds += time.perf_counter() - start
+        return vectors
+
+    def embed_query(self, text: str) -> list:
+        return self._encode([text])[0]
+
+    def stats(self) -> dict:
+        """
+        Returns the chunks embedded so far, the time spent and the throughput in chunks/sec.
+        """
+        with self._lock:
+            return {"model": self.model_name,
+                    "chunks": self._chunks,
+                    "seconds": round(self._seconds, 3),
+                    "chunks_per_second": round(self._chunks / self._seconds, 1) if self._seconds else 0.0}
+
+
+@functools.lru_cache(maxsize=None)
+def get_embedding_service(model_name: str = "all-MiniLM-L6-v2") -> EmbeddingService:
+    """
+    Returns the process-wide embedding service of a model (the model is loaded on first use).
+    """
+    return EmbeddingService(model_name)
+
+
+def ingest_pdf(file_path: str, vectorstore, text_splitter, batch_size: int = 256, queue_size: int = 8,
+               on_progress=None, metadata: dict = None) -> dict:
+    """
+    Parses, splits, embeds and stores a PDF in a producer/consumer pipeline:
+    a thread parses and splits the pages while the caller embeds and writes the previous chunks,
+    so embedding overlaps with PDF parsing.
+
+    Args:
+        file_path (str): Path of the PDF file
+        vectorstore: Vector store whose embedding function embeds the chunks
+        text_splitter: Splitter applied page by page
+        batch_size (int): Chunks embedded and written per vector store call
+        queue_size (int): Pages parsed ahead of the embedding
+        on_progress: Optional function called with the pages parsed and the chunks stored after every batch
+        metadata (dict): Optional metadata added to every chunk (e.g. the collection and document ids)
+
+    Returns:
+        dict: ids of the stored chunks, pages, chunks, seconds and chunks_per_second
+    """
+    pages = queue.Queue(maxsize=queue_size)
+    done = object()
+    stop = threading.Event()
+    errors = []
+
+    def put(item):
+        # Waits for room in the queue, unless the consumer has stopped
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for page in PyPDFLoader(file_path).lazy_load():
+                chunks = text_splitter.split_documents([page])
+                for chunk in chunks:
+                    chunk.metadata.update(metadata or {})
+                if not put(chunks):
+                    return
+        except Exception as e:
+            errors.append(e)
+        finally:
+            put(done)
+
+    start = time.perf_counter()
+    producer = threading.Thread(target=produce, name="pdf-parser", daemon=True)
+    producer.start()
+
+    ids, batch, page_count = [], [], 0
+
+    def flush():
+        ids.extend(vectorstore.add_documents(batch, ids=[str(uuid4()) for _ in batch]))
+        batch.clear()
+        if on_progress is not None:
+            on_progress(page_count, len(ids))
+
+    try:
+        while True:
+            chunks = pages.get()
+            if chunks is done:
+                break
+            page_count += 1
+            batch.extend(chunks)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    finally:
+        # If embedding or writing failed, the producer stops at its next page instead of blocking on the full queue
+        stop.set()
+        producer.join()
+    if errors:
+        raise errors[0]
+
+    seconds = time.perf_counter() - start
+    return {"ids": ids,
+            "pages": page_count,
+            "chunks": len(ids),
+            "seconds": round(seconds, 3),
+            "chunks_per_second": round(len(ids) / seconds, 1) if seconds else 0.0}
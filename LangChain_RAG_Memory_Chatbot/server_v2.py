@@ -1,10 +1,14 @@
 # Importing the required libraries
 
+import itertools
 import os
 import shutil
+import threading
+import time
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_chroma import Chroma
 from langchain_groq import ChatGroq
 
@@ -24,19 +28,24 @@ from langchain_core.prompts import MessagesPlaceholder
 from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.runnables.history import RunnableWithMessageHistory
+from langchain_core.runnables import ConfigurableFieldSpec
 from langchain_core.messages import HumanMessage, AIMessage
 
 # Requirements for FastAPI backend
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 from langchain import globals
 
 # Requirement for Data Models
 from pydantic import BaseModel
 
-# Requirement for managing Chroma DB documents
+# Requirement for ingestion job ids
 from uuid import uuid4
 
+# Requirement for batched embeddings and the PDF ingestion pipeline
+from embedding_service import get_embedding_service, ingest_pdf
+from embedding_cache import CachedEmbeddings, EmbeddingCache
+
 globals.set_verbose(True)  # To turn on verbosity
 
 # Load the environment variables
@@ -62,6 +71,15 @@ llm=ChatGroq(model="Gemma2-9b-It",groq_api_key=groq_api_key)
 llm_parsed = llm | StrOutputParser()
 
 
+## Embedding Service
+# The sentence-transformer is loaded once per process, not on every upload
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+embedding_service = get_embedding_service(EMBEDDING_MODEL)
+# Vectors of chunks already embedded are reused across uploads and restarts
+EMBEDDING_CACHE_PATH = os.getenv("RAG_EMBEDDING_CACHE", os.path.join(temp_dir, "embedding_cache.sqlite"))
+embeddings = CachedEmbeddings(embedding_service, EmbeddingCache(EMBEDDING_CACHE_PATH), EMBEDDING_MODEL)
+
+
 ## Prompt Template
 
 contextualize_q_system_prompt = (
@@ -79,93 +97,161 @@ contextualize_q_prompt = ChatPromptTemplate.from_messages([
 ])
 
 
-# qa_prompt = ChatPromptTemplate.from_messages([
-#     ("system", "You are a helpful AI assistant. Use the following context to answer the user's question."),
-#     ("system", "Context: {context}"),
-#     MessagesPlaceholder(variable_name="chat_history"),
-#     ("human", "{input}")
-# ])
+qa_prompt = ChatPromptTemplate.from_messages([
+    ("system", "You are a helpful AI assistant. Use the following context to answer the user's question."),
+    ("system", "Context: {context}"),
+    MessagesPlaceholder(variable_name="chat_history"),
+    ("human", "{input}")
+])
 
-vectorstore=None # variable to hold the vector store.
-sessionstore = {} # variable to hold the user session data
-prev_ids  = [] # variable to hold the previous ids.
+## Multi-tenant Vector Store
+# Every uploaded PDF is a document of a collection (a document or a workspace of documents).
+# All chunks live in one vector store, tagged with their collection_id and document_id metadata;
+# retrieval is filtered to the active documents of the queried collection, so users can query
+# different collections concurrently and an upload never touches other collections or their sessions.
+vectorstore = Chroma(collection_name="rag_documents", embedding_function=embeddings)
+collections = {} # collection id -> active document id and upload sequence of each file name, and the rag chain over them
+sessionstore = {} # (collection id, session id) -> chat history
+last_ingestion = {} # statistics of the last processed PDF
+swap_lock = threading.Lock() # guards collections and the swap of a new document version
+
+
+## Background Ingestion
+# PDFs are ingested by a worker pool, so the event loop keeps serving /invoke during an ingestion
+INGESTION_WORKERS = int(os.getenv("RAG_INGESTION_WORKERS", "2"))
+ingestion_executor = ThreadPoolExecutor(max_workers=INGESTION_WORKERS, thread_name_prefix="ingestion")
+jobs = {} # job id -> status and progress of the ingestion job
+jobs_lock = threading.Lock()
+upload_sequence = itertools.count() # submission order of the uploads
+DOCUMENT_RETIRE_SECONDS = 60 # chunks of a replaced document are deleted after this delay
+JOB_TTL_SECONDS = int(os.getenv("RAG_JOB_TTL_SECONDS", "3600")) # finished jobs are forgotten after this delay
+
+
+def update_job(job_id:str, **fields):
+    """
+    Update the status fields of an ingestion job.
+    """
+    with jobs_lock:
+        jobs[job_id].update(fields)
 
 
-# Function to get session history
-def get_session_history(user_id:str) -> BaseChatMessageHistory:
+def prune_jobs():
     """
-    Get the session history for the user ID.
+    Forget the jobs that finished more than JOB_TTL_SECONDS ago. Must be called with jobs_lock held.
     """
-    if user_id not in sessionstore:
-        sessionstore[user_id] = ChatMessageHistory()
-    return sessionstore[user_id]
+    expired_before = time.time() - JOB_TTL_SECONDS
+    for job_id in [job_id for job_id, job in jobs.items() if job.get("finished_at", expired_before) < expired_before]:
+        del jobs[job_id]
 
 
-# Function to process the PDF file
-def process_pdf(file_path:str):
+# Function to get session history
+def get_session_history(collection_id:str, session_id:str) -> BaseChatMessageHistory:
     """
-    Process the PDF file and create a retrieval-augmented generation (RAG) chain."
+    Get the session history of a user session in a collection.
     """
-    try:
-        # Reset the session store when a new PDF is processed
-        # Ideally this should be done in a more secure way, like using a database or a cache store
-        # but for simplicity, we are using a dictionary here.
-        global sessionstore
-        if len(sessionstore) > 0:
-            sessionstore = {} # variable to hold the user session data
+    key = (collection_id, session_id)
+    if key not in sessionstore:
+        sessionstore[key] = ChatMessageHistory()
+    return sessionstore[key]
+
 
-        # Initialize the user ID for the session
-        user_id = "default" 
+def build_rag_chain(document_ids:list):
+    """
+    Create a retrieval-augmented generation (RAG) chain that only retrieves chunks of the given documents.
+    """
+    retriever=vectorstore.as_retriever(search_kwargs={"filter": {"document_id": {"$in": document_ids}}})
+
+    # Create the retrieval chain
+    history_aware_retriever = create_history_aware_retriever(llm_parsed, retriever, contextualize_q_prompt)
+    question_answer_chain = create_stuff_documents_chain(llm, qa_prompt)
+    rag_chain = create_retrieval_chain(history_aware_retriever, question_answer_chain)
+
+    return RunnableWithMessageHistory(
+        rag_chain,
+        get_session_history,
+        input_messages_key="input",
+        history_messages_key="chat_history",
+        output_messages_key="answer",
+        history_factory_config=[
+            ConfigurableFieldSpec(id="collection_id", annotation=str, name="Collection ID",
+                                  description="Collection of documents queried.", is_shared=True),
+            ConfigurableFieldSpec(id="session_id", annotation=str, name="Session ID",
+                                  description="Chat session in the collection.", default="default", is_shared=True),
+        ]
+    )
 
-        # document loader
-        loader = PyPDFLoader(file_path)
-        documents = loader.load()
 
+# Function to process the PDF file
+def process_pdf(file_path:str, collection_id:str, file_name:str, document_id:str, sequence:int, on_progress=None) -> dict:
+    """
+    Process the PDF file as a document of a collection and update the collection's RAG chain.
+    The chunks are indexed under a new document id while queries keep using the collection's current
+    documents; the new document is then swapped in, replacing a previous upload of the same file name.
+    Uploads of a file name are swapped in by submission order (sequence): a document whose later
+    upload is already active is discarded and its result is marked as superseded.
+    """
+    try:
         # text splitter
         text_splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
-        final_documents = text_splitter.split_documents(documents)
-
-        # Get the uuids for the documents
-        curr_ids = [str(uuid4()) for _ in range(len(final_documents))]
-        # print(f"UUIDs: {curr_ids}") #Debug
-
-        # embeddings
-        embeddings=HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
-
-        ## Vector Store
-        global prev_ids
-        global vectorstore
-        if vectorstore is not None:
-            vectorstore.delete(ids = prev_ids)  # Remove the previous documents from the vector store
-        
-        vectorstore=Chroma.from_documents(documents=final_documents,
-                                          embedding=embeddings, 
-                                          ids = curr_ids
-                                          )
-        retriever=vectorstore.as_retriever()
-
-        # Create the retrieval chain
-        history_aware_retriever = create_history_aware_retriever(llm_parsed, retriever, contextualize_q_prompt)
-        question_answer_chain = create_stuff_documents_chain(llm, qa_prompt)
-        rag_chain = create_retrieval_chain(history_aware_retriever, question_answer_chain)
 
-        prev_ids = curr_ids # Store the current ids for the next call.
-
-        conversation_rag_chain = RunnableWithMessageHistory(
-            rag_chain,
-            get_session_history,
-            input_messages_key="input",
-            history_messages_key="chat_history",
-            output_messages_key="answer"
-        )
-
-        return conversation_rag_chain
+        # Parse the pages in a background thread while the chunks are embedded in length-sorted batches
+        metadata = {"collection_id": collection_id, "document_id": document_id, "file_name": file_name}
+        ingestion = ingest_pdf(file_path, vectorstore, text_splitter, on_progress=on_progress, metadata=metadata)
+        ingestion.pop("ids")
+        print(f"Ingested {ingestion['chunks']} chunks at {ingestion['chunks_per_second']} chunks/sec") # Debug
 
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
-
-
-rag_chain_instance = None # Global variable to hold the rag chain.
+        # Drop the chunks already stored; they were never visible to queries
+        vectorstore.delete(where={"document_id": document_id})
+        raise RuntimeError(f"Error processing PDF: {str(e)}")
+
+    # Swap in the new document version and the collection's chain
+    global last_ingestion
+    with swap_lock:
+        collection = collections.get(collection_id, {})
+        sequences = dict(collection.get("sequences", {}))
+        superseded = sequences.get(file_name, -1) > sequence
+        if not superseded:
+            documents = dict(collection.get("documents", {}))
+            old_document_id = documents.get(file_name)
+            documents[file_name] = document_id
+            sequences[file_name] = sequence
+            collections[collection_id] = {"documents": documents,
+                                          "sequences": sequences,
+                                          "chain": build_rag_chain(list(documents.values()))}
+        last_ingestion = ingestion
+
+    ingestion["superseded"] = superseded
+    if superseded:
+        # A later upload of the same file finished first; this version was never visible to queries
+        vectorstore.delete(where={"document_id": document_id})
+        return ingestion
+
+    # Queries started before the swap may still retrieve the previous version,
+    # so its chunks are deleted after a grace period
+    if old_document_id is not None:
+        threading.Timer(DOCUMENT_RETIRE_SECONDS, vectorstore.delete,
+                        kwargs={"where": {"document_id": old_document_id}}).start()
+
+    return ingestion
+
+
+def run_ingestion_job(job_id:str, file_path:str, collection_id:str, file_name:str, sequence:int):
+    """
+    Run process_pdf for a job in the worker pool and record its progress and outcome.
+    """
+    update_job(job_id, status="running", started_at=time.time())
+    try:
+        ingestion = process_pdf(file_path, collection_id, file_name, document_id=job_id, sequence=sequence,
+                                on_progress=lambda pages, chunks: update_job(job_id, pages=pages, chunks=chunks))
+        update_job(job_id, status="superseded" if ingestion["superseded"] else "completed",
+                   finished_at=time.time(), ingestion=ingestion)
+    except Exception as e:
+        # Debug
+        print(f"Error in ingestion job {job_id}: {e}")
+        update_job(job_id, status="failed", finished_at=time.time(), error=str(e))
+    finally:
+        os.remove(file_path)
 
 
 # Create the FastAPI app
@@ -175,54 +261,94 @@ app = FastAPI(title="Langchain Server",
 
 
 @app.post("/process_pdf")
-async def process_pdf_endpoint(file: UploadFile = File(...)):
+async def process_pdf_endpoint(file: UploadFile = File(...), collection_id: Optional[str] = Form(None)):
     """
-    Endpoint to process the uploaded PDF file and create a retrieval-augmented generation (RAG) chain.
+    Endpoint to add the uploaded PDF file to a collection and update its retrieval-augmented generation (RAG) chain.
+    Without a collection id, the PDF gets a new collection.
     """
     try:
-        # Save the uploaded file to the temp directory
-        file_path = os.path.join(temp_dir, file.filename)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # Save the uploaded file to the temp directory (prefixed by the job id, so concurrent uploads do not collide)
+        job_id = uuid4().hex
+        collection_id = collection_id or uuid4().hex
+        file_path = os.path.join(temp_dir, f"{job_id}_{os.path.basename(file.filename)}")
         with open(file_path, "wb") as f:
             f.write(await file.read())
 
-        # Process the PDF and create the RAG chain
-        global rag_chain_instance
-        if rag_chain_instance is not None:
-            # Reset the previous instance if it exists
-            rag_chain_instance = None  
-        rag_chain_instance = process_pdf(file_path)
+        # Process the PDF and update the RAG chain in the worker pool.
+        # Queries keep using the collection's previous documents until the new one is swapped in.
+        with jobs_lock:
+            prune_jobs()
+            sequence = next(upload_sequence)
+            jobs[job_id] = {"job_id": job_id, "collection_id": collection_id, "file_name": file.filename,
+                            "status": "queued", "pages": 0, "chunks": 0, "submitted_at": time.time()}
+        ingestion_executor.submit(run_ingestion_job, job_id, file_path, collection_id, file.filename, sequence)
 
-        return JSONResponse(content={"message": "PDF processed successfully!"})
+        return JSONResponse(status_code=202, content={"message": "PDF accepted for processing.",
+                                                      "job_id": job_id, "collection_id": collection_id})
 
     except Exception as e:
         # Debug
         print(f"Error in /process_pdf/: {e}") 
         # Raise an HTTP exception.
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}") 
-    
+
+
+@app.get("/collections/{collection_id}")
+async def collection_documents(collection_id: str):
+    """
+    Endpoint to list the documents of a collection.
+    """
+    with swap_lock:
+        collection = collections.get(collection_id)
+    if collection is None:
+        raise HTTPException(status_code=404, detail=f"Unknown collection: {collection_id}")
+    return JSONResponse(content={"collection_id": collection_id,
+                                 "documents": [{"file_name": name, "document_id": document_id}
+                                               for name, document_id in collection["documents"].items()]})
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    """
+    Endpoint to get the status (queued, running, completed, superseded or failed) and progress of an ingestion job.
+    Finished jobs are kept for JOB_TTL_SECONDS.
+    """
+    with jobs_lock:
+        prune_jobs()
+        job = dict(jobs[job_id]) if job_id in jobs else None
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return JSONResponse(content=job)
+
 # Setup Data Validation using Pydantic
 class InvokeRequest(BaseModel):
     input: str  # The input field, as expected by your LangChain chain
+    collection_id: str  # Collection of documents to query
+    session_id: str = "default"  # Chat session within the collection
 
 @app.post("/invoke")
 async def invoke(request: InvokeRequest):
     try:
-        global rag_chain_instance
-        if rag_chain_instance is None:
-            raise HTTPException(status_code=400, detail="No PDF processed. Please upload a PDF first.")
+        # Keep a reference, so a PDF swapped in meanwhile does not affect this request
+        with swap_lock:
+            collection = collections.get(request.collection_id)
+        if collection is None:
+            raise HTTPException(status_code=404, detail="Unknown collection. Please upload a PDF to it first.")
         
-        data = request.model_dump()
-        result = rag_chain_instance.invoke(data, config = {"configurable": {"session_id" : "default"}})
+        data = {"input": request.input}
+        # Run asynchronously, so the event loop keeps serving other requests during the LLM calls
+        result = await collection["chain"].ainvoke(data, config = {"configurable": {"collection_id": request.collection_id,
+                                                                                    "session_id": request.session_id}})
         # Debug
-        print(f"{sessionstore}")
+        print(f"{sessionstore[(request.collection_id, request.session_id)]}")
         answer = result['answer']
         # extract page contents from documents
         sources = [doc.page_content for doc in result['context']] 
 
         return JSONResponse(content={"answer": answer, "sources": sources})
 
+    except HTTPException:
+        raise
     except Exception as e:
         # Debug
         print(f"Error in /invoke: {e}")
@@ -230,6 +356,16 @@ async def invoke(request: InvokeRequest):
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}") 
 
 
+@app.get("/metrics")
+async def metrics():
+    """
+    Embedding throughput (chunks/sec) of the process and of the last processed PDF, and embedding cache hits.
+    """
+    return JSONResponse(content={"embedding": embedding_service.stats(),
+                                 "embedding_cache": embeddings.stats(),
+                                 "last_ingestion": last_ingestion})
+
+
 @app.get("/", response_class=HTMLResponse)
 async def welcome():
     with open("index.html", "r") as f:
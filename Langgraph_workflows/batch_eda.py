@@ -0,0 +1,222 @@
+"""
+Headless batch mode for the EDA workflow.
+
+Runs the whole LangGraph workflow (data_profiling -> final_step) without the
+human-in-the-loop interrupts over every CSV/Parquet file of a directory, writes
+the full Markdown report and node metrics of each dataset and a per-dataset timing summary.
+
+Usage:
+    python batch_eda.py <input_dir> --output-dir eda_reports --llm Groq --model gemma2-9b-it --workers 4
+
+API keys are read from the GROQ_API_KEY / OPENAI_API_KEY environment variables (or a .env file).
+An optional data dictionary can be placed next to a dataset as <dataset name>.txt.
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+
+from src.langgraphagenticai.graph.graph_factory import get_graph_executor
+from src.langgraphagenticai.utils.clean_directory import clean_directory
+from src.langgraphagenticai.utils.csv_ingestion import hash_file, ingest_csv
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.report_export import build_full_report
+from src.langgraphagenticai.utils.node_metrics import metrics_to_frame
+import src.langgraphagenticai.utils.constants as const
+
+SUPPORTED_EXTENSIONS = (".csv", ".parquet")
+DATASET_HASH_CHARS = 8 # content hash characters added to the output directory name of a dataset
+
+
+def find_datasets(input_dir: str) -> list:
+    """
+    Returns the CSV/Parquet files of the input directory, sorted by name.
+    """
+    return sorted(os.path.join(input_dir, name) for name in os.listdir(input_dir)
+                  if name.lower().endswith(SUPPORTED_EXTENSIONS))
+
+
+def dataset_hash(dataset_path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a dataset file.
+    """
+    with open(dataset_path, "rb") as f:
+        return hash_file(f)
+
+
+def prepare_dataset(dataset_path: str, work_dir: str, content_hash: str) -> dict:
+    """
+    Puts the dataset as df.parquet into its own working directory
+    (the nodes write the cleaned data and charts next to it).
+
+    Returns:
+        dict: {"file_path", "content_hash", "columns", "num_rows"}
+    """
+    if dataset_path.lower().endswith(".csv"):
+        with open(dataset_path, "rb") as f:
+            return ingest_csv(f, work_dir)
+
+    clean_directory(work_dir)
+    file_path = os.path.join(work_dir, "df.parquet")
+    shutil.copyfile(dataset_path, file_path)
+    metadata = pq.read_metadata(file_path)
+    return {"file_path": file_path,
+            "content_hash": content_hash,
+            "columns": metadata.schema.to_arrow_schema().names,
+            "num_rows": metadata.num_rows}
+
+
+def load_data_dictionary(dataset_path: str, columns: list) -> str:
+    """
+    Reads <dataset name>.txt next to the dataset, or falls back to the list of columns (as the UI does).
+    """
+    dictionary_path = os.path.splitext(dataset_path)[0] + ".txt"
+    if os.path.exists(dictionary_path):
+        with open(dictionary_path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    return ":\n".join(columns)
+
+
+def run_dataset(graph_executor, dataset_path: str, args) -> dict:
+    """
+    Runs the full workflow on one dataset and writes its Markdown report.
+    The output directory is named after the file stem and a short content hash, so datasets
+    with the same stem (e.g. sales.csv and sales.parquet) do not overwrite each other's reports.
+    The dataset's checkpoints and cached dataframes are released once its report is written.
+
+    Returns:
+        dict: Timing summary row of the dataset
+    """
+    dataset_name = os.path.basename(dataset_path)
+    thread_id = str(uuid.uuid4())
+    summary = {"dataset": dataset_name, "status": "ok"}
+    start = time.perf_counter()
+
+    try:
+        content_hash = dataset_hash(dataset_path)
+        dataset_dir = os.path.join(args.output_dir,
+                                   f"{os.path.splitext(dataset_name)[0]}_{content_hash[:DATASET_HASH_CHARS]}")
+        summary["output_dir"] = dataset_dir
+
+        ingest_start = time.perf_counter()
+        dataset = prepare_dataset(dataset_path, os.path.join(dataset_dir, "work"), content_hash)
+        summary["ingest_seconds"] = round(time.perf_counter() - ingest_start, 3)
+        summary["rows"] = dataset["num_rows"]
+        summary["columns"] = len(dataset["columns"])
+
+        # Use the requested KPI when the dataset has it, otherwise its last column
+        kpi = args.kpi if args.kpi in dataset["columns"] else dataset["columns"][-1]
+        summary["kpi"] = kpi
+
+        response = graph_executor.run_graph(dataset["file_path"],
+                                            load_data_dictionary(dataset_path, dataset["columns"]),
+                                            kpi,
+                                            args.sample_rows or None,
+                                            dataset["content_hash"],
+                                            thread_id=thread_id)
+        summary.update({f"{node}_seconds": seconds for node, seconds in response["node_timings"].items()})
+
+        metrics_df = metrics_to_frame(response["eda_state"].get("node_metrics"))
+        if not metrics_df.empty:
+            metrics_df.to_json(os.path.join(dataset_dir, "node_metrics.json"), orient="records", indent=2)
+            summary["llm_calls"] = int(metrics_df["llm_calls"].sum())
+            summary["prompt_tokens"] = int(metrics_df["prompt_tokens"].sum())
+            summary["completion_tokens"] = int(metrics_df["completion_tokens"].sum())
+            summary["peak_rss_mb"] = float(metrics_df["peak_rss_mb"].max())
+
+        errors = response["eda_state"].get("error_message")
+        if errors:
+            summary["status"] = "error"
+            summary["error"] = " ".join(errors).strip()
+
+        report_path = os.path.join(dataset_dir, "full_report.md")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(build_full_report(response["eda_state"]))
+        summary["report_path"] = report_path
+
+    except Exception as e:
+        traceback.print_exc()
+        summary["status"] = "error"
+        summary["error"] = str(e)
+
+    finally:
+        # Every dataset runs in its own thread; drop its checkpoints and cached dataframes
+        graph_executor.graph.checkpointer.delete_thread(thread_id)
+        dataframe_cache.evict_thread(thread_id)
+
+    summary["total_seconds"] = round(time.perf_counter() - start, 3)
+    print(f"[{summary['status']}] {dataset_name} in {summary['total_seconds']}s")
+    return summary
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the EDA workflow unattended over a directory of CSV/Parquet files.")
+    parser.add_argument("input_dir", help="Directory with the CSV/Parquet datasets")
+    parser.add_argument("--output-dir", default="eda_reports", help="Directory for the reports and the timing summary")
+    parser.add_argument("--llm", choices=["Groq", "OpenAI"], default="Groq", help="LLM provider")
+    parser.add_argument("--model", default=None, help="Model name (defaults to the first model configured for the provider)")
+    parser.add_argument("--kpi", default=None, help="Target metric; datasets without this column use their last column")
+    parser.add_argument("--sample-rows", type=int, default=const.DEFAULT_SAMPLE_ROWS, help="Rows sampled for statistics and charts (0 uses all rows)")
+    parser.add_argument("--mode", choices=[const.SEQUENTIAL_MODE, const.AUTO_MODE], default=const.AUTO_MODE,
+                        help="Auto runs the summary statistics, univariate and bivariate analysis of a dataset in parallel")
+    parser.add_argument("--workers", type=int, default=4, help="Number of datasets analyzed concurrently")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_dotenv()
+
+    from src.langgraphagenticai.ui.config import Config
+    config = Config()
+    if args.llm == "Groq":
+        user_input = {"selected_llm": "Groq",
+                      "selected_groq_model": args.model or config.get_groq_model_options()[0],
+                      "GROQ_API_KEY": os.getenv("GROQ_API_KEY")}
+    else:
+        user_input = {"selected_llm": "OpenAI",
+                      "selected_openai_model": args.model or config.get_openai_model_options()[0],
+                      "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY")}
+    user_input["selected_checkpointer"] = const.MEMORY_CHECKPOINTER
+    user_input["selected_execution_mode"] = args.mode
+
+    if not user_input.get(f"{args.llm.upper()}_API_KEY"):
+        print(f"Error: {args.llm.upper()}_API_KEY environment variable is required.")
+        return 1
+
+    datasets = find_datasets(args.input_dir)
+    if not datasets:
+        print(f"Error: No CSV/Parquet files found in '{args.input_dir}'.")
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # One compiled graph without interrupts, shared by all workers (each dataset runs in its own thread_id,
+    # deleted from the in-memory checkpointer once the dataset is done)
+    graph_executor = get_graph_executor(user_input, interrupt=False)
+
+    summaries = []
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_dataset, graph_executor, dataset_path, args) for dataset_path in datasets]
+        for future in as_completed(futures):
+            summaries.append(future.result())
+
+    timing_summary = pd.DataFrame(summaries).sort_values("dataset")
+    summary_path = os.path.join(args.output_dir, "timing_summary.csv")
+    timing_summary.to_csv(summary_path, index=False)
+    print(timing_summary.to_string(index=False))
+    print(f"Timing summary written to {summary_path}")
+
+    return 0 if (timing_summary["status"] == "ok").all() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import hashlib
+import time
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.langgraphagenticai.utils.prompt_budget import estimate_tokens
+
+# Code returned when a node asks for python code (data cleaning); it runs in the sandbox like generated code
+CLEANING_CODE = "```python\nX = df.copy()\nX = X.drop_duplicates()\n```"
+
+VOCABULARY = ["the", "distribution", "column", "values", "skewed", "outliers", "mean", "median",
+              "category", "correlation", "strong", "weak", "missing", "recommend", "data", "range"]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic chat model for offline benchmarks.
+
+    Every call waits latency_seconds (spread over the tokens when streaming) and returns
+    output_tokens words chosen from the hash of the prompt, so the same prompt always gets the same answer.
+    Prompts asking for python code get a small cleaning snippet. Token usage is reported like a
+    provider would, so the node metrics count prompt and completion tokens.
+    """
+    latency_seconds: float = 0.0
+    output_tokens: int = 200
+    model_name: str = "fake-chat-model"
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat-model"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _prompt_text(self, messages) -> str:
+        return "\n".join(str(message.content) for message in messages)
+
+    def _response_text(self, prompt: str) -> str:
+        if "python code" in prompt:
+            return CLEANING_CODE
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+        words = [VOCABULARY[digest[i % len(digest)] % len(VOCABULARY)] for i in range(self.output_tokens)]
+        return " ".join(words) + "."
+
+    def _usage(self, prompt: str, response: str) -> dict:
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(response)
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt = self._prompt_text(messages)
+        response = self._response_text(prompt)
+        time.sleep(self.latency_seconds)
+        message = AIMessage(content=response, usage_metadata=self._usage(prompt, response))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt = self._prompt_text(messages)
+        response = self._response_text(prompt)
+        words = response.split(" ")
+        for i, word in enumerate(words):
+            time.sleep(self.latency_seconds / len(words))
+            text = word if i == len(words) - 1 else f"{word} "
+            # The usage is reported once, on the last chunk
+            usage = self._usage(prompt, response) if i == len(words) - 1 else None
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=text, usage_metadata=usage))
+            if run_manager:
+                run_manager.on_llm_new_token(text, chunk=chunk)
+            yield chunk
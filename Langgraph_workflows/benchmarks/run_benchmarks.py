@@ -0,0 +1,220 @@
+"""
+Offline benchmark of the EDA workflow.
+
+Runs the whole LangGraph workflow (data_profiling -> final_step) on synthetic datasets with a
+deterministic fake chat model, so no API calls are made. For every scenario it records the wall time,
+chart rendering time, LLM calls, tokens and peak memory of each node, plus the ingestion and report
+assembly times, and writes them as JSON. A previous result file can be given as a baseline to flag regressions.
+
+Usage (from the Langgraph_workflows folder):
+    python -m benchmarks.run_benchmarks --scenarios small wide --latency 0.05 --output benchmark.json
+    python -m benchmarks.run_benchmarks --baseline benchmark.json --output benchmark_new.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.synthetic_data import SCENARIOS, TARGET_COLUMN, make_dataset
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_executor import GraphExecutor
+from src.langgraphagenticai.utils.clean_directory import clean_directory
+from src.langgraphagenticai.utils.csv_ingestion import ingest_csv
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.report_export import build_full_report
+import src.langgraphagenticai.utils.constants as const
+
+# Node metrics compared between runs
+NODE_METRICS = ["wall_time_seconds", "chart_render_seconds", "llm_calls", "prompt_tokens",
+                "completion_tokens", "bytes_read", "peak_rss_mb"]
+# Time metrics checked for regressions against a baseline
+TIME_METRICS = ["wall_time_seconds", "chart_render_seconds"]
+# Stores the app writes under src/, redirected to a temporary directory during a benchmark
+RUNTIME_STORE_PATHS = {"IMAGE_STORE_DIR": "image_store",
+                       "CHECKPOINT_DB_PATH": os.path.join("checkpoints", "eda_checkpoints.sqlite"),
+                       "LLM_CACHE_DB_PATH": os.path.join("checkpoints", "llm_cache.sqlite")}
+
+
+@contextlib.contextmanager
+def temporary_runtime_stores():
+    """
+    Points the image store, the checkpoint database and the LLM response cache to a temporary directory,
+    so a benchmark run leaves the app's own stores untouched. The directory is deleted afterwards.
+    """
+    original_paths = {name: getattr(const, name) for name in RUNTIME_STORE_PATHS}
+    with tempfile.TemporaryDirectory(prefix="eda_benchmark_") as temp_dir:
+        for name, relative_path in RUNTIME_STORE_PATHS.items():
+            setattr(const, name, os.path.join(temp_dir, relative_path))
+        try:
+            yield temp_dir
+        finally:
+            for name, path in original_paths.items():
+                setattr(const, name, path)
+
+
+def run_scenario(name: str, args) -> dict:
+    """
+    Runs the workflow args.repeats times on the synthetic dataset of a scenario.
+
+    Returns:
+        dict: Dataset shape, then the median over the repeats of the ingestion, total and report assembly
+              times and of the metrics of each node
+    """
+    spec = SCENARIOS[name]
+    df = make_dataset(**spec, seed=args.seed)
+    work_dir = os.path.abspath(os.path.join(args.work_dir, name))
+    csv_path = os.path.join(args.work_dir, f"{name}.csv")
+    df.to_csv(csv_path, index=False)
+
+    model = FakeChatModel(latency_seconds=args.latency, output_tokens=args.output_tokens, cache=False)
+    graph_executor = GraphExecutor(GraphBuilder(model, MemorySaver()).setup_graph(interrupt=False, mode=args.mode))
+
+    runs = []
+    for repeat in range(args.repeats):
+        # Start from an empty working directory, so every repeat ingests and writes the same files
+        clean_directory(work_dir)
+        start = time.perf_counter()
+        with open(csv_path, "rb") as f:
+            dataset = ingest_csv(f, work_dir)
+        ingest_seconds = time.perf_counter() - start
+
+        response = graph_executor.run_graph(dataset["file_path"], ":\n".join(dataset["columns"]),
+                                            TARGET_COLUMN, args.sample_rows or None, dataset["content_hash"])
+        state = response["eda_state"]
+        if state.get("error_message"):
+            raise RuntimeError(f"Scenario '{name}' failed: {' '.join(state['error_message'])}")
+
+        assembly_start = time.perf_counter()
+        report = build_full_report(state)
+        report_assembly_seconds = time.perf_counter() - assembly_start
+
+        runs.append({
+            "ingest_seconds": ingest_seconds,
+            "total_seconds": time.perf_counter() - start,
+            "report_assembly_seconds": report_assembly_seconds,
+            "report_chars": len(report),
+            "nodes": {node: {metric: metrics.get(metric, 0) for metric in NODE_METRICS}
+                      for node, metrics in state["node_metrics"].items()},
+        })
+        dataframe_cache.evict_thread(response["thread_id"])
+        print(f"{name} run {repeat + 1}/{args.repeats}: {runs[-1]['total_seconds']:.2f}s")
+
+    def median(values):
+        return round(statistics.median(values), 3)
+
+    return {
+        "dataset": {"rows": len(df), "columns": df.shape[1], **spec},
+        **{key: median([run[key] for run in runs])
+           for key in ("ingest_seconds", "total_seconds", "report_assembly_seconds", "report_chars")},
+        "nodes": {node: {metric: median([run["nodes"][node][metric] for run in runs]) for metric in NODE_METRICS}
+                  for node in runs[0]["nodes"]},
+    }
+
+
+def environment_info() -> dict:
+    """
+    Returns the details that make benchmark results comparable: versions, CPU count and git commit.
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit,
+    }
+
+
+def compare_results(baseline: dict, results: dict, threshold: float, min_seconds: float) -> list:
+    """
+    Compares the time metrics of two result files.
+    A metric regresses when it is more than threshold (relative) and min_seconds (absolute) slower.
+
+    Returns:
+        list: Rows (scenario, metric, baseline, current, change) of the compared metrics, with a regression flag
+    """
+    rows = []
+    for scenario, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if previous is None:
+            continue
+        pairs = [("total_seconds", previous["total_seconds"], current["total_seconds"]),
+                 ("report_assembly_seconds", previous["report_assembly_seconds"], current["report_assembly_seconds"])]
+        for node, metrics in current["nodes"].items():
+            for metric in TIME_METRICS:
+                if node in previous["nodes"]:
+                    pairs.append((f"{node}.{metric}", previous["nodes"][node][metric], metrics[metric]))
+
+        for metric, before, after in pairs:
+            change = (after - before) / before if before else 0.0
+            rows.append({"scenario": scenario, "metric": metric, "baseline": before, "current": after,
+                         "change": round(change, 3),
+                         "regression": change > threshold and after - before > min_seconds})
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the EDA workflow offline with a fake LLM and synthetic datasets.")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS), help="Datasets to benchmark")
+    parser.add_argument("--mode", choices=[const.SEQUENTIAL_MODE, const.AUTO_MODE], default=const.SEQUENTIAL_MODE,
+                        help="Graph execution mode; Sequential times every node on its own")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the fake LLM waits per call")
+    parser.add_argument("--output-tokens", type=int, default=200, help="Words returned by the fake LLM per call")
+    parser.add_argument("--sample-rows", type=int, default=const.DEFAULT_SAMPLE_ROWS, help="Rows sampled for statistics and charts (0 uses all rows)")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per scenario; the median is reported")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic datasets")
+    parser.add_argument("--work-dir", default="benchmark_data", help="Directory for the datasets and the files the nodes write")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+    parser.add_argument("--baseline", default=None, help="Previous results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative slowdown reported as a regression")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Smaller absolute slowdowns are never regressions")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    os.makedirs(args.work_dir, exist_ok=True)
+
+    results = {
+        "environment": environment_info(),
+        "config": {key: getattr(args, key) for key in ("mode", "latency", "output_tokens", "sample_rows", "repeats", "seed")},
+    }
+    with temporary_runtime_stores():
+        results["scenarios"] = {name: run_scenario(name, args) for name in args.scenarios}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    summary = pd.DataFrame([{"scenario": name, "total_seconds": result["total_seconds"],
+                             **{node: metrics["wall_time_seconds"] for node, metrics in result["nodes"].items()}}
+                            for name, result in results["scenarios"].items()])
+    print(summary.to_string(index=False))
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        comparison = pd.DataFrame(compare_results(baseline, results, args.threshold, args.min_seconds))
+        if not comparison.empty:
+            print(comparison.to_string(index=False))
+            if comparison["regression"].any():
+                print(f"Regressions beyond {args.threshold:.0%} found.")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
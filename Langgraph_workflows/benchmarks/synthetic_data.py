@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# Benchmark datasets: rows, numeric/categorical columns and categorical cardinality
+SCENARIOS = {
+    "small": {"rows": 5_000, "numeric_columns": 5, "categorical_columns": 3, "cardinality": 5},
+    "tall": {"rows": 500_000, "numeric_columns": 8, "categorical_columns": 4, "cardinality": 10},
+    "wide": {"rows": 20_000, "numeric_columns": 60, "categorical_columns": 20, "cardinality": 8},
+    "high_cardinality": {"rows": 50_000, "numeric_columns": 6, "categorical_columns": 6, "cardinality": 5_000},
+}
+
+TARGET_COLUMN = "target"
+
+
+def make_dataset(rows: int, numeric_columns: int, categorical_columns: int, cardinality: int,
+                 missing_fraction: float = 0.02, seed: int = 0) -> pd.DataFrame:
+    """
+    Generates a reproducible dataset with numeric columns of different distributions,
+    categorical columns of the given cardinality, missing values and a binary target column.
+
+    Args:
+        rows (int): Number of rows
+        numeric_columns (int): Number of numeric columns
+        categorical_columns (int): Number of categorical columns
+        cardinality (int): Number of distinct values of each categorical column
+        missing_fraction (float): Fraction of missing values in every other column
+        seed (int): Random seed
+
+    Returns:
+        pd.DataFrame: Synthetic dataset; the target column is named TARGET_COLUMN
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    distributions = [
+        lambda: rng.normal(50, 10, rows),
+        lambda: rng.exponential(5, rows),
+        lambda: rng.integers(0, 100, rows).astype(float),
+        lambda: rng.lognormal(2, 0.5, rows),
+    ]
+    for i in range(numeric_columns):
+        columns[f"num_{i}"] = distributions[i % len(distributions)]()
+
+    categories = np.array([f"c{j}" for j in range(cardinality)], dtype=object)
+    # Zipf-like weights, so some categories are much more frequent than others
+    weights = 1 / np.arange(1, cardinality + 1)
+    weights /= weights.sum()
+    for i in range(categorical_columns):
+        columns[f"cat_{i}"] = rng.choice(categories, rows, p=weights)
+
+    df = pd.DataFrame(columns)
+    for i, col in enumerate(df.columns):
+        if i % 2 == 0 and missing_fraction > 0:
+            df.loc[rng.random(rows) < missing_fraction, col] = None
+
+    signal = df[df.select_dtypes(include=np.number).columns[:1]].sum(axis=1) if numeric_columns else 0
+    df[TARGET_COLUMN] = np.where(rng.random(rows) + (signal - np.mean(signal)) / 100 > 0.5, "yes", "no")
+    return df
@@ -1,5 +1,7 @@
 import os
 import streamlit as st
+from src.langgraphagenticai.LLMS.http_client import get_http_client
+from src.langgraphagenticai.LLMS.llm_response_cache import get_llm_response_cache
 from langchain_groq import ChatGroq
 
 
@@ -23,7 +25,9 @@ class GroqLLM:
         
             # Initialize and return the Groq LLM model
             llm = ChatGroq(model=self.user_controls_input.get("selected_groq_model"), 
-                            groq_api_key=groq_api_key, temperature = 0.1)
+                            groq_api_key=groq_api_key, temperature = 0.1,
+                            http_client=get_http_client(),
+                            cache=get_llm_response_cache())
             
             return llm
             
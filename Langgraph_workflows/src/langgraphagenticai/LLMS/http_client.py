@@ -0,0 +1,24 @@
+import threading
+
+import httpx
+
+import src.langgraphagenticai.utils.constants as const
+
+_http_client = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Returns the process-wide HTTP client shared by all chat models,
+    so connections to the LLM providers are pooled and kept alive across reruns.
+    """
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=const.HTTP_MAX_CONNECTIONS,
+                                    max_keepalive_connections=const.HTTP_MAX_CONNECTIONS),
+                timeout=httpx.Timeout(const.HTTP_TIMEOUT_SECONDS),
+            )
+        return _http_client
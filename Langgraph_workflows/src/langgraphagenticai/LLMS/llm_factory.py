@@ -0,0 +1,55 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.LLMS.groqllm import GroqLLM
+from src.langgraphagenticai.LLMS.openllm import OpenAILLM
+
+_llm_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def hash_api_key(api_key: str) -> str:
+    """
+    Returns a SHA-256 digest of the API key, so cache keys never hold the key itself.
+    """
+    return hashlib.sha256(str(api_key).encode()).hexdigest()
+
+
+def get_llm_config_key(user_controls_input: dict) -> tuple:
+    """
+    Returns the (provider, model name, API key hash) tuple identifying the selected LLM.
+    """
+    provider = user_controls_input.get("selected_llm")
+    if provider == "Groq":
+        model_name, api_key = user_controls_input.get("selected_groq_model"), user_controls_input.get("GROQ_API_KEY")
+    else:
+        model_name, api_key = user_controls_input.get("selected_openai_model"), user_controls_input.get("OPENAI_API_KEY")
+    return (provider, model_name, hash_api_key(api_key))
+
+
+def get_llm(user_controls_input: dict):
+    """
+    Returns the chat model for the selected provider, model and API key,
+    creating it only the first time this configuration is seen in the process.
+    """
+    key = get_llm_config_key(user_controls_input)
+    with _lock:
+        if key in _llm_cache:
+            _llm_cache.move_to_end(key)
+            return _llm_cache[key]
+
+    if key[0] == "Groq":
+        llm = GroqLLM(user_controls_input=user_controls_input).get_llm_model()
+    else:
+        llm = OpenAILLM(user_controls_input=user_controls_input).get_llm_model()
+
+    if not llm:
+        raise ValueError("LLM model could not be initialized.")
+
+    with _lock:
+        _llm_cache[key] = llm
+        while len(_llm_cache) > const.LLM_FACTORY_CACHE_SIZE:
+            _llm_cache.popitem(last=False)
+    return llm
@@ -0,0 +1,135 @@
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+import src.langgraphagenticai.utils.constants as const
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _dump_generations(generations) -> str:
+    return json.dumps([
+        {"message": message_to_dict(generation.message), "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration)
+        else {"text": generation.text, "generation_info": generation.generation_info}
+        for generation in generations
+    ])
+
+
+def _load_generations(response: str) -> list:
+    generations = []
+    for item in json.loads(response):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            # A cached answer costs no tokens; flag it so the node metrics count it as a cache hit
+            message.usage_metadata = None
+            message.response_metadata = {**message.response_metadata, "from_cache": True}
+            generations.append(ChatGeneration(message=message, generation_info=item["generation_info"]))
+        else:
+            generations.append(Generation(text=item["text"], generation_info=item["generation_info"]))
+    return generations
+
+
+class SQLiteLLMCache(BaseCache):
+    """
+    Persistent LLM response cache stored in SQLite.
+
+    Entries are keyed by the hash of the model configuration string LangChain builds for each
+    chat model (provider class, model name, temperature and other parameters) and the hash of the prompt.
+    Entries expire after ttl_seconds; once the stored responses exceed max_bytes, the least
+    recently used entries are evicted.
+    """
+    def __init__(self, db_path: str = None,
+                 ttl_seconds: int = const.LLM_CACHE_TTL_SECONDS,
+                 max_bytes: int = const.LLM_CACHE_MAX_BYTES):
+        db_path = db_path or const.LLM_CACHE_DB_PATH
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    llm_hash TEXT NOT NULL,
+                    prompt_hash TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (llm_hash, prompt_hash)
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)")
+
+    def lookup(self, prompt: str, llm_string: str):
+        """
+        Returns the cached generations for the prompt and model, or None on a miss.
+        """
+        key = (_hash(llm_string), _hash(prompt))
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT response, created_at FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?",
+                                     key).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?", key)
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE llm_hash = ? AND prompt_hash = ?", (now, *key))
+        return _load_generations(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val):
+        """
+        Stores the generations of a prompt and model, then evicts entries beyond the size budget.
+        """
+        response = _dump_generations(return_val)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                               (_hash(llm_string), _hash(prompt), response, len(response), now, now))
+            self._evict()
+
+    def clear(self, **kwargs):
+        """
+        Removes every cached response.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+    def _evict(self):
+        self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        excess = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for llm_hash, prompt_hash, size in self._conn.execute(
+                "SELECT llm_hash, prompt_hash, size FROM llm_cache ORDER BY last_used"):
+            evicted.append((llm_hash, prompt_hash))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM llm_cache WHERE llm_hash = ? AND prompt_hash = ?", evicted)
+
+
+def get_llm_response_cache(db_path: str = None) -> SQLiteLLMCache:
+    """
+    Returns the process-wide LLM response cache for db_path (const.LLM_CACHE_DB_PATH by default).
+    """
+    return _open_llm_response_cache(db_path or const.LLM_CACHE_DB_PATH)
+
+
+@functools.lru_cache(maxsize=None)
+def _open_llm_response_cache(db_path: str) -> SQLiteLLMCache:
+    return SQLiteLLMCache(db_path)
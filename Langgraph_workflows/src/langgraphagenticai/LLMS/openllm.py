@@ -1,5 +1,7 @@
 import os
 import streamlit as st
+from src.langgraphagenticai.LLMS.http_client import get_http_client
+from src.langgraphagenticai.LLMS.llm_response_cache import get_llm_response_cache
 from langchain_openai import ChatOpenAI
 
 
@@ -23,7 +25,9 @@ class OpenAILLM:
         
             # Initialize and return the OpenAI LLM model
             llm = ChatOpenAI(model=self.user_controls_input.get("selected_openai_model"), 
-                             api_key=openai_api_key, temperature = 0.1)
+                             api_key=openai_api_key, temperature = 0.1,
+                             http_client=get_http_client(),
+                             cache=get_llm_response_cache())
             
             return llm
             
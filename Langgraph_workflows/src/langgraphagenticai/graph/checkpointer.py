@@ -0,0 +1,38 @@
+import functools
+import os
+import sqlite3
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+import src.langgraphagenticai.utils.constants as const
+
+
+def get_sqlite_checkpointer(db_path: str = None) -> SqliteSaver:
+    """
+    Returns the process-wide SQLite checkpointer for the given database file (const.CHECKPOINT_DB_PATH by default).
+
+    The database runs in WAL mode with synchronous=NORMAL: every checkpoint is committed
+    as an append to the write-ahead log, and the disk syncs are grouped at WAL checkpoints
+    instead of one per write. A finished node is never lost on a process restart.
+    """
+    return _open_sqlite_checkpointer(db_path or const.CHECKPOINT_DB_PATH)
+
+
+@functools.lru_cache(maxsize=None)
+def _open_sqlite_checkpointer(db_path: str) -> SqliteSaver:
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return SqliteSaver(conn)
+
+
+def get_checkpointer(checkpointer_option: str):
+    """
+    Returns the checkpointer selected in the UI: a durable SQLite checkpointer,
+    or an in-memory checkpointer that is lost when the process stops.
+    """
+    if checkpointer_option == const.SQLITE_CHECKPOINTER:
+        return get_sqlite_checkpointer()
+    return MemorySaver()
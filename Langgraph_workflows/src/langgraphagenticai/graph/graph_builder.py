@@ -7,19 +7,54 @@ from src.langgraphagenticai.nodes.node_stats_summary import node_stats_summary
 from src.langgraphagenticai.nodes.node_univariate_analysis import node_univariate_analysis
 from src.langgraphagenticai.nodes.node_bivariate_analysis import node_bivariate_analysis
 from src.langgraphagenticai.nodes.node_final_report import node_final_report
+from src.langgraphagenticai.utils.node_metrics import instrument_node
+from src.langgraphagenticai.graph.input_tracking import track_inputs
+from src.langgraphagenticai.utils.progress_events import report_progress
 from langchain_core.runnables.graph import MermaidDrawMethod
+import src.langgraphagenticai.utils.constants as const
+import functools
+
+# Nodes that only read the cleaned data and run in parallel in Auto mode
+PARALLEL_ANALYSIS_NODES = ["stats_summary", "univariate_analysis", "bivariate_analysis"]
+
+
+def state_updates(run_func):
+    """
+    Wraps a node run function so the node returns only the State keys it changed.
+    Nodes running in parallel then never write the same key, except the keys with a reducer
+    (reports, node metrics, input fingerprints, error messages).
+    A node skipped because its report is current (see track_inputs) returns no update.
+    """
+    @functools.wraps(run_func)
+    def run(state):
+        node_state = dict(state)
+        # Copied so the node can append messages without changing the input State
+        node_state["error_message"] = list(state.get("error_message") or [])
+        node_state = run_func(node_state)
+        updates = {key: value for key, value in node_state.items()
+                   if key != "error_message" and (key not in state or value is not state[key])}
+        if node_state.get("error_message") != list(state.get("error_message") or []):
+            updates["error_message"] = node_state["error_message"]
+        return updates
+
+    return run
 
 class GraphBuilder:
 
-    def __init__(self, model):
+    def __init__(self, model, checkpointer=None):
         self.llm=model
         self.graph_builder=StateGraph(State)
-        self.memory = MemorySaver()
+        self.memory = checkpointer if checkpointer is not None else MemorySaver()
 
 
-    def data_quality_graph(self):
+    def data_quality_graph(self, mode=const.SEQUENTIAL_MODE):
         """
         Builds a data quality report graph using LangGraph.
+
+        Args:
+            mode (str): const.SEQUENTIAL_MODE chains the six nodes;
+                const.AUTO_MODE fans out stats_summary, univariate_analysis and bivariate_analysis
+                after data_cleaning (they only read the cleaned data) and joins them before final_step
         """
         self.node_data_profiling = node_data_profiling(self.llm)
         self.node_data_cleaning = node_data_cleaning(self.llm)
@@ -29,36 +64,54 @@ class GraphBuilder:
         self.node_final_report = node_final_report(self.llm)
 
 
-        # Add nodes for each step in the workflow (skip data_ingestion)
-        self.graph_builder.add_node("data_profiling", self.node_data_profiling.run)
-        self.graph_builder.add_node("data_cleaning", self.node_data_cleaning.run)
-        self.graph_builder.add_node("stats_summary", self.node_stats_summary.run)
-        self.graph_builder.add_node("univariate_analysis", self.node_univariate_analysis.run)
-        self.graph_builder.add_node("bivariate_analysis", self.node_bivariate_analysis.run)
-        self.graph_builder.add_node("final_step", self.node_final_report.run)
+        # Add nodes for each step in the workflow (skip data_ingestion).
+        # Every node records its metrics (time, tokens, bytes read, memory) into state["node_metrics"]
+        # and the fingerprint of its inputs into state["input_fingerprints"], emits a node_start event
+        # when it actually runs, and returns only the keys it changed
+        model_name = getattr(self.llm, "model_name", None)
+        nodes = {
+            "data_profiling": self.node_data_profiling.run,
+            "data_cleaning": self.node_data_cleaning.run,
+            "stats_summary": self.node_stats_summary.run,
+            "univariate_analysis": self.node_univariate_analysis.run,
+            "bivariate_analysis": self.node_bivariate_analysis.run,
+            "final_step": self.node_final_report.run,
+        }
+        for node_name, run_func in nodes.items():
+            self.graph_builder.add_node(node_name, state_updates(track_inputs(node_name, report_progress(node_name, instrument_node(node_name, run_func, model_name)))))
 
         # Add edges to define the flow (START -> data_profiling)
         self.graph_builder.add_edge(START, "data_profiling")
         self.graph_builder.add_edge("data_profiling", "data_cleaning")
-        self.graph_builder.add_edge("data_cleaning", "stats_summary")
-        self.graph_builder.add_edge("stats_summary", "univariate_analysis")
-        self.graph_builder.add_edge("univariate_analysis", "bivariate_analysis")
-        self.graph_builder.add_edge("bivariate_analysis", "final_step")
+        if mode == const.AUTO_MODE:
+            for node_name in PARALLEL_ANALYSIS_NODES:
+                self.graph_builder.add_edge("data_cleaning", node_name)
+            # final_step waits for all three branches
+            self.graph_builder.add_edge(PARALLEL_ANALYSIS_NODES, "final_step")
+        else:
+            self.graph_builder.add_edge("data_cleaning", "stats_summary")
+            self.graph_builder.add_edge("stats_summary", "univariate_analysis")
+            self.graph_builder.add_edge("univariate_analysis", "bivariate_analysis")
+            self.graph_builder.add_edge("bivariate_analysis", "final_step")
         self.graph_builder.add_edge("final_step", END)
 
-    def setup_graph(self):
+    def setup_graph(self, interrupt=True, mode=const.SEQUENTIAL_MODE):
         """
-        Sets up the graph
+        Sets up the graph.
+        With interrupt=True the graph pauses before every node (human-in-the-loop UI);
+        with interrupt=False it runs from data_profiling to final_step unattended.
+        The Auto mode graph always runs unattended.
         """
 
-        self.data_quality_graph()
+        self.data_quality_graph(mode)
+        interrupt_before = ["data_profiling",
+                            "data_cleaning", 
+                            "stats_summary", 
+                            "univariate_analysis", 
+                            "bivariate_analysis", 
+                            "final_step"] if interrupt and mode != const.AUTO_MODE else None
         app = self.graph_builder.compile(
-            interrupt_before=["data_profiling",
-                              "data_cleaning", 
-                              "stats_summary", 
-                              "univariate_analysis", 
-                              "bivariate_analysis", 
-                              "final_step"],
+            interrupt_before=interrupt_before,
             checkpointer = self.memory)
         
         # Save the graph image
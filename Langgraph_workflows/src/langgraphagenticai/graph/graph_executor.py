@@ -1,6 +1,8 @@
 from src.langgraphagenticai.state.state import State, make_initial_state
 import uuid
+import time
 import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.graph.input_tracking import is_stage_current, first_stale_stage
 from langgraph.graph import StateGraph, START,END
 
 class GraphExecutor:
@@ -10,7 +12,20 @@ class GraphExecutor:
     def get_config(self, thread_id):
         return {"configurable": {"thread_id": thread_id}}
     
-    def initialize_graph(self, data_file_path, data_dictionary, kpi):
+    def make_state(self, thread_id, data_file_path, data_dictionary, kpi, sample_rows=None, dataset_hash=None):
+        """
+        Returns the initial State of a new thread
+        """
+        state = make_initial_state()
+        state["thread_id"] = thread_id
+        state["data_file_path"] = data_file_path
+        state["dataset_hash"] = dataset_hash
+        state["data_dictionary"] = data_dictionary
+        state["target_metric"] = kpi
+        state["sample_rows"] = sample_rows
+        return state
+
+    def initialize_graph(self, data_file_path, data_dictionary, kpi, sample_rows=None, dataset_hash=None):
         """
         Initiates the graph and store data file path in State
         """
@@ -22,10 +37,7 @@ class GraphExecutor:
         config = self.get_config(thread_id)
 
         # resume the graph
-        state = make_initial_state()
-        state["data_file_path"] = data_file_path
-        state["data_dictionary"] = data_dictionary
-        state["target_metric"] = kpi
+        state = self.make_state(thread_id, data_file_path, data_dictionary, kpi, sample_rows, dataset_hash)
         
         for output in self.graph.stream(state, config, stream_mode="values"):
             state = output
@@ -33,10 +45,95 @@ class GraphExecutor:
         return {"thread_id" : thread_id, "eda_state" : state}
     
 
-    def graph_execution(self, thread_id, state, stage):
+    def run_graph(self, data_file_path, data_dictionary, kpi, sample_rows=None, dataset_hash=None, on_event=None, thread_id=None):
+        """
+        Runs the whole workflow (data_profiling -> final_step) in one go.
+        The graph must be compiled without interrupts (GraphBuilder.setup_graph(interrupt=False)
+        or the Auto execution mode). on_event, if given, is called with each progress event (see stream_events).
+        A new thread is used unless thread_id is given.
+
+        Returns:
+            dict: thread_id, the final eda_state and node_timings (wall time in seconds per node)
+        """
+        thread_id = thread_id or str(uuid.uuid4())
+        state = self.make_state(thread_id, data_file_path, data_dictionary, kpi, sample_rows, dataset_hash)
+        return self.continue_graph(thread_id, state, on_event)
+
+
+    def continue_graph(self, thread_id, state, on_event=None):
+        """
+        Runs the workflow of a thread from START to the end without pausing.
+        Stages whose reports are current are skipped, so only the missing or out-of-date stages execute.
+        The graph must be compiled without interrupts.
+
+        Args:
+            on_event: Optional function called with each progress event (see stream_events)
+
+        Returns:
+            dict: thread_id, the final eda_state and node_timings (wall time in seconds per node;
+                  nodes finishing in the same step, e.g. the parallel branches of the Auto mode, share the step time)
+        """
+        config = self.get_config(thread_id)
+        stream_mode = const.EVENT_STREAM_MODES if on_event is not None else ["updates", "values"]
+
+        node_timings = {}
+        step_start = time.perf_counter()
+        for event in self.stream_events(state, config, stream_mode):
+            if event["type"] == "state":
+                state = event["eda_state"]
+                continue
+            if event["type"] == "node_end":
+                step_end = time.perf_counter()
+                node_timings[event["node"]] = round(step_end - step_start, 3)
+                step_start = step_end
+            if on_event is not None:
+                on_event(event)
+
+        return {"thread_id" : thread_id, "eda_state" : state, "node_timings" : node_timings}
+
+
+    def stream_events(self, graph_input, config, stream_mode=const.EVENT_STREAM_MODES):
+        """
+        Runs the graph and yields its progress as events, as they happen:
+            {"type": "node_start", "node"}                 a node starts running (skipped nodes send none)
+            {"type": "progress", "node", "message"}        progress within a node, e.g. charts rendered
+            {"type": "section", "node", "title", "content"} a report section (chart and its analysis) is complete
+            {"type": "token", "node", "message_id", "content"} a chunk of LLM output
+            {"type": "node_end", "node"}                   a node finished (skipped nodes send none)
+            {"type": "state", "eda_state"}                 the State after each step; the last one is the final State
+
+        Args:
+            graph_input: Input of the run (a State, or None to resume from the checkpoint)
+            config: Run config with the thread_id
+            stream_mode (list): LangGraph stream modes; "values" and "updates" are always needed
+        """
+        for mode, chunk in self.graph.stream(graph_input, config, stream_mode=stream_mode):
+            if mode == "values":
+                yield {"type": "state", "eda_state": chunk}
+            elif mode == "updates":
+                for node_name, update in chunk.items():
+                    # A node skipped because its report is current returns no update
+                    if not node_name.startswith("__") and update: # e.g. __interrupt__
+                        yield {"type": "node_end", "node": node_name}
+            elif mode == "custom":
+                yield chunk
+            elif mode == "messages":
+                message, metadata = chunk
+                if isinstance(message.content, str) and message.content:
+                    yield {"type": "token", "node": metadata.get("langgraph_node"),
+                           "message_id": message.id, "content": message.content}
+
+
+    def graph_execution(self, thread_id, state, stage, on_event=None):
         """
         Executes the data profile report workflow for a given thread ID and State.
+        on_event, if given, is called with each progress event of the stage (see stream_events).
         """
+        # Skip nodes whose report is already checkpointed and was produced from the current inputs
+        # (e.g. after resuming a thread, or upstream of a changed input)
+        if stage in const.STAGE_REPORT_KEYS and is_stage_current(state, stage):
+            return {"thread_id" : thread_id, "eda_state" : state}
+
         if stage == const.PROFILE_DATA:
             state["next_node"]=const.CLEAN_DATA
             execute_as_node = START
@@ -61,20 +158,60 @@ class GraphExecutor:
             state["next_node"]=const.END_NODE
             execute_as_node = const.GENERATE_BIVARIATE_REPORT
 
-        return self.update_and_resume_graph(state, thread_id, as_node=execute_as_node)
+        return self.update_and_resume_graph(state, thread_id, as_node=execute_as_node, on_event=on_event)
     
     
+    def resume_graph(self, thread_id, data_file_path=None, dataset_hash=None):
+        """
+        Loads the checkpointed State of a thread and finds the stage to continue from:
+        the first stage whose report does not exist yet or is out of date.
+        The dataset currently uploaded (data_file_path and dataset_hash) replaces the checkpointed one,
+        so a thread resumed on a different dataset re-runs every stage that depends on the data.
+        The checkpoint records the thread's cleaned data file (cleaned_file_path); when that file is
+        missing or was built from another dataset, the thread continues from data cleaning.
+        Returns None if the thread has no checkpoint.
+        """
+        snapshot = self.graph.get_state(self.get_config(thread_id))
+        state = snapshot.values if snapshot else None
+        if not state:
+            return None
+
+        state = dict(state)
+        if data_file_path is not None:
+            state["data_file_path"] = data_file_path
+        if dataset_hash is not None:
+            state["dataset_hash"] = dataset_hash
+
+        return {"thread_id" : thread_id, "eda_state" : state, "stage" : first_stale_stage(state)}
+
+
+    def update_inputs(self, thread_id, state, data_dictionary, kpi):
+        """
+        Changes the data dictionary and target metric of a thread and finds the stage to continue from:
+        the first stage whose inputs changed. Later stages re-run only if their own inputs change,
+        e.g. a new target metric re-runs the bivariate analysis and the final report only.
+        """
+        state = dict(state)
+        state["data_dictionary"] = data_dictionary
+        state["target_metric"] = kpi
+        return {"thread_id" : thread_id, "eda_state" : state, "stage" : first_stale_stage(state)}
+
+
     ## -------- Helper Method to handle the graph resume state ------- ##
 
-    def update_and_resume_graph(self, state, thread_id, as_node):
+    def update_and_resume_graph(self, state, thread_id, as_node, on_event=None):
         graph = self.graph
         thread = self.get_config(thread_id)
         
         graph.update_state(thread, state, as_node=as_node)
         
         # Resume the graph
+        stream_mode = const.EVENT_STREAM_MODES if on_event is not None else ["values"]
         state = None
-        for output in graph.stream(None, thread, stream_mode="values"):
-            state = output
+        for event in self.stream_events(None, thread, stream_mode):
+            if event["type"] == "state":
+                state = event["eda_state"]
+            elif on_event is not None:
+                on_event(event)
         
-        return {"thread_id" : thread_id, "eda_state" : state}
\ No newline at end of file
+        return {"thread_id" : thread_id, "eda_state" : state}
@@ -0,0 +1,67 @@
+import os
+import threading
+from collections import OrderedDict
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.LLMS.llm_factory import get_llm, get_llm_config_key
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer, get_sqlite_checkpointer
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.graph.graph_executor import GraphExecutor
+from src.langgraphagenticai.utils.image_store import referenced_image_ids, prune_image_store
+
+_executor_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_graph_executor(user_controls_input: dict, interrupt: bool = True) -> GraphExecutor:
+    """
+    Returns a GraphExecutor over the compiled EDA graph for the selected LLM configuration
+    (provider, model name, API key hash), checkpointer, execution mode and interrupt mode.
+    The graph is compiled once per configuration and shared by every session of the process.
+    The Auto execution mode never pauses between nodes.
+    """
+    checkpointer_option = user_controls_input.get("selected_checkpointer")
+    execution_mode = user_controls_input.get("selected_execution_mode") or const.SEQUENTIAL_MODE
+    interrupt = interrupt and execution_mode == const.SEQUENTIAL_MODE
+    key = get_llm_config_key(user_controls_input) + (checkpointer_option, execution_mode, interrupt)
+
+    with _lock:
+        if key in _executor_cache:
+            _executor_cache.move_to_end(key)
+            return _executor_cache[key]
+
+    model = get_llm(user_controls_input)
+    graph = GraphBuilder(model, get_checkpointer(checkpointer_option)).setup_graph(interrupt=interrupt, mode=execution_mode)
+    graph_executor = GraphExecutor(graph)
+
+    with _lock:
+        graph_executor = _executor_cache.setdefault(key, graph_executor)
+        while len(_executor_cache) > const.LLM_FACTORY_CACHE_SIZE:
+            _executor_cache.popitem(last=False)
+    return graph_executor
+
+
+def prune_unreferenced_images() -> int:
+    """
+    Deletes the stored chart images that no live thread references.
+    Live threads are those checkpointed by the cached graphs and, when it exists, the SQLite
+    checkpoint database (its threads can be resumed after a restart). Every checkpoint of a thread
+    is scanned, so earlier versions of a report keep their images too.
+
+    Returns:
+        int: Number of deleted files
+    """
+    with _lock:
+        checkpointers = {id(executor.graph.checkpointer): executor.graph.checkpointer
+                         for executor in _executor_cache.values()}
+    if os.path.exists(const.CHECKPOINT_DB_PATH):
+        sqlite_checkpointer = get_sqlite_checkpointer()
+        checkpointers[id(sqlite_checkpointer)] = sqlite_checkpointer
+
+    reports = []
+    for checkpointer in checkpointers.values():
+        for checkpoint_tuple in checkpointer.list(None):
+            channel_values = checkpoint_tuple.checkpoint.get("channel_values", {})
+            reports.extend(channel_values.get(key) for key in const.STAGE_REPORT_KEYS.values())
+
+    return prune_image_store(referenced_image_ids(reports))
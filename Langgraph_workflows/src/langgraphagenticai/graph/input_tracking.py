@@ -0,0 +1,69 @@
+import functools
+import hashlib
+import json
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.cleaned_data import cleaned_data_available
+
+
+def dataset_identity(state: dict) -> str:
+    """
+    Returns the identity of the thread's dataset: its content hash or, without one, the data file path.
+    """
+    return state.get("dataset_hash") or state.get("data_file_path")
+
+
+def input_fingerprint(state: dict, stage: str) -> str:
+    """
+    Returns the SHA-256 fingerprint of the State values a stage reads (STAGE_INPUT_KEYS).
+    Without a dataset hash, the data file path identifies the dataset.
+    """
+    inputs = {key: state.get(key) for key in const.STAGE_INPUT_KEYS[stage]}
+    if "dataset_hash" in inputs:
+        inputs["dataset_hash"] = dataset_identity(state)
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def is_stage_current(state: dict, stage: str) -> bool:
+    """
+    Returns True when the stage's report exists and was produced from the current inputs.
+    Reports checkpointed before fingerprints were recorded are considered current.
+    Data cleaning is also out of date when its cleaned data file is missing or was built from another dataset,
+    since the later stages read that file.
+    """
+    if not state.get(const.STAGE_REPORT_KEYS[stage]):
+        return False
+    if stage == const.CLEAN_DATA and not (state.get("cleaned_file_path") and cleaned_data_available(
+            state["cleaned_file_path"], dataset_identity(state))):
+        return False
+    recorded = (state.get("input_fingerprints") or {}).get(stage)
+    return recorded is None or recorded == input_fingerprint(state, stage)
+
+
+def first_stale_stage(state: dict) -> str:
+    """
+    Returns the first stage, in execution order, whose report is missing or out of date,
+    or END_NODE when every report is current.
+    """
+    for stage in const.STAGE_REPORT_KEYS:
+        if not is_stage_current(state, stage):
+            return stage
+    return const.END_NODE
+
+
+def track_inputs(stage: str, run_func):
+    """
+    Wraps a node run function to record the fingerprint of the inputs it ran with
+    into state["input_fingerprints"][stage]. A node whose report is current is skipped,
+    so re-running a whole graph only executes the out-of-date stages.
+    """
+    @functools.wraps(run_func)
+    def run(state):
+        if is_stage_current(state, stage):
+            return state
+        fingerprint = input_fingerprint(state, stage)
+        state = run_func(state)
+        state["input_fingerprints"] = {**(state.get("input_fingerprints") or {}), stage: fingerprint}
+        return state
+
+    return run
@@ -1,12 +1,13 @@
 import streamlit as st
 import json
 from src.langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
-from src.langgraphagenticai.LLMS.groqllm import GroqLLM
-from src.langgraphagenticai.LLMS.openllm import OpenAILLM
+from src.langgraphagenticai.ui.streamlitui.display_report import display_report
+from src.langgraphagenticai.ui.streamlitui.display_events import StreamingEventDisplay
 from src.langgraphagenticai.state.state import State
-from src.langgraphagenticai.graph.graph_builder import GraphBuilder
-from src.langgraphagenticai.graph.graph_executor import GraphExecutor
-from src.langgraphagenticai.utils.clean_directory import clean_directory
+from src.langgraphagenticai.graph.graph_factory import get_graph_executor
+from src.langgraphagenticai.utils.csv_ingestion import ingest_csv
+from src.langgraphagenticai.utils.report_export import build_full_report
+from src.langgraphagenticai.utils.node_metrics import metrics_to_frame
 import src.langgraphagenticai.utils.constants as const
 
 import os
@@ -53,56 +54,99 @@ def load_langgraph_agenticai_app():
     # Save the new uploaded file
     if uploaded_file is not None:
 
-        # Configure LLM
-        selectedLLM = user_input.get("selected_llm")
-        if selectedLLM == "Groq":
-                obj_llm_config = GroqLLM(user_controls_input=user_input)
-                model = obj_llm_config.get_llm_model()
-        else:
-            obj_llm_config = OpenAILLM(user_controls_input=user_input)
-            model = obj_llm_config.get_llm_model()
-
-        if not model:
-            st.error("Error: LLM model could not be initialized.")
-            return
+        # Get the compiled graph for the selected LLM and checkpointer.
+        # It is built once per configuration and reused by every rerun and session.
+        try:
+            graph_executor = get_graph_executor(user_input)
 
+        except Exception as e:
+            st.error(f"Error: Graph setup failed - {e}")
+            return
 
-        # Make sure temp data directory is empty
-        # if it doesn't exist already, create it
-        if st.session_state.stage == "START":
-            clean_directory(TEMP_DATA_DIR)
+        # Convert the uploaded CSV to parquet once per upload.
+        # Reruns reuse the conversion and only need the schema and row count.
+        ingested_file = st.session_state.get("ingested_file")
+        if ingested_file is None or ingested_file["file_id"] != uploaded_file.file_id:
+            with st.spinner("Ingesting Data..."):
+                ingested_file = ingest_csv(uploaded_file, TEMP_DATA_DIR)
+            ingested_file["file_id"] = uploaded_file.file_id
+            st.session_state.ingested_file = ingested_file
 
-        # Read in the uploaded file as a pandas dataframe
-        df = pd.read_csv(uploaded_file)
-        
-        # Create a file path
-        file_path = st.session_state.file_path = os.path.join(TEMP_DATA_DIR, "df.parquet")
-
-        # Save as parquet file
-        df.to_parquet(file_path, index=False)
+        st.session_state.file_path = ingested_file["file_path"]
+        columns = ingested_file["columns"]
+        st.caption(f"{ingested_file['num_rows']} rows, {len(columns)} columns")
 
+        # Resume a checkpointed analysis on the uploaded dataset; nodes whose reports exist
+        # and were produced from the same dataset and inputs are skipped
+        resume_thread_id = st.session_state.pop("resume_thread_id", None)
+        if resume_thread_id:
+            graph_response = graph_executor.resume_graph(resume_thread_id, ingested_file["file_path"],
+                                                         ingested_file["content_hash"])
+            if graph_response is None:
+                st.error(f"Error: No checkpoint found for thread {resume_thread_id}.")
+            else:
+                st.session_state.thread_id = graph_response["thread_id"]
+                st.session_state.eda_state = graph_response["eda_state"]
+                st.session_state.stage = graph_response["stage"]
+                st.rerun()
 
-        ### Graph Builder
-        graph_builder=GraphBuilder(model)
+        if st.session_state.thread_id:
+            st.caption(f"Thread ID: `{st.session_state.thread_id}`")
 
-        try:
-            graph = graph_builder.setup_graph()
-            graph_executor = GraphExecutor(graph)
+        # Per-node metrics of the current thread, exportable to compare runs across models
+        node_metrics = st.session_state.eda_state.get("node_metrics") if st.session_state.eda_state else None
+        if node_metrics:
+            with st.expander("Run Metrics"):
+                metrics_df = metrics_to_frame(node_metrics)
+                st.dataframe(metrics_df, hide_index=True)
+                col1, col2 = st.columns(2)
+                col1.download_button(
+                    label="Download Metrics (JSON)",
+                    data=metrics_df.to_json(orient="records", indent=2),
+                    file_name="node_metrics.json",
+                    mime="application/json",
+                )
+                col2.download_button(
+                    label="Download Metrics (CSV)",
+                    data=metrics_df.to_csv(index=False),
+                    file_name="node_metrics.csv",
+                    mime="text/csv",
+                )
 
-        except Exception as e:
-            st.error(f"Error: Graph setup failed - {e}")
-            return
-        
+        # Change the data dictionary or target metric of a running analysis.
+        # Only the stages whose inputs changed are re-run; the other reports are reused.
+        if st.session_state.stage not in ("START", const.PROFILE_DATA):
+            with st.expander("Edit Analysis Inputs"):
+                edited_data_dictionary = st.text_area(
+                    "Data dictionary:",
+                    value=st.session_state.eda_state.get("data_dictionary") or "",
+                    height=200,
+                    key="edited_data_dictionary",
+                )
+                current_kpi = st.session_state.eda_state.get("target_metric")
+                edited_kpi = st.selectbox(
+                    "Target metric:",
+                    options=columns,
+                    index=columns.index(current_kpi) if current_kpi in columns else 0,
+                    key="edited_kpi",
+                )
+                if st.button("Apply Changes"):
+                    graph_response = graph_executor.update_inputs(st.session_state.thread_id, st.session_state.eda_state, edited_data_dictionary.strip(), edited_kpi)
+                    st.session_state.eda_state = graph_response["eda_state"]
+                    st.session_state.stage = graph_response["stage"]
+                    st.session_state.data_dictionary = edited_data_dictionary.strip()
+                    st.session_state.kpi = edited_kpi
+                    st.rerun()
 
         
         # Initialize graph. Get file path into the AgentState
         if st.session_state.stage == "START" and st.session_state.file_path is not None:
-            default_data_dictionary = ":\n".join(df.columns)
+            default_data_dictionary = ":\n".join(columns)
             data_dictionary = st.text_area(
                     "Provide a data dictionary:",
                     value=default_data_dictionary,
                     height = 400)
-            kpi_list = df.columns.tolist()
+            kpi_list = columns
             kpi = st.selectbox(
                 "Select a taret metric of interest:",
                 options=kpi_list,
@@ -111,21 +155,47 @@ def load_langgraph_agenticai_app():
             if not kpi:
                 st.error("Please select a target metric to proceed.")
             else:
+                sample_rows = st.number_input(
+                    "Rows to sample for statistics and charts (0 uses all rows):",
+                    min_value=0,
+                    value=const.DEFAULT_SAMPLE_ROWS,
+                    step=10_000,
+                    help="Large datasets are profiled and plotted on a random sample; the bivariate analysis sample is stratified on the target metric. Missing values, counts and min/max are always computed on all rows.",
+                )
                 st.session_state.data_dictionary = data_dictionary.strip()
                 st.session_state.kpi = kpi.strip()
                 if st.button("Profile Data"):
+                    if user_input.get("selected_execution_mode") == const.AUTO_MODE:
+                        # Run the whole analysis at once; the analysis stages run in parallel
+                        with st.spinner("Running Analysis..."):
+                            graph_response = graph_executor.run_graph(st.session_state.file_path, st.session_state.data_dictionary, st.session_state.kpi, int(sample_rows) or None, ingested_file["content_hash"], on_event=StreamingEventDisplay())
+                        st.session_state.thread_id = graph_response["thread_id"]
+                        st.session_state.eda_state = graph_response["eda_state"]
+                        st.session_state.stage = const.END_NODE
+                        st.rerun()
                     with st.spinner("Initializing Graph..."):
-                        graph_response = graph_executor.initialize_graph(st.session_state.file_path, st.session_state.data_dictionary, st.session_state.kpi)
+                        graph_response = graph_executor.initialize_graph(st.session_state.file_path, st.session_state.data_dictionary, st.session_state.kpi, int(sample_rows) or None, ingested_file["content_hash"])
                     st.session_state.thread_id = graph_response["thread_id"]
                     st.session_state.eda_state = graph_response["eda_state"]
                     st.session_state.stage = const.PROFILE_DATA
                     st.rerun()
 
+        # Auto mode: finish a resumed or edited analysis in one run; only the out-of-date stages execute
+        if user_input.get("selected_execution_mode") == const.AUTO_MODE and st.session_state.stage not in ("START", const.END_NODE):
+            with st.spinner("Running Analysis..."):
+                graph_response = graph_executor.continue_graph(st.session_state.thread_id, st.session_state.eda_state, on_event=StreamingEventDisplay())
+            st.session_state.eda_state = graph_response["eda_state"]
+            st.session_state.stage = const.END_NODE
+            st.rerun()
+
+        # Each stage below streams its progress while it runs: node status, report sections
+        # as soon as they are complete and the LLM output being generated
+
         # Profile the data
         if st.session_state.stage == const.PROFILE_DATA:
             # st.write(st.session_state.eda_state)
             with st.spinner("Profiling Data..."):
-                graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.PROFILE_DATA)
+                graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.PROFILE_DATA, on_event=StreamingEventDisplay())
             st.session_state.eda_state = graph_response["eda_state"]
             st.session_state.stage = const.CLEAN_DATA
             st.rerun()
@@ -136,7 +206,7 @@ def load_langgraph_agenticai_app():
             st.write(st.session_state.eda_state["profile_report"])
             if st.button("Clean Data"):
                 with st.spinner("Cleaning Data"):
-                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.CLEAN_DATA)
+                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.CLEAN_DATA, on_event=StreamingEventDisplay())
                 st.session_state.eda_state = graph_response["eda_state"]
                 st.session_state.stage = const.SUMMARIZE_DATA
                 st.rerun() 
@@ -147,7 +217,7 @@ def load_langgraph_agenticai_app():
             st.write(st.session_state.eda_state["data_cleaning_report"])
             if st.button("Summarize Data"):
                 with st.spinner("Summarizing Data"):
-                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.SUMMARIZE_DATA)
+                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.SUMMARIZE_DATA, on_event=StreamingEventDisplay())
                 st.session_state.eda_state = graph_response["eda_state"]
                 st.session_state.stage = const.GENERATE_UNIVARIATE_REPORT
                 st.rerun()
@@ -158,7 +228,7 @@ def load_langgraph_agenticai_app():
             st.write(st.session_state.eda_state["stats_summary_report"])
             if st.button("Generate Univariate Report"):
                 with st.spinner("Generating Univariate Report"):
-                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_UNIVARIATE_REPORT)
+                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_UNIVARIATE_REPORT, on_event=StreamingEventDisplay())
                 st.session_state.eda_state = graph_response["eda_state"]
                 st.session_state.stage = const.GENERATE_BIVARIATE_REPORT
                 st.rerun()
@@ -166,10 +236,10 @@ def load_langgraph_agenticai_app():
         # Generate bivariate analysis report
         if st.session_state.stage == const.GENERATE_BIVARIATE_REPORT:
             # st.write(st.session_state.eda_state)
-            st.write(st.session_state.eda_state["univariate_analysis_report"])
+            display_report(st.session_state.eda_state["univariate_analysis_report"])
             if st.button("Generate Bivariate Report"):
                 with st.spinner("Generating Bivariate Report"):
-                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_BIVARIATE_REPORT)
+                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_BIVARIATE_REPORT, on_event=StreamingEventDisplay())
                 st.session_state.eda_state = graph_response["eda_state"]
                 st.session_state.stage = const.GENERATE_FINAL_REPORT
                 st.rerun()
@@ -177,10 +247,10 @@ def load_langgraph_agenticai_app():
         # Generate final recommendations
         if st.session_state.stage == const.GENERATE_FINAL_REPORT:
             # st.write(st.session_state.eda_state)
-            st.write(st.session_state.eda_state["bivariate_analysis_report"])
+            display_report(st.session_state.eda_state["bivariate_analysis_report"])
             if st.button("Generate Final Recommendations"):
                 with st.spinner("Generating Final Recommendations"):
-                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_FINAL_REPORT)
+                    graph_response = graph_executor.graph_execution(st.session_state.thread_id, st.session_state.eda_state, const.GENERATE_FINAL_REPORT, on_event=StreamingEventDisplay())
                 st.session_state.eda_state = graph_response["eda_state"]
                 st.session_state.stage = const.END_NODE
                 st.rerun()
@@ -193,22 +263,16 @@ def load_langgraph_agenticai_app():
                 st.write(st.session_state.eda_state.get("stats_summary_report", "No summary statistics available."))
 
             with st.expander("Univariate Analysis"):
-                st.write(st.session_state.eda_state.get("univariate_analysis_report", "No univariate report available."))
+                display_report(st.session_state.eda_state.get("univariate_analysis_report", "No univariate report available."))
 
             with st.expander("Bivariate Analysis"):
-                st.write(st.session_state.eda_state.get("bivariate_analysis_report", "No bivariate report available."))
+                display_report(st.session_state.eda_state.get("bivariate_analysis_report", "No bivariate report available."))
 
             with st.expander("Recommendations", expanded=True):
                 st.write(st.session_state.eda_state.get("final_report", "No final report available."))
         
             # Prepare full report as Markdown
-            full_report_md = (
-                "# Full Data Analysis Report\n\n"
-                f"{st.session_state.eda_state["stats_summary_report"]}\n\n"
-                f"{st.session_state.eda_state["univariate_analysis_report"]}\n\n"
-                f"{st.session_state.eda_state["bivariate_analysis_report"]}\n\n"
-                f"{st.session_state.eda_state["final_report"]}\n"
-            )
+            full_report_md = build_full_report(st.session_state.eda_state)
         
             st.download_button(
                 label="Download Full Data Analysis Report(Markdown)",
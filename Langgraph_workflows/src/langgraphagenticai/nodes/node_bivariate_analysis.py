@@ -1,11 +1,21 @@
 import pandas as pd
-import matplotlib.pyplot as plt 
-import seaborn as sns
 from tabulate import tabulate
 import os
 import numpy as np
-from src.langgraphagenticai.utils.encode_image_to_base64 import encode_image_to_base64
+from src.langgraphagenticai.utils.image_store import image_markdown
+from src.langgraphagenticai.utils.concurrent_llm import invoke_llm_concurrently
+from src.langgraphagenticai.utils.progress_events import emit_event
+from src.langgraphagenticai.utils.boxplot_stats import grouped_boxplot_stats
+from src.langgraphagenticai.utils.chart_rendering import render_charts, render_correlation_heatmap, render_category_boxplot, render_stacked_bar, render_scatter
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.clean_directory import clean_directory
+from src.langgraphagenticai.utils.sampling import sample_dataframe, sampling_label
+from src.langgraphagenticai.utils.column_profile import get_column_profile
+from src.langgraphagenticai.graph.input_tracking import dataset_identity
+from src.langgraphagenticai.utils.cleaned_data import require_cleaned_data
+from src.langgraphagenticai.utils.prompt_budget import compact_table, top_correlations
+import src.langgraphagenticai.utils.constants as const
 from pandas.api.types import is_numeric_dtype
 
 class node_bivariate_analysis:
@@ -28,155 +38,94 @@ class node_bivariate_analysis:
         Returns:
             dict: A dictionary with boxplot data.
         """
+        return grouped_boxplot_stats(df, [numeric_col], categorical_col)[numeric_col]
 
-        bivariate_boxplot_data = {}
-
-        # Get unique categories
-        # Convert to list to iterate over
-        categories = df[categorical_col].unique().tolist()
-
-        for category in categories:
-            series = df[df[categorical_col] == category][numeric_col]
-
-            # Calculate quartiles and median
-            q1 = series.quantile(0.25)
-            median = series.quantile(0.5)
-            q3 = series.quantile(0.75)
-            
-            iqr = q3 - q1
-            
-            # Calculate outlier fences
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-            
-            # Determine absolute min and max values of the series
-            min_value = series.min()
-            max_value = series.max()
-
-            # Check if outliers exist
-            lower_outliers = bool((series < lower_bound).any())
-            upper_outliers = bool((series > upper_bound).any())
-
-            bivariate_boxplot_data[category] = {
-                'q1': q1,
-                'median': median,
-                'q3': q3,
-                'min_value': min_value,
-                'max_value': max_value,
-                'iqr': iqr,
-                'lower_outliers': lower_outliers,
-                'upper_outliers': upper_outliers,
-            }
+    def bivariate(self, df: pd.DataFrame, file_path:str, kpi:str, column_profile: dict):
+        """
+        Performs bivariate analysis of the KPI against the other columns and generates visualizations.
 
-        return bivariate_boxplot_data
+        Args:
+            df (pd.DataFrame): Input dataframe to analyze
+            file_path (str): Path of the cleaned data file; the charts are saved in its directory
+            kpi (str): Target metric of interest
+            column_profile (dict): Column statistics of the cleaned data (see utils.column_profile)
 
-    def bivariate(self, df: pd.DataFrame, file_path:str, kpi:str):
+        Returns:
+            list: List of tuples with visualization titles, file paths and data
+        """
+        parentdir_path = os.path.dirname(file_path) # the thread's artifact directory
+        imgdir_path = os.path.join(parentdir_path, "images", "bivariate")
 
-        visualizations = []
-        parentdir_path = os.path.dirname(file_path) # route to TEMP_DATA_DIR
-        imgdir_path = os.path.join(parentdir_path, "images") # this directory should already exists as we created it during univariate analysis
+        # Check if directory exists; if it exists, then clean it
+        # If directory doesn't exist, then create it
+        clean_directory(imgdir_path)
 
         # Get numeric cols and categorical cols
-        numeric_cols = df.select_dtypes(include=np.number).columns.to_list()
-        categorical_cols = [col for col in df.select_dtypes(include=['object', 'category']) if df[col].nunique() < 20]
+        numeric_cols = column_profile["numeric_columns"]
+        categorical_cols = column_profile["categorical_columns"]
+        # Correlation matrix of the numeric columns, computed once in the column profile
+        corr = column_profile["correlation"]
 
         try:
+            chart_specs = []
+
             # Correlation chart for Numeric Columns
             if len(numeric_cols) > 1:
-                plt.figure(figsize=(12, 8))
-                corr = df[numeric_cols].corr()
-                sns.heatmap(corr, annot=True, fmt=".2f", cmap='Spectral',vmin=-1,vmax=1)
-                plt.title("Correlation Heatmap of Numeric Features")
                 path = os.path.abspath(os.path.join(imgdir_path, "Correlation_heatmap.png"))
-                plt.savefig(path, bbox_inches='tight')
-                plt.close();
-                
-                corr_data = df[numeric_cols].corr().to_markdown()
-                corr_report = f"Correlation Heatmap data\n\n{corr_data}\n\n"
-                visualizations.append(("Correlation Heatmap of Numeric Features", path, corr_report))    
+                # Only the strongest pairs are sent to the LLM; the heatmap shows the full matrix
+                corr_data = compact_table(top_correlations(corr), index=False)
+                corr_report = f"Correlation Heatmap data (CSV, up to {const.CORRELATION_TOP_K} strongest pairs of {len(numeric_cols)} numeric columns)\n\n{corr_data}\n\n"
+                chart_specs.append(("Correlation Heatmap of Numeric Features", path, corr_report,
+                                    render_correlation_heatmap, {"corr": corr}))
 
             # Box Plots for Categorical KPI against Numeric Columns
             if df[kpi].dtype in ['object', 'category']: 
                 if len(numeric_cols) >= 1:                    
+                    # Boxplot statistics of all numeric columns by KPI in one grouped pass
+                    kpi_boxplot_data = grouped_boxplot_stats(df, numeric_cols, kpi)
                     for num_col in numeric_cols:
-                        plt.figure(figsize=(10, 6))
-                        sns.boxplot(x=df[kpi], 
-                                    y=df[num_col], 
-                                    hue = df[kpi], 
-                                    legend = False,
-                                    order=df.groupby(kpi, observed=False)[num_col].median().sort_values(ascending=False).index
-                                    )
-                        plt.title(f"Box Plot of {num_col} by {kpi}")
-                        plt.xlabel(kpi)
-                        plt.ylabel(num_col)
-                        if df[kpi].nunique() > 10:
-                            plt.xticks(rotation=270)
+                        title = f"Box Plot of {num_col} by {kpi}"
                         path = os.path.abspath(os.path.join(imgdir_path, f"Boxplot_{num_col}_vs_{kpi}.png"))
-                        plt.savefig(path, bbox_inches='tight')
-                        plt.close();
-                        boxplot_data = self.get_boxplot_data(df, num_col, kpi)
+                        boxplot_data = kpi_boxplot_data[num_col]
                         print(boxplot_data)
                         boxplot_report = f"""Box Plot data of {num_col} by {kpi}\n\n{boxplot_data}\n\n"""
-                        visualizations.append((f"Box Plot of {num_col} by {kpi}", path, boxplot_report))
+                        chart_specs.append((title, path, boxplot_report, render_category_boxplot,
+                                            {"df": df[[kpi, num_col]], "categorical_col": kpi, "numeric_col": num_col, "title": title}))
             
                 # Stacked Bar Chart for Categorical KPI against Categorical Columns
                 if len(categorical_cols) >= 2:
                     for cat_col in categorical_cols:
                         if cat_col != kpi:
-                            count = df[cat_col].nunique()
                             sorter = df[kpi].value_counts().index[-1]
                             tab = pd.crosstab(df[cat_col], df[kpi], normalize="index").sort_values(by=sorter, ascending=False)
-                            plt.figure(figsize=(count + 5, 6))
-                            tab.plot(kind='bar', stacked=True, colormap='Spectral')
-                            plt.title(f"Stacked Bar Chart of {cat_col} by {kpi}")
-                            plt.legend(loc="upper left", bbox_to_anchor=(1, 1))
-                            plt.xlabel(cat_col)
-                            plt.ylabel(kpi)
-                            if df[cat_col].nunique() > 10:
-                                plt.xticks(rotation=270)
                             path = os.path.abspath(os.path.join(imgdir_path, f"Stacked_Bar_{kpi}_vs_{cat_col}.png"))
-                            plt.savefig(path, bbox_inches='tight')
-                            plt.close();
-                            
                             stacked_bar_data = tab.to_markdown()
                             stacked_bar_report = f"Stacked Bar Chart data of {kpi} by {cat_col}\n\n{stacked_bar_data}\n\n"
-                            visualizations.append((f"Stacked Bar Chart of {kpi} by {cat_col}", path, stacked_bar_report))
+                            chart_specs.append((f"Stacked Bar Chart of {kpi} by {cat_col}", path, stacked_bar_report,
+                                                render_stacked_bar, {"tab": tab, "categorical_col": cat_col, "kpi": kpi}))
 
             # Scatter Plots for Numerical KPI against Numeric Columns
             if is_numeric_dtype(df[kpi]):
                 if len(numeric_cols) >= 2:
                     for num_col in numeric_cols:
                         if num_col != kpi:
-                            plt.figure(figsize=(10, 6))
-                            sns.scatterplot(x=df[num_col], y=df[kpi], palette='Spectral')
-                            plt.title(f"Scatter Plot of {kpi} vs {num_col}")
-                            plt.xlabel(num_col)
-                            plt.ylabel(kpi)
                             path = os.path.abspath(os.path.join(imgdir_path, f"Scatter_{kpi}_vs_{num_col}.png"))
-                            plt.savefig(path, bbox_inches='tight')
-                            plt.close();
-                            
-                            scatter_data = df[[kpi, num_col]].corr().to_markdown()
+                            scatter_data = corr.loc[[kpi, num_col], [kpi, num_col]].to_markdown()
                             scatter_report = f"Scatter Plot data of {kpi} vs {num_col}\n\n{scatter_data}\n\n"
-                            visualizations.append((f"Scatter Plot of {kpi} vs {num_col}", path, scatter_report))
+                            chart_specs.append((f"Scatter Plot of {kpi} vs {num_col}", path, scatter_report,
+                                                render_scatter, {"df": df[[kpi, num_col]], "x_col": num_col, "y_col": kpi}))
 
                 if len(categorical_cols) >= 1:
                     for cat_col in categorical_cols:
-                        plt.figure(figsize=(10, 6))
-                        sns.boxplot(x=df[cat_col], y=df[kpi], palette='Spectral', hue = df[cat_col], legend=False,
-                                    order=df.groupby(cat_col, observed=False)[kpi].median().sort_values(ascending=False).index)
-                        plt.title(f"Box Plot of {kpi} by {cat_col}")
-                        plt.xlabel(cat_col)
-                        plt.ylabel(kpi)
-                        if df[cat_col].nunique() > 10:
-                            plt.xticks(rotation=270)
+                        title = f"Box Plot of {kpi} by {cat_col}"
                         path = os.path.abspath(os.path.join(imgdir_path, f"Boxplot_{kpi}_vs_{cat_col}.png"))
-                        plt.savefig(path, bbox_inches='tight')
-                        plt.close();
-                        
                         boxplot_data = self.get_boxplot_data(df, kpi, cat_col)
                         boxplot_report = f"Box Plot data of {kpi} by {cat_col}\n\n{boxplot_data}\n\n"
-                        visualizations.append((f"Box Plot of {kpi} by {cat_col}", path, boxplot_report))
+                        chart_specs.append((title, path, boxplot_report, render_category_boxplot,
+                                            {"df": df[[cat_col, kpi]], "categorical_col": cat_col, "numeric_col": kpi, "title": title}))
+
+            # Render all charts in parallel
+            visualizations = render_charts(chart_specs)
 
         except Exception as e:
             print({e})
@@ -194,23 +143,24 @@ class node_bivariate_analysis:
             str: The complete report with visualizations and their analyses.
         """
         try:
-            # Get file path from state and read the file
-            file_path = state.get("data_file_path", None)
-            parentdir_path = os.path.join(os.path.dirname(file_path), "df_updated.feather")
-
-            if parentdir_path is None:
-                raise ValueError(f"{parentdir_path} does not exist.")   
+            # Get the cleaned data file recorded by data cleaning and read it
+            parentdir_path = require_cleaned_data(state.get("cleaned_file_path"), dataset_identity(state))
             
-            # Read the file and store it in the state
-            df = pd.read_feather(parentdir_path)
+            # Read the cleaned data (or reuse the cached dataframe)
+            df = dataframe_cache.load(parentdir_path, state.get("thread_id"))
             
             if df is None or df.empty:
                 raise ValueError("Input data is required for profiling.")
             
             kpi = state.get("target_metric", None)
             
-            # Call univariate analysis
-            visualizations = self.bivariate(df, str(file_path), kpi)
+            # Charts and their statistics are computed on a sample stratified on the target metric
+            sample_df = sample_dataframe(df, state.get("sample_rows"), kpi)
+            column_profile = get_column_profile(parentdir_path, df, state.get("sample_rows"), dataset_identity(state))
+
+            # Call bivariate analysis
+            visualizations = self.bivariate(sample_df, parentdir_path, kpi, column_profile)
+            emit_event({"type": "progress", "node": "bivariate_analysis", "message": f"Rendered {len(visualizations)} chart(s), analyzing them..."})
 
             data_dictionary = state.get("data_dictionary", "")
 
@@ -281,13 +231,9 @@ class node_bivariate_analysis:
             Please structure your response as a Markdown report with clear headings and bullet points.
             """
 
-            # Analyze each visualization using the vision_analysis function
-            report_content = "## Bivariate Analysis Report\n\n"
-        
+            # Build the prompt for each visualization
+            prompts = []
             for title, img_path, data in visualizations:
-                encoded_image = encode_image_to_base64(img_path)
-                image_markdown_tag = f"![{title}](data:image/png;base64,{encoded_image})"
-                report_content += f"### {title}\n\n{image_markdown_tag}\n\n"
                 if "Correlation" in title:
                     prompt_text = prompt_correlation.format(chart_data=data, data_dictionary=data_dictionary)
                 elif "Box Plot" in title:
@@ -296,9 +242,24 @@ class node_bivariate_analysis:
                     prompt_text = prompt_stackedbarplot.format(chart_data=data, data_dictionary=data_dictionary)
                 elif "Scatter Plot" in title:
                     prompt_text = prompt_scatterplot.format(chart_data=data, data_dictionary=data_dictionary)
-                response = self.llm.invoke(prompt_text)
-                analysis_results = response.content if response else "No content returned from LLM."
-                report_content += f"{analysis_results}"
+                prompts.append(prompt_text)
+
+            # Analyze all visualizations concurrently. Each chart section is sent to the event stream
+            # as soon as its analysis completes; the report keeps the original visualization order
+            sections = [""] * len(visualizations)
+
+            def add_section(index, analysis_result):
+                title, img_path, data = visualizations[index]
+                # Reference the chart in the image store instead of inlining it in the State
+                image_markdown_tag = image_markdown(title, img_path)
+                sections[index] = f"### {title}\n\n{image_markdown_tag}\n\n{analysis_result}"
+                emit_event({"type": "section", "node": "bivariate_analysis", "title": title, "content": sections[index]})
+
+            invoke_llm_concurrently(self.llm, prompts, on_result=add_section)
+
+            report_content = "## Bivariate Analysis Report\n\n"
+            report_content += sampling_label(len(sample_df), len(df))
+            report_content += "".join(sections)
         
             state["bivariate_analysis_report"] = report_content
             
@@ -1,7 +1,12 @@
-from src.langgraphagenticai.tools.coding_tool import python_exec_tool_func
+from src.langgraphagenticai.tools.sandbox_executor import run_in_sandbox
 from src.langgraphagenticai.utils.code_utils import extract_code
 import pandas as pd
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.sampling import sample_dataframe
+from src.langgraphagenticai.utils.column_profile import compute_column_profile, save_column_profile, column_profile_path
+from src.langgraphagenticai.graph.input_tracking import dataset_identity
+from src.langgraphagenticai.utils.cleaned_data import cleaned_data_path
 import os
 from langgraph.prebuilt import create_react_agent
 
@@ -23,14 +28,16 @@ class node_data_cleaning:
             if file_path is None:
                 raise ValueError("File path is required for data cleaning.")   
             
-            # Read the file
-            df = pd.read_parquet(file_path)
+            # Read the file (or reuse the cached dataframe)
+            df = dataframe_cache.load(file_path, state.get("thread_id"))
             
             if df is None or df.empty:
                 raise ValueError("Input data is required for cleaning.")
             
             file_path = state['data_file_path']
-            parentdir_path = os.path.join(os.path.dirname(file_path),  "df_updated.feather")
+            # The cleaned data is stored in the thread's own directory
+            parentdir_path = cleaned_data_path(file_path, state.get("thread_id"))
+            os.makedirs(os.path.dirname(parentdir_path), exist_ok=True)
 
             # print(f"Parent directory: {parentdir_path}")
             profile_report = state["profile_report"]
@@ -114,15 +121,27 @@ class node_data_cleaning:
 
             code_explanation = self.llm.invoke(f""" Explain this code {code} in a concise manner""").content
 
-            data_cleaning_report = f"""Data Cleaning Code\n```python{code}```\n\nExplanation\n{code_explanation}"""
-
-            df_updated = python_exec_tool_func(df, code)
-            print(df_updated.info())
+            # Run the generated code in a time- and memory-limited sandbox process;
+            # the cached input dataframe is only read, never modified
+            df_updated, exec_stats = run_in_sandbox(df, code)
+            df_updated.info()
 
-            df_updated.to_feather(parentdir_path)
-
-            df_updated2 = pd.read_feather(parentdir_path)
-            print(df_updated2.info())
+            data_cleaning_report = f"""Data Cleaning Code\n```python{code}```\n\nExplanation\n{code_explanation}"""
+            data_cleaning_report += (f"\n\nExecution\n"
+                                     f"- Code execution time: {exec_stats['exec_seconds']} s "
+                                     f"(sandbox total: {exec_stats['sandbox_seconds']} s)\n"
+                                     f"- Sandbox peak memory: {exec_stats['peak_rss_mb']} MB\n"
+                                     f"- Rows: {len(df):,} before, {len(df_updated):,} after\n")
+
+            # Keep the cleaned dataframe in memory for the next nodes; it is persisted in the background
+            dataframe_cache.store(df_updated, parentdir_path, state.get("thread_id"))
+            state["cleaned_file_path"] = parentdir_path
+
+            # Compute the column statistics of the cleaned data once; the analysis nodes read them from the profile
+            sample_rows = state.get("sample_rows")
+            column_profile = compute_column_profile(sample_dataframe(df_updated, sample_rows), len(df_updated), sample_rows,
+                                                    dataset_identity(state))
+            save_column_profile(column_profile, column_profile_path(parentdir_path))
 
             state["data_cleaning_report"] = data_cleaning_report
           
@@ -1,7 +1,8 @@
 import pandas as pd
-import io
 from src.langgraphagenticai.state.state import State
-from langgraph.prebuilt import create_react_agent
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.sampling import sample_dataframe, sampling_label, column_aggregates
+from src.langgraphagenticai.utils.prompt_budget import compact_value, analyze_in_column_batches
 
 class node_data_profiling:
     def __init__(self, model):
@@ -21,36 +22,38 @@ class node_data_profiling:
             if file_path is None:
                 raise ValueError("File path is required for profiling.")   
             
-            # Read the file and store it in the state
-            df = pd.read_parquet(file_path)
+            # Read the file (or reuse the cached dataframe)
+            df = dataframe_cache.load(file_path, state.get("thread_id"))
             
             if df is None or df.empty:
                 raise ValueError("Input data is required for profiling.")
             
-            buf = io.StringIO()
-            df.info(buf=buf)
-            metadata = buf.getvalue()
-            head = df.head().to_markdown(index=False)
-            missing = df.isnull().sum()
-            missing = missing[missing > 0]
-            missing_info = "No missing values." if missing.empty else str(missing)
-            summary_stats = df.describe(include='all').transpose().to_markdown()
+            # Exact counts, missing values and min/max are computed on the loaded dataframe in one vectorized pass
+            # (no second read of the file). The summary statistics are computed on a random sample
+            # (independent of the target metric).
+            aggregates = column_aggregates(df)
+            sample_df = sample_dataframe(df, state.get("sample_rows"))
+            sample_note = sampling_label(len(sample_df), len(df))
+
+            # One compact row per column: exact aggregates, sample statistics and the first values.
+            # Wide datasets are analyzed in column batches that fit the prompt token budget.
+            summary_stats = sample_df.describe(include='all').transpose()
+            column_table = aggregates.join(summary_stats.drop(columns=["count", "min", "max"], errors="ignore"))
+            column_table["first_values"] = [" | ".join(compact_value(value) for value in df[col].head(3)) for col in df.columns]
 
             data_dictionary = state.get("data_dictionary", "")
 
-            content = f"""
+            def build_prompt(table, batch_label, data_dictionary):
+                content = f"""
             ## Data Profiling Report\n
-            ### Metadata\n
-            ```{metadata}```\n\n
-            ### Preview\n
-            {head}\n\n
-            ### Missing Values\n
-            {missing_info}\n
-            ### Missing Values\n
-            {summary_stats}
+            Rows: {len(df):,}, Columns: {df.shape[1]} (this part covers {batch_label})\n
+            ### Column Statistics (CSV)\n
+            type, count, missing, missing_pct, min and max are computed on all rows; the other statistics on the sample.
+            {sample_note}
+            {table}
             """
 
-            prompt = f"""
+                return f"""
             You are a data profiling expert. Analyze the following data with the context from data dictionary and provide a detailed report.
             Follow these instructions step by step and generate a comprehensice report
             1. Get Number of rows and columns
@@ -82,15 +85,17 @@ class node_data_profiling:
             ```{data_dictionary}```
 
             """
-            agent = create_react_agent(model=self.llm,
-                                       tools=[],
-                                       prompt = prompt
-                                       )
-            response = agent.invoke({"messages:": [{"role": "user", "content": "Analyze the following data with the context from data dictionary and provide a detailed report."}]},
-             {"recursion_limit":7}
-             )
 
-            state["profile_report"] = response['messages'][-1].content if response else "No content returned from LLM."
+            merge_prompt = """
+            You are a data profiling expert. The following reports each profile a different set of columns of the same dataset.
+            Merge them into one detailed data profiling report with the same structure, keeping every column-specific
+            recommendation (data types, anomalies, outliers, duplicates and missing values).
+
+            {reports}
+            """
+
+            profile_report = analyze_in_column_batches(self.llm, column_table, build_prompt, merge_prompt, data_dictionary)
+            state["profile_report"] = f"{sample_note}{profile_report}"
             
         except Exception as e:
             state["error_message"].append(f"Error in profiling input data: {str(e)}\n\n")
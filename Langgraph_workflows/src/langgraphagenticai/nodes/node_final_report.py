@@ -1,10 +1,7 @@
-import nltk
-from langchain_community.document_loaders import UnstructuredMarkdownLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_core.documents import Document
-import os
-from langchain.chains.summarize import load_summarize_chain
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.utils.concurrent_llm import invoke_llm_concurrently
+from src.langgraphagenticai.utils.markdown_chunking import split_markdown
+import src.langgraphagenticai.utils.constants as const
 from langchain_core.prompts import PromptTemplate
 
 class node_final_report:
@@ -15,17 +12,52 @@ class node_final_report:
         """
         self.llm = model
 
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except Exception as e:
-            print("Downloading NLTK 'punkt' tokenizer data...")
-            nltk.download('punkt')
+        chunks_prompt="""
+        You are an expert data analyst. Review the analysis report and summarize the findings.
+                
+        Here is the analysis report to review:
+        {text}
 
-        try:
-            nltk.data.find('taggers/averaged_perceptron_tagger')
-        except Exception as e:
-            print("Downloading NLTK 'averaged_perceptron_tagger' data...")
-            nltk.download('averaged_perceptron_tagger')
+        Summary:
+        """
+        self.map_prompt_template=PromptTemplate(input_variables=['text'],
+                                                template=chunks_prompt)
+        
+        final_prompt='''
+        You are an expert data analyst. Review the analysis report and share your conclusions and recommendations to improve the business.
+
+        Your output should have
+        - Conclusions based on the data analysis
+        - Recommendations to the business
+
+        Structure your output in markdown format.
+
+        Here are the analysis report to review:
+        {text}
+
+        '''
+        self.final_prompt_template=PromptTemplate(input_variables=['text'],template=final_prompt)
+
+
+    def summarize(self, texts:list) -> list:
+        """
+        Summarizes each text with the map prompt, with bounded concurrency.
+        """
+        prompts = [self.map_prompt_template.format(text=text) for text in texts]
+        return invoke_llm_concurrently(self.llm, prompts)
+
+
+    def group_summaries(self, summaries:list) -> list:
+        """
+        Packs consecutive summaries into texts of at most FINAL_REPORT_REDUCE_MAX_CHARS characters.
+        """
+        groups = []
+        for summary in summaries:
+            if groups and len(groups[-1]) + len(summary) + 2 <= const.FINAL_REPORT_REDUCE_MAX_CHARS:
+                groups[-1] += "\n\n" + summary
+            else:
+                groups.append(summary)
+        return groups
 
 
     def run(self, state:State):
@@ -38,63 +70,21 @@ class node_final_report:
 
             final_report = f"""{univariate_analysis_report}\n\n{bivariate_analysis_report}\n\n"""
 
-             # Get file path from state and read the file
-            file_path = state.get("data_file_path", None)
-            if file_path is None:
-                raise ValueError("File path is required for profiling.")   
-            
-            parentdir_path = os.path.dirname(file_path)
-            finalreport_path = os.path.abspath(os.path.join(parentdir_path, "final_report.md"))
-
-            with open(finalreport_path, "w", encoding="utf-8") as f:
-                f.write(final_report)
-            
-            # Load markdown file
-            loader = UnstructuredMarkdownLoader(finalreport_path)
-            data = loader.load()
-
-            #  Apply chunking
-            final_documents=RecursiveCharacterTextSplitter(chunk_size=2000,chunk_overlap=100).split_documents(data)
-            final_documents
-
-            chunks_prompt="""
-            You are an expert data analyst. Review the analysis report and summarize the findings.
-                    
-            Here is the analysis report to review:
-            {text}
-
-            Summary:
-            """
-            map_prompt_template=PromptTemplate(input_variables=['text'],
-                                                template=chunks_prompt)
-            
-            final_prompt='''
-            You are an expert data analyst. Review the analysis report and share your conclusions and recommendations to improve the business.
-
-            Your output should have
-            - Conclusions based on the data analysis
-            - Recommendations to the business
-
-            Structure your output in markdown format.
-
-            Here are the analysis report to review:
-            {text}
-
-            '''
-            final_prompt_template=PromptTemplate(input_variables=['text'],template=final_prompt)
-
+            # Split the combined report in memory, without its chart images
+            final_documents = split_markdown(final_report)
 
-            summary_chain=load_summarize_chain(
-            llm=self.llm,
-            chain_type="map_reduce",
-            map_prompt=map_prompt_template,
-            combine_prompt=final_prompt_template,
-            verbose=True
-            )
+            # Map: summarize the chunks concurrently, then collapse the summaries until they fit the final prompt
+            summaries = self.summarize(final_documents)
+            while len(summaries) > 1 and len("\n\n".join(summaries)) > const.FINAL_REPORT_REDUCE_MAX_CHARS:
+                groups = self.group_summaries(summaries)
+                if len(groups) == len(summaries):
+                    break
+                summaries = self.summarize(groups)
 
-            output=summary_chain.invoke(final_documents)
+            # Reduce: conclusions and recommendations from the combined summaries
+            response = self.llm.invoke(self.final_prompt_template.format(text="\n\n".join(summaries)))
 
-            state["final_report"] = output['output_text']
+            state["final_report"] = response.content if response else "No content returned from LLM."
 
             
         except Exception as e:
@@ -1,6 +1,12 @@
 import pandas as pd
 from tabulate import tabulate   
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.sampling import sampling_label
+from src.langgraphagenticai.utils.column_profile import get_column_profile
+from src.langgraphagenticai.graph.input_tracking import dataset_identity
+from src.langgraphagenticai.utils.cleaned_data import require_cleaned_data
+from src.langgraphagenticai.utils.prompt_budget import analyze_in_column_batches
 import os
 
 class node_stats_summary:
@@ -15,26 +21,26 @@ class node_stats_summary:
         Runs the node to generate stats summary report.
         """
         try:
-            # Get file path from state and read the file
-            file_path = state.get("data_file_path", None)
-            parentdir_path = os.path.join(os.path.dirname(file_path), "df_updated.feather")
-
-            if parentdir_path is None:
-                raise ValueError(f"{parentdir_path} does not exist.")   
+            # Get the cleaned data file recorded by data cleaning and read it
+            parentdir_path = require_cleaned_data(state.get("cleaned_file_path"), dataset_identity(state))
             
-            # Read the file and store it in the state
-            df = pd.read_feather(parentdir_path)
+            # Read the cleaned data (or reuse the cached dataframe)
+            df = dataframe_cache.load(parentdir_path, state.get("thread_id"))
             
             if df is None or df.empty:
                 raise ValueError("Input data is required for profiling.")
             
-            summary_stats = df.describe(include='all').transpose().to_markdown()
+            # Summary statistics come from the column profile of the cleaned data,
+            # computed on a random sample (independent of the target metric)
+            column_profile = get_column_profile(parentdir_path, df, state.get("sample_rows"), dataset_identity(state))
             # summary_stats_tab = tabulate(summary_stats, headers='keys', tablefmt='pipe')
 
             data_dictionary = state.get("data_dictionary", "")
 
-            # Summarize the observations from the summary statistics
-            prompt = f"""
+            # Summarize the observations from the summary statistics.
+            # The statistics are sent as compact CSV; wide datasets are analyzed in column batches
+            def build_prompt(summary_stats, batch_label, data_dictionary):
+                return f"""
             You are a data analyst. Analyze the following summary statistics of the DataFrame utilizing the context in data dictionary and provide a concise report.
             Your report should include the following details:
             - Summary statistics data table
@@ -43,17 +49,26 @@ class node_stats_summary:
 
             **Leverage the data dictionary context to incorporate any domain-specific insights.**
 
-            Here is the summary statistics you need to analyze:
+            Here is the summary statistics (CSV, {batch_label}) you need to analyze:
             ```{summary_stats}```
 
             Here is the data dictionary you need to understand the context of the data:
             ```{data_dictionary}```
             """
-            response = self.llm.invoke(prompt)
-            results = response.content if response else "No content returned from LLM."
+
+            merge_prompt = """
+            You are a data analyst. The following reports each analyze the summary statistics of a different set of columns of the same DataFrame.
+            Merge them into one concise report with a summary statistics data table, observations on the distribution
+            of numeric columns and observations on the distribution of categorical columns.
+
+            {reports}
+            """
+
+            results = analyze_in_column_batches(self.llm, column_profile["stats"], build_prompt, merge_prompt, data_dictionary)
 
             stats_summary_report = f"""
             ## Summary Statistics Analysis Report\n\n
+            {sampling_label(column_profile["sample_size"], column_profile["total_rows"])}
             {results}\n\n 
             """
             state["stats_summary_report"] = stats_summary_report
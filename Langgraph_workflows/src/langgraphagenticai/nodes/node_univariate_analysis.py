@@ -1,12 +1,20 @@
 import pandas as pd
-import matplotlib.pyplot as plt 
-import seaborn as sns
 from tabulate import tabulate
 import os
 import numpy as np
 from src.langgraphagenticai.utils.clean_directory import clean_directory
-from src.langgraphagenticai.utils.encode_image_to_base64 import encode_image_to_base64
+from src.langgraphagenticai.utils.image_store import image_markdown
+from src.langgraphagenticai.utils.concurrent_llm import invoke_llm_concurrently
+from src.langgraphagenticai.utils.progress_events import emit_event
+from src.langgraphagenticai.utils.boxplot_stats import boxplot_stats
+from src.langgraphagenticai.utils.chart_rendering import render_charts, render_histograms, render_boxplots, render_countplots
 from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.sampling import sample_dataframe, sampling_label
+from src.langgraphagenticai.utils.column_profile import get_column_profile, numeric_summary
+from src.langgraphagenticai.graph.input_tracking import dataset_identity
+from src.langgraphagenticai.utils.cleaned_data import require_cleaned_data
+from src.langgraphagenticai.utils.prompt_budget import compact_table
 
 class node_univariate_analysis:
     def __init__(self, model):
@@ -36,139 +44,72 @@ class node_univariate_analysis:
                         'min_value': float,  # Absolute minimum value in the series
                         'max_value': float,  # Absolute maximum value in the series
                         'iqr': float,
-                        'outlier_exists': bool
+                        'lower_outliers': bool,
+                        'upper_outliers': bool
                     },
                     ...
                 }
                 Returns an empty dictionary if no numeric columns are found.
         """
-        boxplot_data = {}
-        
-        for col in df.columns.to_list():
-
-            series = df[col]
-
-            # Calculate quartiles and median
-            q1 = series.quantile(0.25)
-            median = series.quantile(0.5)
-            q3 = series.quantile(0.75)
-            
-            iqr = q3 - q1
-            
-            # Calculate outlier fences
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-            
-            # Determine absolute min and max values of the series
-            min_value = series.min()
-            max_value = series.max()
+        return boxplot_stats(df)
 
-            # Check if outliers exist
-            lower_outliers = bool((series < lower_bound).any())
-            upper_outliers = bool((series > upper_bound).any())
-            
-            boxplot_data[col] = {
-                'q1': q1,
-                'median': median,
-                'q3': q3,
-                'min_value': min_value,
-                'max_value': max_value,
-                'iqr': iqr,
-                'lower_outliers': lower_outliers,
-                'upper_outliers': upper_outliers,
-            }
-        
-        return boxplot_data
-
-    def univariate(self, df: pd.DataFrame, file_path:str):
+    def univariate(self, df: pd.DataFrame, file_path:str, column_profile: dict):
         """
         Performs univariate analysis on the given dataframe and generates visualizations.
 
         Args:
             df (pd.DataFrame): Input dataframe to analyze
-            file_path (str): Path to save generated visualization files
+            file_path (str): Path of the cleaned data file; the charts are saved in its directory
+            column_profile (dict): Column statistics of df (see utils.column_profile)
 
         Returns:
             tuple: A tuple containing:
                 - list: List of tuples with visualization titles,file paths and data
 
         """
-        visualizations = []
-        parentdir_path = os.path.dirname(file_path) # route to TEMP_DATA_DIR
-        imgdir_path = os.path.join(parentdir_path, "images")
+        parentdir_path = os.path.dirname(file_path) # the thread's artifact directory
+        imgdir_path = os.path.join(parentdir_path, "images", "univariate")
 
         # Check if directory exists; if it exists, then clean it
         # If directory doesn't exist, then create it
+        # (each analysis node owns its image directory, so nodes running in parallel do not clean each other's charts)
         clean_directory(imgdir_path)
 
         # Get numeric cols and categorical cols
-        numeric_cols = df.select_dtypes(include=np.number).columns.to_list()
-        categorical_cols = [col for col in df.select_dtypes(include=['object', 'category']) if df[col].nunique() < 20]
+        numeric_cols = column_profile["numeric_columns"]
+        categorical_cols = column_profile["categorical_columns"]
 
         try:
-            # Histograms for Each Numeric Column
+            chart_specs = []
+
+            # Histograms and Box Plots for Each Numeric Column
             if len(numeric_cols) > 0:
-                if len(numeric_cols) > 3:
-                    figsize_selected = (10, 3 * len(numeric_cols))
-                else:
-                    figsize_selected = (10,8)
-                fig, axes = plt.subplots(len(numeric_cols),1,figsize = figsize_selected)
-                for i, col in enumerate(numeric_cols):
-                    sns.histplot(df[col], ax = axes[i], kde=True)
-                    axes[i].set_title(f"Histogram of {col}")
-                
-                plt.tight_layout()
                 path = os.path.abspath(os.path.join(imgdir_path, "Histograms.png"))
-                fig.savefig(path, bbox_inches='tight')
-                histogram_data = df[numeric_cols].describe().transpose().to_markdown()
-                visualizations.append(("Histograms of Numeric Features", path, histogram_data))
+                histogram_data = compact_table(numeric_summary(column_profile, numeric_cols))
+                chart_specs.append(("Histograms of Numeric Features", path, histogram_data,
+                                    render_histograms, {"df": df[numeric_cols]}))
                 print(histogram_data)
-                plt.close(fig)
-
 
-                # Box Plots for Each Numeric Column
-                fig, axes = plt.subplots(len(numeric_cols), 1, figsize=figsize_selected)
-                for i, col in enumerate(numeric_cols):
-                    sns.boxplot(x=df[col], ax=axes[i])
-                    axes[i].set_title(f"Box Plot of {col}")
-                
-                plt.tight_layout()
                 path = os.path.abspath(os.path.join(imgdir_path, "Boxplots.png"))
-                fig.savefig(path, bbox_inches='tight')
                 boxplot_data = self.get_boxplot_data(df[numeric_cols])
                 boxplot_report = f"""Box Plot data of numeric features\n\n{boxplot_data}\n\n"""
-                visualizations.append(("Box Plots of Numeric Features", path, boxplot_report))
+                chart_specs.append(("Box Plots of Numeric Features", path, boxplot_report,
+                                    render_boxplots, {"df": df[numeric_cols]}))
                 print(boxplot_report)
-                plt.close(fig)
-                
-                # univariate_stats = df[numeric_cols].describe().transpose().to_markdown()
-                # univariate_report += f"""Histogram and Box Plot data of numeric features\n\n{univariate_stats}\n\n"""
 
+            # Count Plots for Each Categorical Column
             if len(categorical_cols) > 0:
-                if len(categorical_cols) > 3:
-                    figsize_selected = (10, 3 * len(categorical_cols))
-                else:
-                    figsize_selected = (10,8)
-
-                # Count Plots for Each Categorical Column
-                fig, axes = plt.subplots(len(categorical_cols), 1, figsize=figsize_selected)
-                for i, col in enumerate(categorical_cols):
-                    sns.countplot(x=df[col], ax=axes[i], hue=df[col], order = df[col].value_counts().index)
-                    axes[i].set_xticks(axes[i].get_xticks())
-                    axes[i].set_xticklabels(axes[i].get_xticklabels(), rotation=270)
-                    axes[i].set_title(f"Count Plot of {col}")
-                    
-                plt.tight_layout()
                 path = os.path.abspath(os.path.join(imgdir_path, "Countplots.png"))
-                fig.savefig(path, bbox_inches='tight')
-                plt.close(fig)
-
                 countplot_report = ""  
                 for col in categorical_cols:
                     countplot_data = df[col].value_counts(ascending=False).to_markdown()
                     countplot_report += f"""Count Plot data of {col}\n\n{countplot_data}\n\n"""
                 print(countplot_report)
-                visualizations.append(("Count Plots of Categorical Features", path, countplot_report))
+                chart_specs.append(("Count Plots of Categorical Features", path, countplot_report,
+                                    render_countplots, {"df": df[categorical_cols]}))
+
+            # Render all charts in parallel
+            visualizations = render_charts(chart_specs)
 
         except Exception as e:
             raise Exception(f"An error occurred while generating univariate plots: {e}")
@@ -184,21 +125,22 @@ class node_univariate_analysis:
             str: The complete report with visualizations and their analyses.
         """
         try:
-            # Get file path from state and read the file
-            file_path = state.get("data_file_path", None)
-            parentdir_path = os.path.join(os.path.dirname(file_path), "df_updated.feather")
-
-            if parentdir_path is None:
-                raise ValueError(f"{parentdir_path} does not exist.")   
+            # Get the cleaned data file recorded by data cleaning and read it
+            parentdir_path = require_cleaned_data(state.get("cleaned_file_path"), dataset_identity(state))
             
-            # Read the file and store it in the state
-            df = pd.read_feather(parentdir_path)
+            # Read the cleaned data (or reuse the cached dataframe)
+            df = dataframe_cache.load(parentdir_path, state.get("thread_id"))
             
             if df is None or df.empty:
                 raise ValueError("Input data is required for profiling.")
             
+            # Charts and their statistics are computed on a random sample (independent of the target metric)
+            sample_df = sample_dataframe(df, state.get("sample_rows"))
+            column_profile = get_column_profile(parentdir_path, df, state.get("sample_rows"), dataset_identity(state))
+
             # Call univariate analysis
-            visualizations = self.univariate(df, str(file_path))
+            visualizations = self.univariate(sample_df, parentdir_path, column_profile)
+            emit_event({"type": "progress", "node": "univariate_analysis", "message": f"Rendered {len(visualizations)} chart(s), analyzing them..."})
 
             data_dictionary = state.get("data_dictionary", "")
 
@@ -259,23 +201,34 @@ class node_univariate_analysis:
 
             """
 
-            # Analyze each visualization 
-            report_content = "## Univariate Analysis Report\n\n"
-        
+            # Build the prompt for each visualization
+            prompts = []
             for title, img_path, data in visualizations:
-                encoded_image = encode_image_to_base64(img_path)
-                image_markdown_tag = f"![{title}](data:image/png;base64,{encoded_image})"
-                report_content += f"### {title}\n\n{image_markdown_tag}\n\n"
                 if "Histograms" in title:
                     prompt_text = prompt_histograms.format(chart_data=data, data_dictionary=data_dictionary)
                 elif "Box Plots" in title:
                     prompt_text = prompt_boxplots.format(chart_data=data, data_dictionary=data_dictionary)
                 elif "Count Plots" in title:
                     prompt_text = prompt_countplots.format(chart_data=data, data_dictionary=data_dictionary)
-                response = self.llm.invoke(prompt_text)
-                analysis_results = response.content if response else "No content returned from LLM."
-                report_content += f"{analysis_results}"
-            
+                prompts.append(prompt_text)
+
+            # Analyze all visualizations concurrently. Each chart section is sent to the event stream
+            # as soon as its analysis completes; the report keeps the original visualization order
+            sections = [""] * len(visualizations)
+
+            def add_section(index, analysis_result):
+                title, img_path, data = visualizations[index]
+                # Reference the chart in the image store instead of inlining it in the State
+                image_markdown_tag = image_markdown(title, img_path)
+                sections[index] = f"### {title}\n\n{image_markdown_tag}\n\n{analysis_result}"
+                emit_event({"type": "section", "node": "univariate_analysis", "title": title, "content": sections[index]})
+
+            invoke_llm_concurrently(self.llm, prompts, on_result=add_section)
+
+            report_content = "## Univariate Analysis Report\n\n"
+            report_content += sampling_label(len(sample_df), len(df))
+            report_content += "".join(sections)
+        
             state["univariate_analysis_report"] = report_content
             
         except Exception as e:
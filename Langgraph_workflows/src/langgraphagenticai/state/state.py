@@ -1,36 +1,73 @@
-from typing_extensions import TypedDict, Optional, List
+from typing_extensions import TypedDict, Optional, List, Annotated
 import pandas as pd
 import src.langgraphagenticai.utils.constants as const
 
+
+## Reducers for the keys written by nodes running in parallel branches ("Auto" execution mode)
+
+def keep_latest_report(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """
+    Keeps the newly written report; an update without the report keeps the existing one.
+    """
+    return right if right is not None else left
+
+
+def merge_dicts(left: Optional[dict], right: Optional[dict]) -> dict:
+    """
+    Merges per-node entries (e.g. node metrics) written by different nodes.
+    """
+    return {**(left or {}), **(right or {})}
+
+
+def merge_messages(left: Optional[list], right: Optional[list]) -> list:
+    """
+    Appends the messages not seen yet, so re-applying a whole State does not duplicate them.
+    """
+    left = list(left or [])
+    return left + [message for message in (right or []) if message not in left]
+
+
 class State(TypedDict):
     """
     State class for managing the state of the LangGraph workflow.
     This class is used to define the structure of the state that will be passed between nodes in the graph.
     """
     next_node: str
+    thread_id: Optional[str] # graph thread, used to scope cached dataframes
     data_file_path: Optional[str] # file path for input data
+    dataset_hash: Optional[str] # content hash of the input data
+    cleaned_file_path: Optional[str] # cleaned data written by data cleaning, read by the analysis stages
     data_dictionary : Optional[str]  # Optional field for data dictionary
     target_metric: Optional[str]  # Optional field for target metric
+    sample_rows: Optional[int]  # rows sampled for statistics and charts; None uses all rows
     profile_report: Optional[str]
     data_cleaning_report: Optional[str]
-    stats_summary_report: Optional[str]
-    univariate_analysis_report: Optional[str]
-    bivariate_analysis_report: Optional[str]
+    stats_summary_report: Annotated[Optional[str], keep_latest_report]
+    univariate_analysis_report: Annotated[Optional[str], keep_latest_report]
+    bivariate_analysis_report: Annotated[Optional[str], keep_latest_report]
     final_report: Optional[str]
-    error_message: List[str]
+    node_metrics: Annotated[Optional[dict], merge_dicts]  # {node name: wall time, LLM calls/tokens, bytes read, chart render time, peak RSS}
+    input_fingerprints: Annotated[Optional[dict], merge_dicts]  # {stage: fingerprint of the inputs its report was produced from}
+    error_message: Annotated[List[str], merge_messages]
 
 
 def make_initial_state() -> State:
     return {
         "next_node": "",
+        "thread_id": None,
         "data_file_path": None,
+        "dataset_hash": None,
+        "cleaned_file_path": None,
         "data_dictionary": None,  # Optional field for data dictionary
         "target_metric": None,
+        "sample_rows": None,
         "profile_report": None,
         "data_cleaning_report": None,
         "stats_summary_report": None,
         "univariate_analysis_report": None,
         "bivariate_analysis_report": None,
         "final_report": None,
+        "node_metrics": {},
+        "input_fingerprints": {},
         "error_message": [],
     }
\ No newline at end of file
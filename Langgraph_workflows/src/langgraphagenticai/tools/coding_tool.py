@@ -2,6 +2,7 @@ from langchain_core.tools import Tool
 from langchain_experimental.utilities import PythonREPL
 from langgraph.prebuilt import ToolNode
 import pandas as pd
+from src.langgraphagenticai.tools.sandbox_executor import run_in_sandbox
 
 
 
@@ -21,13 +22,12 @@ def coding_tool(df:pd.DataFrame, output_path:str):
 def python_exec_tool_func(df:pd.DataFrame, code: str) -> pd.DataFrame:
     """
     Creates a Python execution tool for arbitrary code.
+    The code runs in a resource-limited sandbox process (see sandbox_executor.run_in_sandbox).
     """
     # Execute snippet
-    namespace = dict(pd=pd, df=df)
     try:
-        exec(code, {}, namespace)
+        result, _ = run_in_sandbox(df, code)
     except Exception as e:
-        return f"Error executing the code snippet : {e}"
+        return str(e)
 
-    result = namespace.get("X")
     return result
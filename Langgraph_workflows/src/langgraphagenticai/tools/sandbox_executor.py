@@ -0,0 +1,203 @@
+import builtins
+import multiprocessing
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import psutil
+import pyarrow as pa
+
+import src.langgraphagenticai.utils.constants as const
+
+try:
+    import resource
+except ImportError: # Windows: only the wall-clock and memory limits apply
+    resource = None
+
+# Builtins available to the generated code: no __import__, open, exec, eval, compile,
+# input, breakpoint or attribute/global introspection helpers
+SAFE_BUILTIN_NAMES = [
+    "abs", "all", "any", "bool", "dict", "divmod", "enumerate", "filter", "float", "frozenset",
+    "int", "isinstance", "len", "list", "map", "max", "min", "print", "range", "reversed",
+    "object", "round", "set", "slice", "sorted", "str", "sum", "tuple", "zip",
+    "True", "False", "None", "Exception", "KeyError", "ValueError", "TypeError",
+]
+SAFE_BUILTINS = {name: getattr(builtins, name) for name in SAFE_BUILTIN_NAMES}
+
+
+def _write_shared_table(table: pa.Table) -> tuple:
+    """
+    Writes an Arrow table as an IPC stream into a new shared memory block.
+
+    Returns:
+        tuple: (SharedMemory, size of the stream in bytes)
+    """
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+
+    shm = SharedMemory(create=True, size=max(size, 1))
+    buffer = pa.py_buffer(shm.buf)
+    stream = pa.FixedSizeBufferWriter(buffer)
+    with pa.ipc.new_stream(stream, table.schema) as writer:
+        writer.write_table(table)
+    stream.close()
+    del stream, buffer
+    return shm, size
+
+
+def _read_shared_table(shm: SharedMemory, size: int) -> pd.DataFrame:
+    """
+    Reads a dataframe from an Arrow IPC stream in shared memory.
+    The stream is copied out of the block in one memcpy (no deserialization of the values),
+    so the frame, which may share Arrow buffers, never outlives the block it was read from.
+    """
+    stream = pa.py_buffer(shm.buf[:size].tobytes())
+    with pa.ipc.open_stream(stream) as reader:
+        return reader.read_all().to_pandas()
+
+
+def _sandbox_worker(conn, input_name: str, input_size: int, code: str, cpu_seconds: int):
+    """
+    Entry point of the sandbox process: runs the code on df and sends back X.
+    """
+    if resource is not None:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+
+    try:
+        input_shm = SharedMemory(name=input_name)
+        df = _read_shared_table(input_shm, input_size)
+        input_shm.close()
+
+        namespace = dict(pd=pd, df=df)
+        start = time.perf_counter()
+        exec(code, {"__builtins__": dict(SAFE_BUILTINS)}, namespace)
+        exec_seconds = time.perf_counter() - start
+
+        result = namespace.get("X")
+        if not isinstance(result, pd.DataFrame):
+            conn.send(("error", "The code did not assign the updated dataframe to X."))
+            return
+
+        try:
+            table = pa.Table.from_pandas(result, preserve_index=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Columns Arrow cannot represent (e.g. mixed Python objects) are sent through the pipe
+            conn.send(("pickle", result, exec_seconds))
+            return
+
+        output_shm, output_size = _write_shared_table(table)
+        conn.send(("arrow", output_shm.name, output_size, exec_seconds))
+        # Keep the block alive until the parent has read it
+        conn.recv()
+        output_shm.close()
+
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+def _wait_for_result(process, conn, cpu_seconds: int, timeout_seconds: int, max_rss_bytes: int) -> tuple:
+    """
+    Waits for the sandbox message while enforcing the wall-clock and memory limits.
+
+    Returns:
+        tuple: (message, peak RSS in bytes)
+    """
+    start = time.perf_counter()
+    peak_rss = 0
+    while True:
+        try:
+            rss = psutil.Process(process.pid).memory_info().rss
+            peak_rss = max(peak_rss, rss)
+        except psutil.Error:
+            rss = 0
+
+        if rss > max_rss_bytes:
+            process.kill()
+            raise Exception(f"Sandbox exceeded the memory limit of {max_rss_bytes / 1024 ** 2:.0f} MB")
+        if time.perf_counter() - start > timeout_seconds:
+            process.kill()
+            raise Exception(f"Sandbox exceeded the time limit of {timeout_seconds} s")
+
+        if conn.poll(const.RSS_SAMPLE_INTERVAL_SECONDS):
+            try:
+                return conn.recv(), peak_rss
+            except EOFError:
+                pass # the sandbox died without sending a result
+        if not process.is_alive():
+            # e.g. killed at its CPU time limit
+            process.join()
+            raise Exception(f"Sandbox process exited with code {process.exitcode} "
+                            f"(CPU time limit is {cpu_seconds} s)")
+
+
+def run_in_sandbox(df: pd.DataFrame, code: str,
+                   cpu_seconds: int = const.SANDBOX_CPU_SECONDS,
+                   timeout_seconds: int = const.SANDBOX_TIMEOUT_SECONDS,
+                   max_rss_bytes: int = const.SANDBOX_MAX_RSS_BYTES) -> tuple:
+    """
+    Runs generated pandas code in a separate process with CPU time, wall-clock and memory limits.
+
+    The dataframe is passed to the sandbox as an Arrow IPC stream in shared memory (no pickling),
+    and the resulting X comes back the same way. The code gets `pd`, `df` and a restricted set of
+    builtins (SAFE_BUILTINS: no imports, open, exec or eval), and must assign the updated dataframe to `X`.
+
+    Only CPU time, wall-clock time and resident memory are enforced. The process is not isolated:
+    it runs as the same user with the same file system and network access, and pandas I/O or
+    Python object introspection can still reach them. Do not run untrusted code with it.
+
+    Args:
+        df (pd.DataFrame): Input dataframe
+        code (str): Python code to execute
+        cpu_seconds (int): CPU time limit of the sandbox (POSIX only)
+        timeout_seconds (int): Wall-clock limit of the sandbox
+        max_rss_bytes (int): Resident memory limit of the sandbox
+
+    Returns:
+        tuple: (updated dataframe X, stats dict with exec_seconds, sandbox_seconds, peak_rss_mb)
+    """
+    start = time.perf_counter()
+    input_shm, input_size = _write_shared_table(pa.Table.from_pandas(df, preserve_index=True))
+
+    context = multiprocessing.get_context("spawn")
+    conn, child_conn = context.Pipe()
+    process = context.Process(target=_sandbox_worker,
+                              args=(child_conn, input_shm.name, input_size, code, cpu_seconds),
+                              daemon=True)
+    try:
+        process.start()
+        child_conn.close()
+        message, peak_rss = _wait_for_result(process, conn, cpu_seconds, timeout_seconds, max_rss_bytes)
+
+        if message[0] == "error":
+            raise Exception(f"Error executing the code snippet : {message[1]}")
+
+        if message[0] == "pickle":
+            _, result, exec_seconds = message
+        else:
+            _, output_name, output_size, exec_seconds = message
+            output_shm = SharedMemory(name=output_name)
+            try:
+                result = _read_shared_table(output_shm, output_size)
+            finally:
+                output_shm.close()
+                output_shm.unlink()
+                conn.send("done")
+
+        process.join(timeout_seconds)
+
+    finally:
+        if process.is_alive():
+            process.kill()
+            process.join()
+        conn.close()
+        input_shm.close()
+        input_shm.unlink()
+
+    stats = {
+        "exec_seconds": round(exec_seconds, 3),
+        "sandbox_seconds": round(time.perf_counter() - start, 3),
+        "peak_rss_mb": round(peak_rss / 1024 ** 2, 1),
+    }
+    return result, stats
@@ -18,5 +18,11 @@ class Config:
     def get_openai_model_options(self):
         return self.config["DEFAULT"].get("OPENAI_MODEL_OPTIONS").split(", ")
 
+    def get_checkpointer_options(self):
+        return self.config["DEFAULT"].get("CHECKPOINTER_OPTIONS").split(", ")
+
+    def get_execution_mode_options(self):
+        return self.config["DEFAULT"].get("EXECUTION_MODE_OPTIONS").split(", ")
+
     def get_page_title(self):
         return self.config["DEFAULT"].get("PAGE_TITLE")
\ No newline at end of file
@@ -0,0 +1,43 @@
+import streamlit as st
+from src.langgraphagenticai.ui.streamlitui.display_report import display_report
+
+NODE_LABELS = {
+    "data_profiling": "Profiling data",
+    "data_cleaning": "Cleaning data",
+    "stats_summary": "Summarizing statistics",
+    "univariate_analysis": "Generating univariate report",
+    "bivariate_analysis": "Generating bivariate report",
+    "final_step": "Generating final recommendations",
+}
+
+
+class StreamingEventDisplay:
+    """
+    Renders the progress events of a graph run (GraphExecutor.stream_events) as they arrive:
+    node status, finished report sections and the LLM output being generated.
+    Pass an instance as the on_event callback of the GraphExecutor methods.
+    """
+    def __init__(self):
+        self.status = st.empty()
+        self.sections = st.container()
+        self.live_output = st.empty()
+        self.messages = {} # message_id -> text generated so far
+
+    def __call__(self, event: dict):
+        event_type = event.get("type")
+        node_label = NODE_LABELS.get(event.get("node"), event.get("node"))
+
+        if event_type == "node_start":
+            self.status.info(f"{node_label}...")
+        elif event_type == "progress":
+            self.status.info(f"{node_label}: {event['message']}")
+        elif event_type == "node_end":
+            self.status.success(f"{node_label}: done")
+        elif event_type == "section":
+            with self.sections:
+                display_report(event["content"])
+            self.live_output.empty()
+        elif event_type == "token":
+            message_id = event.get("message_id")
+            self.messages[message_id] = self.messages.get(message_id, "") + event["content"]
+            self.live_output.markdown(self.messages[message_id])
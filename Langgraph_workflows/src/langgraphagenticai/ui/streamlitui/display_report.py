@@ -0,0 +1,19 @@
+import os
+
+import streamlit as st
+from src.langgraphagenticai.utils.image_store import split_report_images
+
+
+def display_report(report: str):
+    """
+    Displays a Markdown report, rendering its stored chart images from the image store.
+    """
+    for part_type, content in split_report_images(report):
+        if part_type == "text":
+            st.write(content)
+        else:
+            title, path = content
+            if os.path.exists(path):
+                st.image(path, caption=title)
+            else:
+                st.warning(f"Image '{title}' is no longer available in the image store.")
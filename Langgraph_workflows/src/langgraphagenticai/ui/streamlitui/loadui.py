@@ -3,6 +3,8 @@ from src.langgraphagenticai.state.state import make_initial_state
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from src.langgraphagenticai.ui.config import Config
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.graph.graph_factory import prune_unreferenced_images
 import src.langgraphagenticai.utils.constants as const
 import os
 
@@ -52,6 +54,19 @@ class LoadStreamlitUI:
                     st.warning("Please enter your OpenAI API Key to proceed. Don't have one? refer : https://platform.openai.com/account/api-keys")
 
 
+            ## Checkpoint storage
+            self.user_controls["selected_checkpointer"] = st.selectbox("Checkpoint Storage", self.config.get_checkpointer_options(),
+                                                                       help="SQLite keeps the analysis on disk so a thread can be resumed after a restart.")
+
+            ## Execution Mode
+            self.user_controls["selected_execution_mode"] = st.selectbox("Execution Mode", self.config.get_execution_mode_options(),
+                                                                         help="Sequential pauses after each report. Auto runs the whole analysis at once, with the summary statistics, univariate and bivariate analysis in parallel.")
+
+            ## Resume a checkpointed analysis
+            resume_thread_id = st.text_input("Resume Thread ID", help="Upload the same data file, then resume an analysis saved in SQLite checkpoints.")
+            if st.button("Resume Analysis") and resume_thread_id.strip():
+                st.session_state.resume_thread_id = resume_thread_id.strip()
+
             # ## Use Case Selection
             # self.user_controls["selected_usecase"] = st.selectbox("Select a Use Case", self.config.get_usecase_options())
 
@@ -59,6 +74,10 @@ class LoadStreamlitUI:
                 # for key in list(st.session_state.keys()):
                 #     del st.session_state[key]
 
+                # Release the cached dataframes of the previous analysis
+                # and delete the chart images no live thread references anymore
+                dataframe_cache.evict_thread(st.session_state.thread_id)
+                prune_unreferenced_images()
                 self.initialize_session()
                 st.session_state.file_uploader_key += 1
 
@@ -0,0 +1,80 @@
+import pandas as pd
+
+
+def _stats_frame(q1: pd.DataFrame, median: pd.DataFrame, q3: pd.DataFrame, min_value: pd.DataFrame, max_value: pd.DataFrame) -> dict:
+    """
+    Derives IQR and outlier flags from aligned quantile/min/max frames.
+    A value lies outside the fences exactly when the min (or max) does,
+    so no extra pass over the rows is needed for the outlier flags.
+    """
+    iqr = q3 - q1
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+
+    return {
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'min_value': min_value,
+        'max_value': max_value,
+        'iqr': iqr,
+        'lower_outliers': min_value < lower_bound,
+        'upper_outliers': max_value > upper_bound,
+    }
+
+
+def _to_python(value):
+    return value.item() if hasattr(value, "item") else value
+
+
+def boxplot_stats(df: pd.DataFrame) -> dict:
+    """
+    Calculates boxplot statistics for every numeric column of the dataframe
+    with a single vectorized quantile call over the whole numeric block.
+
+    Args:
+        df (pd.DataFrame): Dataframe with numeric columns only
+
+    Returns:
+        dict: {column: {'q1', 'median', 'q3', 'min_value', 'max_value', 'iqr', 'lower_outliers', 'upper_outliers'}}
+    """
+    if df.empty or len(df.columns) == 0:
+        return {}
+
+    quantiles = df.quantile([0.25, 0.5, 0.75])
+    stats = _stats_frame(quantiles.loc[0.25], quantiles.loc[0.5], quantiles.loc[0.75], df.min(), df.max())
+
+    return {col: {name: _to_python(values[col]) for name, values in stats.items()}
+            for col in df.columns}
+
+
+def grouped_boxplot_stats(df: pd.DataFrame, numeric_cols: list, categorical_col: str) -> dict:
+    """
+    Calculates boxplot statistics of every numeric column for each category of
+    categorical_col in one grouped pass over the dataframe.
+
+    Args:
+        df (pd.DataFrame): The dataframe containing the data
+        numeric_cols (list): Names of the numeric columns
+        categorical_col (str): Name of the categorical column to group by
+
+    Returns:
+        dict: {numeric_col: {category: {'q1', 'median', 'q3', 'min_value', 'max_value', 'iqr', 'lower_outliers', 'upper_outliers'}}}
+              Categories are listed in order of first appearance.
+    """
+    numeric_cols = [col for col in numeric_cols if col != categorical_col]
+    if df.empty or len(numeric_cols) == 0:
+        return {col: {} for col in numeric_cols}
+
+    grouped = df.groupby(categorical_col, observed=True, sort=False)[numeric_cols]
+    quantiles = grouped.quantile([0.25, 0.5, 0.75])
+    stats = _stats_frame(quantiles.xs(0.25, level=-1),
+                         quantiles.xs(0.5, level=-1),
+                         quantiles.xs(0.75, level=-1),
+                         grouped.min(),
+                         grouped.max())
+
+    categories = stats['q1'].index
+    return {col: {_to_python(category): {name: _to_python(values.at[category, col]) for name, values in stats.items()}
+                  for category in categories}
+            for col in numeric_cols}
@@ -0,0 +1,186 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import seaborn as sns
+from matplotlib.figure import Figure
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.node_metrics import record_metric
+
+# Charts are drawn on standalone Agg figures (no pyplot global state),
+# so they can be rendered safely in worker processes.
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _save_figure(fig: Figure, path: str) -> str:
+    fig.tight_layout()
+    fig.savefig(path, bbox_inches='tight')
+    return path
+
+
+def _stacked_figsize(num_axes: int) -> tuple:
+    return (10, 3 * num_axes) if num_axes > 3 else (10, 8)
+
+
+def render_histograms(path: str, df: pd.DataFrame) -> str:
+    """
+    Renders one histogram (with KDE) per column of the dataframe, stacked vertically.
+    """
+    fig = Figure(figsize=_stacked_figsize(len(df.columns)))
+    axes = fig.subplots(len(df.columns), 1, squeeze=False)[:, 0]
+    for ax, col in zip(axes, df.columns):
+        sns.histplot(df[col], ax=ax, kde=True)
+        ax.set_title(f"Histogram of {col}")
+    return _save_figure(fig, path)
+
+
+def render_boxplots(path: str, df: pd.DataFrame) -> str:
+    """
+    Renders one horizontal box plot per column of the dataframe, stacked vertically.
+    """
+    fig = Figure(figsize=_stacked_figsize(len(df.columns)))
+    axes = fig.subplots(len(df.columns), 1, squeeze=False)[:, 0]
+    for ax, col in zip(axes, df.columns):
+        sns.boxplot(x=df[col], ax=ax)
+        ax.set_title(f"Box Plot of {col}")
+    return _save_figure(fig, path)
+
+
+def render_countplots(path: str, df: pd.DataFrame) -> str:
+    """
+    Renders one count plot per column of the dataframe, stacked vertically.
+    """
+    fig = Figure(figsize=_stacked_figsize(len(df.columns)))
+    axes = fig.subplots(len(df.columns), 1, squeeze=False)[:, 0]
+    for ax, col in zip(axes, df.columns):
+        sns.countplot(x=df[col], ax=ax, hue=df[col], order=df[col].value_counts().index)
+        ax.tick_params(axis='x', labelrotation=270)
+        ax.set_title(f"Count Plot of {col}")
+    return _save_figure(fig, path)
+
+
+def render_correlation_heatmap(path: str, corr: pd.DataFrame) -> str:
+    """
+    Renders an annotated heatmap of a correlation matrix.
+    """
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots()
+    sns.heatmap(corr, annot=True, fmt=".2f", cmap='Spectral', vmin=-1, vmax=1, ax=ax)
+    ax.set_title("Correlation Heatmap of Numeric Features")
+    return _save_figure(fig, path)
+
+
+def render_category_boxplot(path: str, df: pd.DataFrame, categorical_col: str, numeric_col: str, title: str) -> str:
+    """
+    Renders box plots of a numeric column for each category, ordered by descending median.
+    """
+    order = df.groupby(categorical_col, observed=False)[numeric_col].median().sort_values(ascending=False).index
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.boxplot(x=df[categorical_col], y=df[numeric_col], hue=df[categorical_col],
+                palette='Spectral', legend=False, order=order, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(categorical_col)
+    ax.set_ylabel(numeric_col)
+    if df[categorical_col].nunique() > 10:
+        ax.tick_params(axis='x', labelrotation=270)
+    return _save_figure(fig, path)
+
+
+def render_stacked_bar(path: str, tab: pd.DataFrame, categorical_col: str, kpi: str) -> str:
+    """
+    Renders a stacked bar chart from a normalized crosstab of a categorical column against the KPI.
+    """
+    fig = Figure(figsize=(len(tab.index) + 5, 6))
+    ax = fig.subplots()
+    tab.plot(kind='bar', stacked=True, colormap='Spectral', ax=ax)
+    ax.set_title(f"Stacked Bar Chart of {categorical_col} by {kpi}")
+    ax.legend(loc="upper left", bbox_to_anchor=(1, 1))
+    ax.set_xlabel(categorical_col)
+    ax.set_ylabel(kpi)
+    if len(tab.index) > 10:
+        ax.tick_params(axis='x', labelrotation=270)
+    return _save_figure(fig, path)
+
+
+def render_scatter(path: str, df: pd.DataFrame, x_col: str, y_col: str) -> str:
+    """
+    Renders a scatter plot of y_col against x_col.
+    """
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    sns.scatterplot(x=df[x_col], y=df[y_col], ax=ax)
+    ax.set_title(f"Scatter Plot of {y_col} vs {x_col}")
+    ax.set_xlabel(x_col)
+    ax.set_ylabel(y_col)
+    return _save_figure(fig, path)
+
+
+def _render_chart(render_func, path: str, payload: dict) -> str:
+    return render_func(path, **payload)
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared rendering process pool, creating it on first use.
+    Workers are spawned (not forked) so they never inherit locks held by the Streamlit threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=max_workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        return _executor
+
+
+def _reset_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def render_charts(chart_specs: list, max_workers: int = const.CHART_RENDER_MAX_WORKERS) -> list:
+    """
+    Renders a batch of charts, in parallel across processes when more than one chart is requested.
+
+    Args:
+        chart_specs (list): List of tuples (title, path, data, render_func, payload) where
+                            render_func is one of the render_* functions of this module and
+                            payload holds its keyword arguments (besides path)
+        max_workers (int): Maximum number of rendering processes
+
+    Returns:
+        list: List of tuples (title, path, data) in the same order as chart_specs
+    """
+    start = time.perf_counter()
+    try:
+        _render_all(chart_specs, max_workers)
+    finally:
+        record_metric("chart_render_seconds", time.perf_counter() - start)
+
+    return [(title, path, data) for title, path, data, _, _ in chart_specs]
+
+
+def _render_all(chart_specs: list, max_workers: int):
+    if len(chart_specs) > 1 and max_workers > 1:
+        try:
+            executor = _get_executor(max_workers)
+            futures = [executor.submit(_render_chart, render_func, path, payload)
+                       for _, path, _, render_func, payload in chart_specs]
+            for future in futures:
+                future.result()
+            return
+        except BrokenProcessPool as e:
+            print(f"Chart rendering pool failed, rendering serially: {e}")
+            _reset_executor()
+
+    for _, path, _, render_func, payload in chart_specs:
+        _render_chart(render_func, path, payload)
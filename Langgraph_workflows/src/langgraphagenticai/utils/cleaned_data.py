@@ -0,0 +1,45 @@
+import os
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.dataframe_cache import dataframe_cache
+from src.langgraphagenticai.utils.column_profile import column_profile_path, load_column_profile
+
+
+def thread_data_dir(data_file_path: str, thread_id: str = None) -> str:
+    """
+    Returns the directory of a thread's artifacts (cleaned data, column profile, charts),
+    next to the uploaded data file. Each thread owns its directory, so a new upload or
+    another session never overwrites the cleaned data of a thread.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(data_file_path)), const.THREAD_DATA_DIR_NAME, thread_id or "default")
+
+
+def cleaned_data_path(data_file_path: str, thread_id: str = None) -> str:
+    """
+    Returns the path of a thread's cleaned data file.
+    """
+    return os.path.join(thread_data_dir(data_file_path, thread_id), const.CLEANED_DATA_FILE_NAME)
+
+
+def cleaned_data_available(cleaned_file_path: str, dataset_hash: str) -> bool:
+    """
+    Returns True when the cleaned data file exists and was built from the given dataset
+    (recorded in the column profile written with it).
+    """
+    # The cleaned frame is written in the background; wait for a pending write
+    dataframe_cache.flush(cleaned_file_path)
+    if not os.path.exists(cleaned_file_path):
+        return False
+    profile = load_column_profile(column_profile_path(cleaned_file_path))
+    return profile is not None and profile.get("dataset_hash") == dataset_hash
+
+
+def require_cleaned_data(cleaned_file_path: str, dataset_hash: str) -> str:
+    """
+    Returns the cleaned data file recorded in the state by data cleaning.
+    Raises a ValueError when it is missing or was built from another dataset.
+    """
+    if not cleaned_file_path or not cleaned_data_available(cleaned_file_path, dataset_hash):
+        raise ValueError("The cleaned data of this thread is missing or was built from another dataset. "
+                         "Re-run data cleaning.")
+    return cleaned_file_path
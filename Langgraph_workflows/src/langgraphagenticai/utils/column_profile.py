@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.sampling import sample_dataframe
+
+# Columns of the per-column statistics table, in display order
+STATS_COLUMNS = ["dtype", "count", "missing", "unique", "top", "freq",
+                 "mean", "std", "min", "25%", "50%", "75%", "max", "skew", "kurtosis"]
+# Columns of df.describe() on numeric columns
+NUMERIC_STATS_COLUMNS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+_lock = threading.Lock()
+
+
+def column_profile_path(cleaned_file_path: str) -> str:
+    """
+    Returns the path of the column profile stored next to the cleaned data file.
+    """
+    return os.path.join(os.path.dirname(cleaned_file_path), const.COLUMN_PROFILE_FILE_NAME)
+
+
+def compute_column_profile(df: pd.DataFrame, total_rows: int = None, sample_rows: int = None,
+                           dataset_hash: str = None) -> dict:
+    """
+    Computes the column statistics shared by the analysis nodes in one pass over the dataframe:
+    types, missing counts, cardinality, quantiles, moments and the correlation matrix of the numeric columns.
+
+    Args:
+        df (pd.DataFrame): Dataframe (or sample) to profile
+        total_rows (int): Rows of the full dataframe, when df is a sample
+        sample_rows (int): Sample size setting the profile was computed with
+        dataset_hash (str): Identity of the dataset the cleaned data comes from
+
+    Returns:
+        dict: dataset_hash, sample_rows, sample_size, total_rows, columns, numeric_columns, categorical_columns,
+              stats (pd.DataFrame, one row per column) and correlation (pd.DataFrame)
+    """
+    numeric_cols = df.select_dtypes(include=np.number).columns.to_list()
+    unique = df.nunique()
+    categorical_cols = [col for col in df.select_dtypes(include=['object', 'category']).columns
+                        if unique[col] < const.CATEGORICAL_MAX_UNIQUE]
+
+    stats = df.describe(include='all').transpose()
+    stats["dtype"] = df.dtypes.astype(str)
+    stats["count"] = df.count()
+    stats["missing"] = df.isna().sum()
+    stats["unique"] = unique
+    if numeric_cols:
+        stats["skew"] = df[numeric_cols].skew()
+        stats["kurtosis"] = df[numeric_cols].kurt()
+    stats = stats.reindex(columns=STATS_COLUMNS)
+
+    return {
+        "dataset_hash": dataset_hash,
+        "sample_rows": sample_rows,
+        "sample_size": len(df),
+        "total_rows": total_rows if total_rows is not None else len(df),
+        "columns": [str(col) for col in df.columns],
+        "numeric_columns": numeric_cols,
+        "categorical_columns": categorical_cols,
+        "stats": stats,
+        "correlation": df[numeric_cols].corr(),
+    }
+
+
+def save_column_profile(profile: dict, file_path: str):
+    """
+    Writes a column profile as JSON (written to a temporary file, then renamed).
+    """
+    content = {key: value for key, value in profile.items() if key not in ("stats", "correlation")}
+    content["stats"] = json.loads(profile["stats"].to_json(orient="split", date_format="iso", default_handler=str))
+    content["correlation"] = json.loads(profile["correlation"].to_json(orient="split"))
+
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(content, f)
+    os.replace(tmp_path, file_path)
+
+
+def load_column_profile(file_path: str) -> dict:
+    """
+    Reads a column profile written by save_column_profile. Returns None if the file does not exist.
+    """
+    try:
+        with open(file_path) as f:
+            content = json.load(f)
+    except FileNotFoundError:
+        return None
+
+    for key in ("stats", "correlation"):
+        table = content[key]
+        content[key] = pd.DataFrame(table["data"], index=table["index"], columns=table["columns"])
+    return content
+
+
+def is_profile_of(profile: dict, df: pd.DataFrame, sample_rows: int = None, dataset_hash: str = None) -> bool:
+    """
+    Returns True when a stored profile was computed from this cleaned dataframe:
+    same dataset, same shape and columns, and same sample size setting.
+    """
+    return (profile.get("dataset_hash") == dataset_hash
+            and profile.get("sample_rows") == sample_rows
+            and profile.get("total_rows") == len(df)
+            and profile.get("columns") == [str(col) for col in df.columns])
+
+
+def get_column_profile(cleaned_file_path: str, df: pd.DataFrame, sample_rows: int = None,
+                       dataset_hash: str = None) -> dict:
+    """
+    Returns the column profile of the cleaned data, computed on the same random sample the nodes use.
+    The profile stored by the data cleaning node is reused; it is computed (and stored) again
+    if it is missing or was computed from another dataset, cleaning result or sample size.
+
+    Args:
+        cleaned_file_path (str): Path of the cleaned data file
+        df (pd.DataFrame): Cleaned dataframe
+        sample_rows (int): Target number of sampled rows
+        dataset_hash (str): Identity of the dataset the cleaned data comes from
+
+    Returns:
+        dict: Column profile (see compute_column_profile)
+    """
+    profile_path = column_profile_path(cleaned_file_path)
+    with _lock:
+        profile = load_column_profile(profile_path)
+        if profile is None or not is_profile_of(profile, df, sample_rows, dataset_hash):
+            profile = compute_column_profile(sample_dataframe(df, sample_rows), len(df), sample_rows, dataset_hash)
+            save_column_profile(profile, profile_path)
+    return profile
+
+
+def numeric_summary(profile: dict, columns: list = None) -> pd.DataFrame:
+    """
+    Returns the describe() table (count, mean, std, quartiles, min/max) of numeric columns from a profile.
+    """
+    columns = profile["numeric_columns"] if columns is None else columns
+    return profile["stats"].loc[columns, NUMERIC_STATS_COLUMNS]
@@ -0,0 +1,37 @@
+import src.langgraphagenticai.utils.constants as const
+
+
+def invoke_llm_concurrently(llm, prompts:list, max_concurrency:int = const.LLM_MAX_CONCURRENCY, max_retries:int = const.LLM_MAX_RETRIES, on_result=None) -> list:
+    """
+    Sends a list of prompts to the LLM with bounded concurrency.
+    Each prompt is retried on its own with exponential backoff, so one failing chart
+    does not force the whole batch to be re-sent.
+
+    Args:
+        llm: LangChain chat model used for the analysis
+        prompts (list): Prompt strings to send to the LLM
+        max_concurrency (int): Maximum number of prompts in flight at once
+        max_retries (int): Number of attempts per prompt
+        on_result: Optional function called with (index, response text) as soon as each prompt completes
+
+    Returns:
+        list: Response texts in the same order as the prompts.
+              Prompts that still fail after all retries return an error message instead.
+    """
+    if not prompts:
+        return []
+
+    llm_with_retry = llm.with_retry(stop_after_attempt=max_retries, wait_exponential_jitter=True)
+    results = [None] * len(prompts)
+    for index, response in llm_with_retry.batch_as_completed(prompts,
+                                                             config={"max_concurrency": max_concurrency},
+                                                             return_exceptions=True):
+        if isinstance(response, Exception):
+            print(f"Error in LLM analysis after {max_retries} attempts: {response}")
+            results[index] = f"LLM analysis failed after {max_retries} attempts: {response}"
+        else:
+            results[index] = response.content if response else "No content returned from LLM."
+        if on_result is not None:
+            on_result(index, results[index])
+
+    return results
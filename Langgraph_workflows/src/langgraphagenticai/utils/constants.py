@@ -1,3 +1,5 @@
+import os
+
 ## Graph States
 PROFILE_DATA = "data_profiling"
 CLEAN_DATA = "data_cleaning"
@@ -6,3 +8,102 @@ GENERATE_UNIVARIATE_REPORT = "univariate_analysis"
 GENERATE_BIVARIATE_REPORT = "bivariate_analysis"
 GENERATE_FINAL_REPORT = "final_step"
 END_NODE = "end_node"
+
+## Execution Modes
+SEQUENTIAL_MODE = "Sequential" # one node after another, pausing before each node
+AUTO_MODE = "Auto" # unattended; stats, univariate and bivariate analysis run in parallel
+
+## Event Streaming
+EVENT_STREAM_MODES = ["values", "updates", "custom", "messages"] # LangGraph stream modes behind GraphExecutor.stream_events
+
+## LLM Concurrency
+LLM_MAX_CONCURRENCY = 4 # maximum number of chart prompts in flight at once
+LLM_MAX_RETRIES = 3 # attempts per chart prompt before giving up
+
+## Chart Rendering
+CHART_RENDER_MAX_WORKERS = os.cpu_count() or 1 # number of processes used to render charts
+
+## Dataframe Cache
+DATAFRAME_CACHE_MAX_BYTES = 2 * 1024**3 # memory budget of the shared dataframe cache
+
+## Column Profile
+COLUMN_PROFILE_FILE_NAME = "column_profile.json" # column statistics of the cleaned data, shared by the analysis nodes
+
+## Thread Artifacts
+THREAD_DATA_DIR_NAME = "threads" # per-thread artifacts are stored in <data dir>/threads/<thread_id>/
+CLEANED_DATA_FILE_NAME = "df_updated.feather" # cleaned data written by the data cleaning node
+CATEGORICAL_MAX_UNIQUE = 20 # text columns with fewer distinct values are analyzed as categorical
+
+## Prompt Budget
+PROMPT_TOKEN_BUDGET = 6000 # estimated tokens per prompt; wider tables are analyzed in column batches
+PROMPT_MIN_BATCH_COLUMNS = 5 # columns per batch at least, however large the rest of the prompt
+CHARS_PER_TOKEN = 4 # rough characters per token used to estimate prompt sizes
+PROMPT_SIGNIFICANT_DIGITS = 4 # numbers in prompt tables are rounded to this many significant digits
+PROMPT_MAX_VALUE_CHARS = 40 # longer text values in prompt tables are truncated
+CORRELATION_TOP_K = 30 # strongest correlation pairs sent to the LLM instead of the full matrix
+
+## CSV Ingestion
+CSV_INGEST_BLOCK_SIZE = 16 * 1024**2 # bytes parsed per streamed CSV block
+CSV_INGEST_SAMPLE_BYTES = 1024**2 # bytes of the CSV used to infer the column types
+# Strings read as missing / boolean values, the defaults of pandas.read_csv
+CSV_NULL_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+                   "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+CSV_TRUE_VALUES = ["True", "TRUE", "true"]
+CSV_FALSE_VALUES = ["False", "FALSE", "false"]
+
+## Sampling
+DEFAULT_SAMPLE_ROWS = 100_000 # rows sampled for profiling statistics and charts (0 = all rows)
+SAMPLE_MAX_STRATA = 20 # maximum number of strata used for stratified sampling
+SAMPLE_RANDOM_STATE = 42 # seed so every node sees the same sample
+
+## Checkpointing
+SQLITE_CHECKPOINTER = "SQLite"
+MEMORY_CHECKPOINTER = "Memory"
+CHECKPOINT_DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'checkpoints', 'eda_checkpoints.sqlite'))
+
+# Report written by each stage, in execution order
+STAGE_REPORT_KEYS = {
+    PROFILE_DATA: "profile_report",
+    CLEAN_DATA: "data_cleaning_report",
+    SUMMARIZE_DATA: "stats_summary_report",
+    GENERATE_UNIVARIATE_REPORT: "univariate_analysis_report",
+    GENERATE_BIVARIATE_REPORT: "bivariate_analysis_report",
+    GENERATE_FINAL_REPORT: "final_report",
+}
+
+# State keys each stage reads; a stage re-runs only when one of them changed since its last run
+STAGE_INPUT_KEYS = {
+    PROFILE_DATA: ["dataset_hash", "sample_rows", "data_dictionary"],
+    CLEAN_DATA: ["dataset_hash", "profile_report"],
+    SUMMARIZE_DATA: ["dataset_hash", "data_cleaning_report", "sample_rows", "data_dictionary"],
+    GENERATE_UNIVARIATE_REPORT: ["dataset_hash", "data_cleaning_report", "sample_rows", "data_dictionary"],
+    GENERATE_BIVARIATE_REPORT: ["dataset_hash", "data_cleaning_report", "sample_rows", "data_dictionary", "target_metric"],
+    GENERATE_FINAL_REPORT: ["univariate_analysis_report", "bivariate_analysis_report"],
+}
+
+## LLM and Graph Factory
+LLM_FACTORY_CACHE_SIZE = 8 # compiled graphs / chat models kept per process
+HTTP_MAX_CONNECTIONS = 20 # pooled connections to the LLM providers
+HTTP_TIMEOUT_SECONDS = 120
+
+## Node Metrics
+RSS_SAMPLE_INTERVAL_SECONDS = 0.05 # how often the peak memory of a running node is sampled
+
+## Image Store
+IMAGE_STORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'image_store')) # content-addressed chart images referenced by the reports
+IMAGE_STORE_MIN_AGE_SECONDS = 3600 # unreferenced images younger than this are kept (their report may not be checkpointed yet)
+
+## Final Report
+FINAL_REPORT_CHUNK_SIZE = 2000 # characters per chunk summarized in the map phase
+FINAL_REPORT_CHUNK_OVERLAP = 100
+FINAL_REPORT_REDUCE_MAX_CHARS = 12000 # summaries are collapsed further until they fit in the final prompt
+
+## LLM Response Cache
+LLM_CACHE_DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'checkpoints', 'llm_cache.sqlite'))
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600 # cached responses older than a week are sent again
+LLM_CACHE_MAX_BYTES = 256 * 1024 ** 2 # least recently used responses are evicted beyond this size
+
+## Sandboxed Code Execution
+SANDBOX_CPU_SECONDS = 120 # CPU time the generated cleaning code may use
+SANDBOX_TIMEOUT_SECONDS = 300 # wall-clock limit of the sandbox process
+SANDBOX_MAX_RSS_BYTES = 4 * 1024 ** 3 # the sandbox process is killed beyond this resident memory
@@ -0,0 +1,119 @@
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+import src.langgraphagenticai.utils.constants as const
+
+MANIFEST_FILE_NAME = "ingest_manifest.json"
+
+
+def hash_file(file_obj, chunk_size: int = const.CSV_INGEST_BLOCK_SIZE) -> str:
+    """
+    Returns the SHA-256 hex digest of a binary file object, reading it in chunks.
+    The file position is reset to the start afterwards.
+    """
+    file_obj.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(chunk_size), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+def _convert_options(column_types=None) -> pacsv.ConvertOptions:
+    """
+    Returns CSV conversion options that read missing and boolean values as pandas.read_csv does,
+    including empty and "NA" strings in text columns.
+    """
+    return pacsv.ConvertOptions(column_types=column_types,
+                                null_values=const.CSV_NULL_VALUES,
+                                true_values=const.CSV_TRUE_VALUES,
+                                false_values=const.CSV_FALSE_VALUES,
+                                strings_can_be_null=True)
+
+
+def infer_schema(file_obj, sample_bytes: int = const.CSV_INGEST_SAMPLE_BYTES) -> pa.Schema:
+    """
+    Infers the column types from the first sample_bytes of the CSV file.
+    The sample is cut at the last complete line so no row is parsed half-way.
+    Date and time columns are kept as strings, as pandas.read_csv would,
+    so the cleaning step decides how to parse them.
+    """
+    file_obj.seek(0)
+    sample = file_obj.read(sample_bytes)
+    file_obj.seek(0)
+    if len(sample) == sample_bytes and b"\n" in sample:
+        sample = sample[:sample.rfind(b"\n") + 1]
+    schema = pacsv.read_csv(io.BytesIO(sample), convert_options=_convert_options()).schema
+    return pa.schema([pa.field(field.name, pa.string()) if pa.types.is_temporal(field.type) else field
+                      for field in schema])
+
+
+def _stream_csv_to_parquet(file_obj, parquet_path: str, schema: pa.Schema):
+    reader = pacsv.open_csv(file_obj,
+                            read_options=pacsv.ReadOptions(block_size=const.CSV_INGEST_BLOCK_SIZE),
+                            convert_options=_convert_options(schema))
+    with pq.ParquetWriter(parquet_path, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+
+
+def _read_manifest(target_dir: str) -> dict:
+    manifest_path = os.path.join(target_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def ingest_csv(file_obj, target_dir: str, file_name: str = "df.parquet") -> dict:
+    """
+    Converts an uploaded CSV file to Parquet once per distinct upload.
+
+    The CSV is streamed block by block through pyarrow's CSV reader into a Parquet writer,
+    using column types inferred from a sample of the file. If the same content
+    (by SHA-256) was already converted into target_dir, only the Parquet metadata is read.
+    A new upload replaces the Parquet file; the thread artifacts stored in target_dir are kept.
+
+    Args:
+        file_obj: Binary file object of the CSV file (e.g. a Streamlit UploadedFile)
+        target_dir (str): Directory that holds the converted Parquet file
+        file_name (str): Name of the Parquet file
+
+    Returns:
+        dict: {"file_path", "content_hash", "columns", "num_rows"}
+    """
+    file_path = os.path.join(target_dir, file_name)
+    content_hash = hash_file(file_obj)
+
+    manifest = _read_manifest(target_dir)
+    if manifest.get("content_hash") == content_hash and os.path.exists(file_path):
+        print(f"'{file_path}' is already converted from this upload. Skipping ingestion.")
+    else:
+        os.makedirs(target_dir, exist_ok=True)
+        tmp_path = file_path + ".tmp"
+        try:
+            _stream_csv_to_parquet(file_obj, tmp_path, infer_schema(file_obj))
+        except pa.ArrowInvalid as e:
+            # Types inferred from the sample did not hold for the whole file
+            print(f"Streaming CSV conversion failed ({e}). Falling back to pandas.")
+            file_obj.seek(0)
+            pd.read_csv(file_obj).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, file_path)
+
+        with open(os.path.join(target_dir, MANIFEST_FILE_NAME), "w", encoding="utf-8") as f:
+            json.dump({"content_hash": content_hash, "file_name": file_name}, f)
+
+    metadata = pq.read_metadata(file_path)
+    return {
+        "file_path": file_path,
+        "content_hash": content_hash,
+        "columns": metadata.schema.to_arrow_schema().names,
+        "num_rows": metadata.num_rows,
+    }
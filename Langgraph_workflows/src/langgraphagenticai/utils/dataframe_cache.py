@@ -0,0 +1,152 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.node_metrics import record_metric
+
+
+def _read_file(file_path: str) -> pd.DataFrame:
+    record_metric("bytes_read", os.path.getsize(file_path))
+    if file_path.endswith(".feather"):
+        return pd.read_feather(file_path)
+    return pd.read_parquet(file_path)
+
+
+def _write_file(df: pd.DataFrame, file_path: str):
+    if file_path.endswith(".feather"):
+        df.to_feather(file_path)
+    else:
+        df.to_parquet(file_path, index=False)
+
+
+def _get_mtime(file_path: str):
+    try:
+        return os.stat(file_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class DataFrameCache:
+    """
+    In-memory cache of the dataframes shared by the EDA graph nodes.
+
+    Entries are keyed by (thread_id, file path) and validated against the file mtime,
+    so a file replaced on disk (e.g. a new upload) is read again. Least recently used
+    entries are evicted once the cached frames exceed the memory budget.
+    Frames stored through the cache are persisted to disk in the background (write-behind).
+    Cached frames are shared between callers and must be treated as read-only.
+    """
+    def __init__(self, max_bytes: int = const.DATAFRAME_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # (thread_id, path) -> {"df", "mtime", "nbytes"}
+        self._pending_writes = {} # path -> Future of the background write
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataframe-cache-writer")
+
+    def load(self, file_path: str, thread_id: str = None) -> pd.DataFrame:
+        """
+        Returns the dataframe for file_path, reading it from disk only on a cache miss.
+        """
+        file_path = os.path.abspath(file_path)
+        key = (thread_id, file_path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            # mtime is None while the frame is still being written behind
+            if entry is not None and (entry["mtime"] is None or entry["mtime"] == _get_mtime(file_path)):
+                self._entries.move_to_end(key)
+                return entry["df"]
+            if entry is not None:
+                self._remove(key)
+
+        # Make sure a pending background write has landed before reading the file
+        self.flush(file_path)
+
+        mtime = _get_mtime(file_path)
+        df = _read_file(file_path)
+        self._add(key, df, mtime)
+        return df
+
+    def store(self, df: pd.DataFrame, file_path: str, thread_id: str = None):
+        """
+        Caches the dataframe for file_path and persists it to disk in the background.
+
+        Returns:
+            Future: Completes once the file has been written
+        """
+        file_path = os.path.abspath(file_path)
+        key = (thread_id, file_path)
+        self._add(key, df, None)
+
+        with self._lock:
+            future = self._writer.submit(self._persist, key, df, file_path)
+            self._pending_writes[file_path] = future
+        future.add_done_callback(lambda f: self._forget_write(file_path, f))
+        return future
+
+    def flush(self, file_path: str = None):
+        """
+        Waits for the pending background writes (of one file or of all files) to complete.
+        """
+        with self._lock:
+            if file_path is None:
+                futures = list(self._pending_writes.values())
+            else:
+                futures = [self._pending_writes.get(os.path.abspath(file_path))]
+        for future in futures:
+            if future is not None:
+                future.result()
+
+    def evict_thread(self, thread_id: str):
+        """
+        Drops every cached dataframe of the given thread_id.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == thread_id]:
+                self._remove(key)
+
+    def _persist(self, key: tuple, df: pd.DataFrame, file_path: str):
+        try:
+            _write_file(df, file_path)
+        except Exception as e:
+            print(f"Error persisting dataframe to '{file_path}': {e}")
+            with self._lock:
+                if key in self._entries and self._entries[key]["df"] is df:
+                    self._remove(key)
+            raise
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["df"] is df:
+                entry["mtime"] = _get_mtime(file_path)
+
+    def _forget_write(self, file_path: str, future):
+        with self._lock:
+            if self._pending_writes.get(file_path) is future:
+                del self._pending_writes[file_path]
+
+    def _add(self, key: tuple, df: pd.DataFrame, mtime):
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # Frames larger than the whole budget are not cached
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = {"df": df, "mtime": mtime, "nbytes": nbytes}
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry["nbytes"]
+
+
+# Process-wide cache shared by all graph nodes
+dataframe_cache = DataFrameCache()
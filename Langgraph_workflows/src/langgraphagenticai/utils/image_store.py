@@ -0,0 +1,129 @@
+import hashlib
+import os
+import re
+import time
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.encode_image_to_base64 import encode_image_to_base64
+
+# Reports reference stored images as ![title](image-store://<sha256>.png)
+IMAGE_REF_SCHEME = "image-store://"
+IMAGE_REF_PATTERN = re.compile(r"!\[([^\]]*)\]\(" + re.escape(IMAGE_REF_SCHEME) + r"([0-9a-f]{64})\.png\)")
+
+
+def image_path(image_id: str, store_dir: str = None) -> str:
+    """
+    Returns the file path of a stored image (in const.IMAGE_STORE_DIR unless store_dir is given).
+    """
+    return os.path.join(store_dir or const.IMAGE_STORE_DIR, f"{image_id}.png")
+
+
+def store_image(file_path: str, store_dir: str = None) -> str:
+    """
+    Copies a rendered chart into the content-addressed image store.
+    Identical charts are stored once; an image already in the store is not written again.
+
+    Args:
+        file_path (str): Path of the PNG file to store
+        store_dir (str): Directory of the image store (const.IMAGE_STORE_DIR by default)
+
+    Returns:
+        str: Image id (SHA-256 of the image content)
+    """
+    store_dir = store_dir or const.IMAGE_STORE_DIR
+    with open(file_path, "rb") as f:
+        content = f.read()
+    image_id = hashlib.sha256(content).hexdigest()
+
+    target_path = image_path(image_id, store_dir)
+    if os.path.exists(target_path):
+        # Mark the image as recently used, so prune_image_store keeps it until its report is checkpointed
+        os.utime(target_path)
+    else:
+        os.makedirs(store_dir, exist_ok=True)
+        tmp_path = f"{target_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, target_path)
+
+    return image_id
+
+
+def image_markdown(title: str, file_path: str) -> str:
+    """
+    Stores a chart and returns the Markdown image tag that references it.
+    """
+    return f"![{title}]({IMAGE_REF_SCHEME}{store_image(file_path)}.png)"
+
+
+def split_report_images(report: str) -> list:
+    """
+    Splits a report into its Markdown text and its stored image references, in order.
+
+    Returns:
+        list: Tuples ("text", markdown) or ("image", (title, image file path))
+    """
+    parts = []
+    position = 0
+    for match in IMAGE_REF_PATTERN.finditer(report or ""):
+        if match.start() > position:
+            parts.append(("text", report[position:match.start()]))
+        parts.append(("image", (match.group(1), image_path(match.group(2)))))
+        position = match.end()
+    if report and position < len(report):
+        parts.append(("text", report[position:]))
+    return parts
+
+
+def referenced_image_ids(reports) -> set:
+    """
+    Returns the ids of the stored images referenced by the given reports.
+    """
+    return {match.group(2) for report in reports if isinstance(report, str)
+            for match in IMAGE_REF_PATTERN.finditer(report)}
+
+
+def prune_image_store(referenced_ids: set, store_dir: str = None,
+                      min_age_seconds: float = const.IMAGE_STORE_MIN_AGE_SECONDS) -> int:
+    """
+    Deletes the stored images (and leftover temporary files) that no report references.
+    Files used in the last min_age_seconds are kept: a running node stores its charts
+    before its report is checkpointed.
+
+    Args:
+        referenced_ids (set): Ids of the images still referenced (see referenced_image_ids)
+        store_dir (str): Directory of the image store (const.IMAGE_STORE_DIR by default)
+        min_age_seconds (float): Minimum age of a deleted file
+
+    Returns:
+        int: Number of deleted files
+    """
+    store_dir = store_dir or const.IMAGE_STORE_DIR
+    if not os.path.isdir(store_dir):
+        return 0
+
+    deleted = 0
+    cutoff = time.time() - min_age_seconds
+    for entry in os.scandir(store_dir):
+        image_id = entry.name.split(".", 1)[0]
+        if not entry.is_file() or (entry.name.endswith(".png") and image_id in referenced_ids):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                deleted += 1
+        except FileNotFoundError:
+            pass # removed concurrently
+    return deleted
+
+
+def inline_images(report: str) -> str:
+    """
+    Replaces the stored image references of a report with base64 data URIs,
+    for exporting a self-contained Markdown file.
+    """
+    def _inline(match):
+        encoded_image = encode_image_to_base64(image_path(match.group(2)))
+        return f"![{match.group(1)}](data:image/png;base64,{encoded_image})"
+
+    return IMAGE_REF_PATTERN.sub(_inline, report)
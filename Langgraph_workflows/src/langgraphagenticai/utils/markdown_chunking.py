@@ -0,0 +1,39 @@
+import re
+
+from langchain.text_splitter import MarkdownHeaderTextSplitter, RecursiveCharacterTextSplitter
+
+import src.langgraphagenticai.utils.constants as const
+
+# Markdown images: inlined data URIs or references to the image store
+IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\((?:data:image/[^)]*|image-store://[^)]*)\)")
+
+HEADERS_TO_SPLIT_ON = [("#", "h1"), ("##", "h2"), ("###", "h3")]
+
+
+def strip_images(markdown: str) -> str:
+    """
+    Replaces embedded chart images with a short placeholder, so no image bytes are sent to the LLM.
+    """
+    return IMAGE_PATTERN.sub(lambda match: f"[Chart: {match.group(1)}]", markdown)
+
+
+def split_markdown(markdown: str,
+                   chunk_size: int = const.FINAL_REPORT_CHUNK_SIZE,
+                   chunk_overlap: int = const.FINAL_REPORT_CHUNK_OVERLAP) -> list:
+    """
+    Splits a Markdown report in memory into chunks that follow its sections.
+    Images are stripped first; sections longer than chunk_size are split further.
+
+    Args:
+        markdown (str): Markdown report
+        chunk_size (int): Maximum number of characters per chunk
+        chunk_overlap (int): Characters shared by consecutive chunks of a long section
+
+    Returns:
+        list: Text chunks, in report order
+    """
+    sections = MarkdownHeaderTextSplitter(headers_to_split_on=HEADERS_TO_SPLIT_ON,
+                                          strip_headers=False).split_text(strip_images(markdown))
+    chunks = RecursiveCharacterTextSplitter(chunk_size=chunk_size,
+                                            chunk_overlap=chunk_overlap).split_documents(sections)
+    return [chunk.page_content for chunk in chunks if chunk.page_content.strip()]
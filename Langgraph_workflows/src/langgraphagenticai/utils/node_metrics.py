@@ -0,0 +1,154 @@
+import functools
+import threading
+import time
+from contextvars import ContextVar
+
+import pandas as pd
+import psutil
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+import src.langgraphagenticai.utils.constants as const
+
+# Metrics of the node running in the current context. Context variables are copied
+# into the threads LangChain starts for llm.batch, so concurrent LLM calls and
+# dataframe reads of a node are attributed to that node.
+_current_metrics: ContextVar = ContextVar("eda_node_metrics", default=None)
+
+# Callback handler added to every LangChain run started while a node is running
+_usage_handler: ContextVar = ContextVar("eda_llm_usage_handler", default=None)
+register_configure_hook(_usage_handler, inheritable=True)
+
+
+def record_metric(name: str, value):
+    """
+    Adds value to a metric of the node running in the current context.
+    Does nothing outside of an instrumented node.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        with metrics["lock"]:
+            metrics["values"][name] = metrics["values"].get(name, 0) + value
+
+
+class LLMUsageCallback(BaseCallbackHandler):
+    """
+    Counts the LLM calls, response cache hits and prompt/completion tokens of the node running in the current context.
+    """
+    def on_llm_end(self, response, **kwargs):
+        prompt_tokens = 0
+        completion_tokens = 0
+        cache_hits = 0
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if message is not None and message.response_metadata.get("from_cache"):
+                    cache_hits += 1
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+
+        # Providers that do not fill usage_metadata report the usage in llm_output
+        if not prompt_tokens and not completion_tokens and response.llm_output:
+            token_usage = response.llm_output.get("token_usage") or {}
+            prompt_tokens = token_usage.get("prompt_tokens", 0)
+            completion_tokens = token_usage.get("completion_tokens", 0)
+
+        record_metric("llm_calls", 1)
+        record_metric("llm_cache_hits", cache_hits)
+        record_metric("prompt_tokens", prompt_tokens)
+        record_metric("completion_tokens", completion_tokens)
+
+
+class _PeakRSSSampler:
+    """
+    Samples the resident set size of the process (and of its chart rendering workers)
+    in a background thread and keeps the peak.
+    The RSS is process-wide: nodes of other threads running at the same time are included.
+    """
+    def __init__(self, interval: float = const.RSS_SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.peak = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+
+    def _sample(self):
+        rss = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                pass
+        self.peak = max(self.peak, rss)
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def instrument_node(node_name: str, run_func, model_name: str = None):
+    """
+    Wraps a node run function to record its metrics into state["node_metrics"][node_name]:
+    wall time, LLM calls and cache hits, prompt/completion tokens, bytes read from disk,
+    chart render time and peak RSS.
+
+    Args:
+        node_name (str): Name of the node in the graph
+        run_func: The node's run(state) function, returning the updated State
+        model_name (str): Name of the LLM used by the node, recorded with the metrics
+
+    Returns:
+        function: Instrumented run function
+    """
+    @functools.wraps(run_func)
+    def run(state):
+        metrics = {"lock": threading.Lock(), "values": {}}
+        metrics_token = _current_metrics.set(metrics)
+        handler_token = _usage_handler.set(LLMUsageCallback())
+        start = time.perf_counter()
+        try:
+            with _PeakRSSSampler() as sampler:
+                state = run_func(state)
+        finally:
+            _usage_handler.reset(handler_token)
+            _current_metrics.reset(metrics_token)
+
+        values = metrics["values"]
+        node_metrics = dict(state.get("node_metrics") or {})
+        node_metrics[node_name] = {
+            "thread_id": state.get("thread_id"),
+            "model": model_name,
+            "wall_time_seconds": round(time.perf_counter() - start, 3),
+            "llm_calls": values.get("llm_calls", 0),
+            "llm_cache_hits": values.get("llm_cache_hits", 0),
+            "prompt_tokens": values.get("prompt_tokens", 0),
+            "completion_tokens": values.get("completion_tokens", 0),
+            "bytes_read": values.get("bytes_read", 0),
+            "chart_render_seconds": round(values.get("chart_render_seconds", 0), 3),
+            "peak_rss_mb": round(sampler.peak / 1024 ** 2, 1),
+        }
+        state["node_metrics"] = node_metrics
+        return state
+
+    return run
+
+
+def metrics_to_frame(node_metrics: dict) -> pd.DataFrame:
+    """
+    Returns the node metrics of a State as a dataframe with one row per node, for display and CSV/JSON export.
+    """
+    if not node_metrics:
+        return pd.DataFrame()
+    return pd.DataFrame.from_dict(node_metrics, orient="index").rename_axis("node").reset_index()
@@ -0,0 +1,27 @@
+import functools
+
+from langgraph.config import get_stream_writer
+
+
+def emit_event(event: dict):
+    """
+    Sends a progress event (e.g. a finished report section) to the "custom" stream of the running graph.
+    Does nothing when called outside a graph run, or when the caller does not stream custom events.
+    """
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        return
+    writer(event)
+
+
+def report_progress(node_name: str, run_func):
+    """
+    Wraps a node run function to emit a node_start event before the node runs.
+    """
+    @functools.wraps(run_func)
+    def run(state):
+        emit_event({"type": "node_start", "node": node_name})
+        return run_func(state)
+
+    return run
@@ -0,0 +1,192 @@
+import math
+import numbers
+import re
+
+import numpy as np
+import pandas as pd
+
+import src.langgraphagenticai.utils.constants as const
+from src.langgraphagenticai.utils.concurrent_llm import invoke_llm_concurrently
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimates the number of tokens of a prompt section (about CHARS_PER_TOKEN characters per token).
+    """
+    return math.ceil(len(text) / const.CHARS_PER_TOKEN)
+
+
+def compact_value(value) -> str:
+    """
+    Encodes a table cell compactly: numbers rounded to PROMPT_SIGNIFICANT_DIGITS significant digits,
+    missing values as empty strings and long texts truncated.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return str(value)
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        return f"{float(value):.{const.PROMPT_SIGNIFICANT_DIGITS}g}"
+    text = str(value)
+    if len(text) > const.PROMPT_MAX_VALUE_CHARS:
+        text = text[:const.PROMPT_MAX_VALUE_CHARS - 3] + "..."
+    return text
+
+
+def compact_table(df: pd.DataFrame, index: bool = True) -> str:
+    """
+    Encodes a table as CSV with compact values, which costs far fewer tokens than a Markdown table.
+    """
+    return df.map(compact_value).to_csv(index=index, lineterminator="\n")
+
+
+def top_correlations(corr: pd.DataFrame, k: int = const.CORRELATION_TOP_K) -> pd.DataFrame:
+    """
+    Returns the k column pairs with the strongest correlation (by absolute value) of a correlation matrix.
+
+    Returns:
+        pd.DataFrame: Columns column_1, column_2 and correlation, strongest first
+    """
+    upper = corr.where(np.triu(np.ones(corr.shape, dtype=bool), k=1))
+    pairs = upper.stack().dropna().rename("correlation").rename_axis(["column_1", "column_2"]).reset_index()
+    order = pairs["correlation"].abs().sort_values(ascending=False).index
+    return pairs.loc[order].head(k).reset_index(drop=True)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cuts a text to about max_tokens tokens.
+    """
+    max_chars = max_tokens * const.CHARS_PER_TOKEN
+    return text if len(text) <= max_chars else text[:max(max_chars - 3, 0)] + "..."
+
+
+def split_data_dictionary(data_dictionary: str, columns) -> tuple:
+    """
+    Splits a data dictionary into its general lines and the lines describing each column
+    (the lines that mention the column name). A line mentioning several columns belongs to each of them.
+
+    Returns:
+        tuple: (general lines, {column: lines})
+    """
+    patterns = {column: re.compile(rf"(?<!\w){re.escape(str(column))}(?!\w)") for column in columns}
+    general, by_column = [], {column: [] for column in columns}
+    for line in (data_dictionary or "").splitlines():
+        if not line.strip():
+            continue
+        matched = [column for column, pattern in patterns.items() if pattern.search(line)]
+        if not matched:
+            general.append(line)
+        for column in matched:
+            by_column[column].append(line)
+    return general, by_column
+
+
+def compact_data_dictionary(general: list, by_column: dict, columns) -> str:
+    """
+    Returns the data dictionary of a column batch: the general lines and the lines of the batch's columns,
+    in their original order and without duplicates.
+    """
+    lines = list(general)
+    for column in columns:
+        lines.extend(line for line in by_column.get(column, []) if line not in lines)
+    return "\n".join(lines)
+
+
+def column_batches(table: pd.DataFrame, budget_tokens: int, extra_tokens: dict = None,
+                   min_columns: int = const.PROMPT_MIN_BATCH_COLUMNS) -> list:
+    """
+    Splits the rows of a per-column table (one row per dataset column) into batches whose
+    compact encoding fits in budget_tokens. A batch is never closed before it has min_columns columns,
+    so a large fixed part of the prompt cannot reduce the batches to single columns.
+
+    Args:
+        table (pd.DataFrame): One row per dataset column
+        budget_tokens (int): Token budget of each batch
+        extra_tokens (dict): Optional tokens added to the prompt by each column (e.g. its data dictionary lines)
+        min_columns (int): Minimum number of columns per batch
+
+    Returns:
+        list: Lists of row labels, in table order
+    """
+    extra_tokens = extra_tokens or {}
+    lines = compact_table(table).splitlines()
+    header_tokens = estimate_tokens(lines[0])
+    batches, batch, batch_tokens = [], [], header_tokens
+    for label, line in zip(table.index, lines[1:]):
+        line_tokens = estimate_tokens(line) + extra_tokens.get(label, 0)
+        if len(batch) >= min_columns and batch_tokens + line_tokens > budget_tokens:
+            batches.append(batch)
+            batch, batch_tokens = [], header_tokens
+        batch.append(label)
+        batch_tokens += line_tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def merge_reports(llm, reports: list, merge_prompt: str, budget_tokens: int = const.PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Merges reports into one, keeping every merge prompt within the token budget.
+    When all reports do not fit in one prompt, groups of reports that fit are merged concurrently,
+    and the merged reports are merged again until a single prompt holds them all.
+    Each group has at least two reports, so every round at least halves the number of reports.
+    """
+    separator = "\n\n---\n\n"
+    reserved_tokens = estimate_tokens(merge_prompt.format(reports=""))
+    while len(reports) > 1:
+        groups, group, group_tokens = [], [], reserved_tokens
+        for report in reports:
+            report_tokens = estimate_tokens(report + separator)
+            if len(group) >= 2 and group_tokens + report_tokens > budget_tokens:
+                groups.append(group)
+                group, group_tokens = [], reserved_tokens
+            group.append(report)
+            group_tokens += report_tokens
+        groups.append(group)
+        if len(groups) == 1:
+            response = llm.invoke(merge_prompt.format(reports=separator.join(reports)))
+            return response.content if response else "No content returned from LLM."
+        merged = iter(invoke_llm_concurrently(llm, [merge_prompt.format(reports=separator.join(group))
+                                                    for group in groups if len(group) > 1]))
+        reports = [group[0] if len(group) == 1 else next(merged) for group in groups]
+    return reports[0]
+
+
+def analyze_in_column_batches(llm, table: pd.DataFrame, build_prompt, merge_prompt: str, data_dictionary: str = "",
+                              budget_tokens: int = const.PROMPT_TOKEN_BUDGET) -> str:
+    """
+    Analyzes a per-column table within the prompt token budget.
+    A table that does not fit is split into column batches analyzed concurrently;
+    the batch reports are then merged into one report (see merge_reports).
+    Each batch prompt only carries the general lines of the data dictionary and the lines of its own columns.
+
+    Args:
+        llm: LangChain chat model used for the analysis
+        table (pd.DataFrame): One row per dataset column
+        build_prompt: Function returning the prompt for a compact table encoding, a batch label and a data dictionary
+        merge_prompt (str): Prompt merging the batch reports, with a {reports} placeholder
+        data_dictionary (str): Data dictionary of the dataset
+        budget_tokens (int): Token budget of each prompt
+
+    Returns:
+        str: Analysis report
+    """
+    general, by_column = split_data_dictionary(data_dictionary, table.index)
+    # The general part of the dictionary is sent with every batch; it may use at most a quarter of the budget
+    general = truncate_to_tokens("\n".join(general), budget_tokens // 4).splitlines()
+    extra_tokens = {column: estimate_tokens("\n".join(lines)) for column, lines in by_column.items()}
+
+    reserved_tokens = estimate_tokens(build_prompt("", "", "\n".join(general)))
+    batches = column_batches(table, max(budget_tokens - reserved_tokens, 1), extra_tokens)
+    prompts, start = [], 0
+    for batch in batches:
+        label = f"columns {start + 1}-{start + len(batch)} of {len(table)}" if len(batches) > 1 else "all columns"
+        prompts.append(build_prompt(compact_table(table.loc[batch]), label,
+                                    compact_data_dictionary(general, by_column, batch)))
+        start += len(batch)
+
+    reports = invoke_llm_concurrently(llm, prompts)
+    return merge_reports(llm, reports, merge_prompt, budget_tokens)
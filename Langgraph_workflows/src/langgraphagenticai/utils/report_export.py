@@ -0,0 +1,15 @@
+from src.langgraphagenticai.utils.image_store import inline_images
+
+
+def build_full_report(state: dict) -> str:
+    """
+    Assembles the downloadable full data analysis report (Markdown) from the State reports.
+    Stored chart images are inlined as base64 so the file is self-contained.
+    """
+    return inline_images(
+        "# Full Data Analysis Report\n\n"
+        f"{state.get('stats_summary_report')}\n\n"
+        f"{state.get('univariate_analysis_report')}\n\n"
+        f"{state.get('bivariate_analysis_report')}\n\n"
+        f"{state.get('final_report')}\n"
+    )
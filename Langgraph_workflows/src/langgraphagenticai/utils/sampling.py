@@ -0,0 +1,85 @@
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+import src.langgraphagenticai.utils.constants as const
+
+
+def sample_dataframe(df: pd.DataFrame, sample_rows: int = None, stratify_col: str = None) -> pd.DataFrame:
+    """
+    Returns a reproducible sample of about sample_rows rows of the dataframe.
+
+    When stratify_col is given, every stratum keeps its share of the rows: categories for a
+    low-cardinality column, quantile bins for a numeric column.
+    The full dataframe is returned when sample_rows is not set or not smaller than the dataframe.
+
+    Args:
+        df (pd.DataFrame): Input dataframe
+        sample_rows (int): Target number of sampled rows
+        stratify_col (str): Column to stratify the sample on, e.g. the target metric
+
+    Returns:
+        pd.DataFrame: Sampled dataframe
+    """
+    if not sample_rows or len(df) <= sample_rows:
+        return df
+
+    frac = sample_rows / len(df)
+    random_state = const.SAMPLE_RANDOM_STATE
+
+    if stratify_col is None or stratify_col not in df.columns:
+        return df.sample(n=sample_rows, random_state=random_state)
+
+    strata = df[stratify_col]
+    if is_numeric_dtype(strata) and strata.nunique() > const.SAMPLE_MAX_STRATA:
+        strata = pd.qcut(strata, q=const.SAMPLE_MAX_STRATA, duplicates='drop')
+    elif strata.nunique() > const.SAMPLE_MAX_STRATA:
+        # Too many categories to stratify on
+        return df.sample(n=sample_rows, random_state=random_state)
+
+    return (df.groupby(strata, observed=True, dropna=False, group_keys=False)
+              .sample(frac=frac, random_state=random_state))
+
+
+def sampling_label(sample_size: int, total_rows: int) -> str:
+    """
+    Returns the Markdown note that labels a report section computed on a sample.
+    """
+    if sample_size >= total_rows:
+        return ""
+    return (f"_Charts and statistics below are based on a sample of {sample_size:,} of "
+            f"{total_rows:,} rows ({sample_size / total_rows:.1%})._\n\n")
+
+
+def column_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Computes exact per-column aggregates of a dataframe already in memory, in one vectorized pass.
+
+    Args:
+        df (pd.DataFrame): Input dataframe (all rows)
+
+    Returns:
+        pd.DataFrame: One row per column with its type, count (non-missing), missing count,
+                      missing percentage, min and max (numeric, datetime and text columns)
+    """
+    missing = df.isna().sum()
+    result = pd.DataFrame({
+        "type": df.dtypes.astype(str),
+        "count": len(df) - missing,
+        "missing": missing,
+        "missing_pct": (missing / len(df) * 100).round(2) if len(df) else 0.0,
+    })
+
+    # Numeric and datetime columns in one pass; other columns (text, categories) one by one,
+    # skipping those without an order
+    ordered = df.select_dtypes(include=["number", "datetime", "datetimetz", "timedelta"])
+    minimum, maximum = ordered.min().to_dict(), ordered.max().to_dict()
+    for name in df.columns.difference(ordered.columns, sort=False):
+        values = df[name].dropna()
+        try:
+            if not values.empty:
+                minimum[name], maximum[name] = values.min(), values.max()
+        except (TypeError, ValueError):
+            continue
+    result["min"] = pd.Series(minimum, dtype=object)
+    result["max"] = pd.Series(maximum, dtype=object)
+    return result
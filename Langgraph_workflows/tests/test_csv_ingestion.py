@@ -0,0 +1,28 @@
+import io
+
+import pandas as pd
+
+from src.langgraphagenticai.utils.csv_ingestion import ingest_csv
+
+
+def test_missing_values_match_pandas(tmp_path):
+    content = b"a,b,c\n1,x,2020-01-01\n2,,2020-01-02\n,NA,\n"
+
+    result = ingest_csv(io.BytesIO(content), str(tmp_path))
+    ingested = pd.read_parquet(result["file_path"])
+    expected = pd.read_csv(io.BytesIO(content))
+
+    assert ingested.isna().sum().to_dict() == expected.isna().sum().to_dict()
+    assert ingested.isna().sum().to_dict() == {"a": 1, "b": 2, "c": 1}
+
+
+def test_boolean_values_match_pandas(tmp_path):
+    content = b"flag,other\nTrue,1\nfalse,0\n,1\n"
+
+    result = ingest_csv(io.BytesIO(content), str(tmp_path))
+    ingested = pd.read_parquet(result["file_path"])
+    expected = pd.read_csv(io.BytesIO(content))
+
+    assert ingested["flag"].tolist() == [True, False, None]
+    assert ingested["flag"].isna().sum() == expected["flag"].isna().sum()
+    assert ingested["other"].tolist() == expected["other"].tolist()